@@ -0,0 +1,10 @@
+"""benchmarks
+
+Timing scripts for scalarflow. Each module can be run on its own, for example:
+
+    python -m benchmarks.graph
+
+The suites in benchmarks.suites are run together, with results written as JSON:
+
+    python -m benchmarks --json results.json
+"""
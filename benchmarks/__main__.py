@@ -0,0 +1,88 @@
+"""Runs benchmark suites and reports the results as a table and as JSON.
+
+python -m benchmarks [suite ...] [--json results.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import List
+
+import scalarflow
+from benchmarks.suites import SUITES
+from benchmarks.utils import print_table
+
+
+def parse_arguments(arguments: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "suites", nargs="*", help=f"Suites to run, all by default: {', '.join(SUITES)}"
+    )
+    parser.add_argument("--json", help="Path to write results to, - for stdout")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per timing")
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10_000,
+        help="Calls per run of a micro benchmark",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--input-dim", type=int, default=4)
+    parser.add_argument("--width", type=int, default=8, help="Nodes per hidden layer")
+    parser.add_argument("--depth", type=int, default=1, help="Number of hidden layers")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument(
+        "--graph-batch-sizes", type=int, nargs="+", default=[1, 8, 32, 128, 512]
+    )
+    parser.add_argument("--num-examples", type=int, default=256)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--engine", default="graph", choices=scalarflow.models.ENGINES)
+
+    options = parser.parse_args(arguments)
+
+    for name in options.suites:
+        if name not in SUITES:
+            parser.error(f"unknown suite {name}, choose from {', '.join(SUITES)}")
+
+    return options
+
+
+def main(arguments: List[str] = None) -> dict:
+    options = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+    results = []
+
+    for name in options.suites or SUITES:
+        start = time.perf_counter()
+        results.extend({"suite": name, **result} for result in SUITES[name](options))
+        print(f"{name}: {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    report = {
+        "scalarflow": scalarflow.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": vars(options),
+        "results": results,
+    }
+
+    if options.json == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(
+            ("suite", "name", "time (us)"),
+            [
+                (result["suite"], result["name"], result["seconds"] * 1e6)
+                for result in results
+            ],
+        )
+
+        if options.json is not None:
+            with open(options.json, "w") as file:
+                json.dump(report, file, indent=2)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
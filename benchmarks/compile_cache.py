@@ -0,0 +1,52 @@
+"""Time to the first compiled training step, with a cold and a warm GraphCache.
+
+python -m benchmarks.compile_cache
+"""
+
+import random
+import tempfile
+import time
+
+from benchmarks.utils import make_mlp, make_regression_data, print_table
+from scalarflow.cache import GraphCache
+from scalarflow.compiler import clear_cache
+from scalarflow.losses import mean_squared_error
+from scalarflow.operators import relu
+
+BATCH_SIZE = 64
+INPUT_DIM = 8
+HIDDEN_DIM = 16
+
+
+def first_step(graph_cache: GraphCache, examples, labels) -> float:
+    # Compiled graphs are also cached in memory, which a new process would not have
+    clear_cache()
+    random.seed(0)
+    model = make_mlp(INPUT_DIM, HIDDEN_DIM, activation=relu)
+    model.compile(
+        loss_fn=mean_squared_error,
+        lr=0.01,
+        engine="compiled",
+        graph_cache=graph_cache,
+    )
+
+    start = time.perf_counter()
+    model.fit(examples, labels, epochs=1, batch_size=BATCH_SIZE)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    examples, labels = make_regression_data(BATCH_SIZE, INPUT_DIM)
+
+    with tempfile.TemporaryDirectory() as directory:
+        graph_cache = GraphCache(directory=directory)
+        rows = [
+            (name, first_step(graph_cache, examples, labels))
+            for name in ("cold", "warm")
+        ]
+
+    print_table(("cache", "time (s)"), rows)
+
+
+if __name__ == "__main__":
+    main()
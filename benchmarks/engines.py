@@ -0,0 +1,41 @@
+"""Time of one MLP.fit epoch for every engine.
+
+python -m benchmarks.engines
+"""
+
+from benchmarks.utils import best_of, make_mlp, make_regression_data, print_table
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import ENGINES
+from scalarflow.operators import relu
+
+NUM_EXAMPLES = 1024
+BATCH_SIZE = 256
+INPUT_DIM = 8
+HIDDEN_DIM = 16
+
+
+def main() -> None:
+    examples, labels = make_regression_data(NUM_EXAMPLES, INPUT_DIM)
+    rows = []
+
+    for engine in ENGINES:
+        model = make_mlp(INPUT_DIM, HIDDEN_DIM, activation=relu)
+        model.compile(loss_fn=mean_squared_error, lr=0.01, metrics=(), engine=engine)
+
+        epoch_time = best_of(
+            lambda: model.fit(
+                examples=examples,
+                labels=labels,
+                epochs=1,
+                batch_size=BATCH_SIZE,
+                callbacks=(),
+            ),
+            repeat=3,
+        )
+        rows.append((engine, epoch_time))
+
+    print_table(("engine", "epoch (s)"), rows)
+
+
+if __name__ == "__main__":
+    main()
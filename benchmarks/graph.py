@@ -0,0 +1,52 @@
+"""Step time of optimisation_step, and of a replayed Tape, against batch size.
+
+python -m benchmarks.graph
+"""
+
+from benchmarks.utils import best_of, make_mlp, make_regression_data, print_table
+from scalarflow.losses import mean_squared_error
+from scalarflow.operators import relu
+from scalarflow.tape import Tape
+from scalarflow.training import create_scalar_graph, optimisation_step
+
+BATCH_SIZES = (1, 8, 32, 128, 512, 2048)
+INPUT_DIM = 4
+HIDDEN_DIM = 8
+
+
+def build_loss(model, examples, labels):
+    predictions = [model(inputs=example) for example in examples]
+    return mean_squared_error(labels, predictions)
+
+
+def main() -> None:
+    model = make_mlp(INPUT_DIM, HIDDEN_DIM, activation=relu)
+    rows = []
+
+    for batch_size in BATCH_SIZES:
+        examples, labels = make_regression_data(batch_size, INPUT_DIM)
+        loss = build_loss(model, examples, labels)
+        graph_size = len(create_scalar_graph(loss))
+
+        sort_time = best_of(lambda: create_scalar_graph(loss))
+        step_time = best_of(
+            lambda: optimisation_step(root=loss, lr=0.0, retain_graph=True)
+        )
+
+        tape = Tape(
+            model=model,
+            loss_fn=mean_squared_error,
+            input_dim=INPUT_DIM,
+            batch_size=batch_size,
+        )
+        tape_time = best_of(lambda: tape.step(examples, labels, lr=0.0))
+
+        rows.append((batch_size, graph_size, sort_time, step_time, tape_time))
+
+    print_table(
+        ("batch_size", "graph_size", "sort (s)", "step (s)", "tape step (s)"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Time to import scalarflow and its heavier submodules, each in a new interpreter.
+
+python -m benchmarks.import_time
+"""
+
+import subprocess
+import sys
+
+from benchmarks.utils import print_table
+
+MODULES = (
+    "scalarflow",
+    "scalarflow.models",
+    "scalarflow.compiler",
+    "scalarflow.serving",
+)
+
+# Seconds `import scalarflow` may take, well above its usual time so slow
+# machines pass, but below the time of importing every submodule
+BUDGET = 0.1
+
+_STATEMENT = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module: str, repeat: int = 5) -> float:
+    """Returns the fastest of `repeat` imports of module in a new interpreter, in seconds."""
+
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", _STATEMENT.format(module=module)],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(0, repeat)
+    )
+
+
+def main() -> None:
+    rows = [(module, import_time(module) * 1000) for module in MODULES]
+    print_table(("module", "import (ms)"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Inference throughput of MLP.__call__, which builds a graph, and MLP.predict.
+
+python -m benchmarks.inference
+"""
+
+from benchmarks.utils import best_of, make_mlp, make_regression_data, print_table
+from scalarflow.operators import relu
+
+NUM_EXAMPLES = 1000
+INPUT_DIM = 8
+HIDDEN_DIM = 16
+
+
+def main() -> None:
+    model = make_mlp(INPUT_DIM, HIDDEN_DIM, activation=relu)
+    examples, _ = make_regression_data(NUM_EXAMPLES, INPUT_DIM)
+
+    call_time = best_of(lambda: [model(inputs=example) for example in examples])
+    predict_time = best_of(lambda: model.predict(examples=examples))
+
+    rows = [
+        ("__call__", NUM_EXAMPLES / call_time),
+        ("predict", NUM_EXAMPLES / predict_time),
+    ]
+
+    print_table(("inference", "examples/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
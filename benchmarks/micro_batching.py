@@ -0,0 +1,48 @@
+"""Peak memory and time of one epoch of MLP.fit against micro-batch size.
+
+python -m benchmarks.micro_batching
+"""
+
+import random
+import time
+import tracemalloc
+
+from benchmarks.utils import make_mlp, make_regression_data, print_table
+from scalarflow.losses import mean_squared_error
+from scalarflow.operators import relu
+
+BATCH_SIZE = 512
+MICRO_BATCH_SIZES = (None, 128, 32, 8)
+INPUT_DIM = 8
+HIDDEN_DIM = 16
+
+
+def main() -> None:
+    examples, labels = make_regression_data(BATCH_SIZE, INPUT_DIM)
+    rows = []
+
+    for micro_batch_size in MICRO_BATCH_SIZES:
+        random.seed(0)
+        model = make_mlp(INPUT_DIM, HIDDEN_DIM, activation=relu)
+        model.compile(loss_fn=mean_squared_error, lr=0.01)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        model.fit(
+            examples,
+            labels,
+            epochs=1,
+            batch_size=BATCH_SIZE,
+            micro_batch_size=micro_batch_size,
+        )
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rows.append((str(micro_batch_size), peak / 2**20, elapsed))
+
+    print_table(("micro_batch", "peak (MiB)", "time (s)"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Epochs needed to reach a target loss with every optimizer, on the problems
+of the example notebooks.
+
+    python -m benchmarks.optimizers
+"""
+
+import math
+import random
+
+from benchmarks.utils import print_table
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import sigmoid
+from scalarflow.optimizers import SGD, Adam, AdamW, RMSProp
+
+MAX_EPOCHS = 300
+
+OPTIMIZERS = {
+    "sgd": lambda: SGD(lr=0.01),
+    "sgd_momentum": lambda: SGD(lr=0.01, momentum=0.9),
+    "sgd_nesterov": lambda: SGD(lr=0.01, momentum=0.9, nesterov=True),
+    "adam": lambda: Adam(lr=0.05),
+    "adamw": lambda: AdamW(lr=0.05),
+    "rmsprop": lambda: RMSProp(lr=0.01),
+}
+
+
+def linear_regression():
+    rng = random.Random(0)
+    examples = [(rng.random(), rng.random()) for _ in range(0, 100)]
+    labels = [3 * x1 - 2 * x2 + 7 + rng.random() / 10 for x1, x2 in examples]
+    layers = (Dense(output_dim=2, input_dim=2), Dense(output_dim=1, input_dim=2))
+    return examples, labels, layers, 0.01
+
+
+def logistic_regression():
+    rng = random.Random(0)
+    examples = [(rng.random(), rng.random()) for _ in range(0, 100)]
+    labels = [
+        float(4 * math.sin(x1) - 2 * math.cos(x2) - 1.5 > -1) for x1, x2 in examples
+    ]
+    layers = (
+        Dense(output_dim=2, input_dim=2),
+        Dense(output_dim=1, input_dim=2, activation=sigmoid),
+    )
+    return examples, labels, layers, 0.1
+
+
+PROBLEMS = {
+    "linear_regression": linear_regression,
+    "logistic_regression": logistic_regression,
+}
+
+
+def epochs_to_target(problem, optimizer) -> int:
+    random.seed(0)
+    examples, labels, layers, target = problem()
+
+    model = MLP(layers=layers)
+    model.compile(
+        loss_fn=mean_squared_error, optimizer=optimizer, metrics=(), engine="tape"
+    )
+
+    for epoch in range(0, MAX_EPOCHS):
+        history = model.fit(
+            examples=examples, labels=labels, epochs=1, batch_size=4, callbacks=()
+        )
+
+        if history["loss"][-1] < target:
+            return epoch + 1
+
+    return MAX_EPOCHS
+
+
+def main() -> None:
+    rows = []
+
+    for problem_name, problem in PROBLEMS.items():
+        for optimizer_name, optimizer in OPTIMIZERS.items():
+            rows.append(
+                (problem_name, optimizer_name, epochs_to_target(problem, optimizer()))
+            )
+
+    print(f"Epochs to target loss, at most {MAX_EPOCHS}")
+    print_table(("problem", "optimizer", "epochs"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Scaling of MLP.fit with the number of worker processes.
+
+python -m benchmarks.parallel
+"""
+
+import time
+
+from benchmarks.utils import make_mlp, make_regression_data, print_table
+from scalarflow.losses import mean_squared_error
+from scalarflow.operators import relu
+
+WORKERS = (1, 2, 4, 8)
+NUM_EXAMPLES = 2048
+BATCH_SIZE = 512
+INPUT_DIM = 8
+HIDDEN_DIM = 32
+EPOCHS = 2
+
+
+def main() -> None:
+    examples, labels = make_regression_data(NUM_EXAMPLES, INPUT_DIM)
+    rows = []
+
+    for workers in WORKERS:
+        model = make_mlp(INPUT_DIM, HIDDEN_DIM, activation=relu)
+        model.compile(loss_fn=mean_squared_error, lr=0.01, metrics=())
+
+        start = time.perf_counter()
+        model.fit(
+            examples=examples,
+            labels=labels,
+            epochs=EPOCHS,
+            batch_size=BATCH_SIZE,
+            callbacks=(),
+            workers=workers,
+        )
+        elapsed = time.perf_counter() - start
+
+        if workers == 1:
+            serial = elapsed
+
+        rows.append((workers, elapsed / EPOCHS, serial / elapsed))
+
+    print_table(("workers", "epoch (s)", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
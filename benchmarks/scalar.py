@@ -0,0 +1,76 @@
+"""Construction cost, memory and forward/backward throughput of Scalars and Operators.
+
+python -m benchmarks.scalar
+"""
+
+import tracemalloc
+
+from benchmarks.utils import best_of, print_table
+from scalarflow.core.operator import Add, Multiply
+from scalarflow.core.scalar import Scalar
+
+NUM_OBJECTS = 100_000
+
+
+def per_object(fn) -> float:
+    """Returns the construction time of one object in nanoseconds."""
+
+    def construct():
+        for _ in range(0, NUM_OBJECTS):
+            fn()
+
+    return best_of(construct) / NUM_OBJECTS * 1e9
+
+
+def bytes_per_object(fn) -> float:
+    """Returns the memory allocated for one object, and anything it creates, in bytes."""
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [fn() for _ in range(0, NUM_OBJECTS)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (end - start - 8 * len(objects)) / NUM_OBJECTS
+
+
+def ops_per_second(method) -> float:
+    def run():
+        for _ in range(0, NUM_OBJECTS):
+            method()
+
+    return NUM_OBJECTS / best_of(run)
+
+
+def main() -> None:
+    rows = [
+        ("Scalar(data)", per_object(lambda: Scalar(data=1.0))),
+        ("Scalar()", per_object(lambda: Scalar())),
+        ("Add()", per_object(lambda: Add())),
+        ("Add()(1, 2)", per_object(lambda: Add()(arguments=(1.0, 2.0)))),
+    ]
+
+    print_table(("construct", "time (ns)"), rows)
+    print()
+
+    rows = [
+        ("Scalar(data)", bytes_per_object(lambda: Scalar(data=1.0))),
+        ("Add()(a, b)", bytes_per_object(lambda: Add()(arguments=(1.0, 2.0)))),
+    ]
+
+    print_table(("memory", "bytes"), rows)
+    print()
+
+    multiply = Multiply()
+    multiply(arguments=(Scalar(data=2.0), Scalar(data=3.0)))
+
+    rows = [
+        ("forward", ops_per_second(multiply.forward)),
+        ("backward", ops_per_second(multiply.backward)),
+    ]
+
+    print_table(("Multiply", "ops/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Benchmark suites, registered by name and run by python -m benchmarks.
+
+Every suite takes the parsed command line options and returns a list of
+results. A result is a dictionary with the name of what was timed, the
+fastest time of one run in seconds, and the parameters of the run.
+"""
+
+import random
+from argparse import Namespace
+from typing import Callable, Dict, List
+
+from benchmarks.utils import (
+    best_of,
+    make_classification_data,
+    make_mlp,
+    make_regression_data,
+)
+from scalarflow.core.operator import (
+    Add,
+    Divide,
+    Dot,
+    Linear,
+    Multiply,
+    Operator,
+    Power,
+    ReLU,
+    Sigmoid,
+    SigmoidBinaryCrossEntropy,
+    SoftmaxCrossEntropy,
+    Subtract,
+    Sum,
+)
+from scalarflow.core.scalar import Scalar
+from scalarflow.losses import binary_crossentropy_from_logits, mean_squared_error
+from scalarflow.operators import relu
+from scalarflow.training import create_scalar_graph, optimisation_step
+
+SUITES: Dict[str, Callable[[Namespace], List[dict]]] = {}
+
+# Operators and the values of their arguments
+OPERATORS = (
+    (Add, (1.5, 2.5)),
+    (Subtract, (1.5, 2.5)),
+    (Multiply, (1.5, 2.5)),
+    (Divide, (1.5, 2.5)),
+    (lambda: Power(power=2), (1.5,)),
+    (ReLU, (1.5,)),
+    (Sigmoid, (1.5,)),
+    (lambda: Sum(num_arguments=8), (0.5,) * 8),
+    (lambda: Dot(size=8), (0.5,) * 16),
+    (lambda: Linear(size=8), (0.5,) * 17),
+    (SigmoidBinaryCrossEntropy, (1.5, 1.0)),
+    (lambda: SoftmaxCrossEntropy(num_classes=4), (0.1, 0.2, 0.3, 0.4, 2)),
+)
+
+
+def suite(fn: Callable[[Namespace], List[dict]]) -> Callable:
+    SUITES[fn.__name__] = fn
+    return fn
+
+
+def per_call(fn: Callable, options: Namespace) -> float:
+    """Returns the fastest time of one call of fn, in seconds."""
+
+    def run():
+        for _ in range(0, options.iterations):
+            fn()
+
+    return best_of(run, repeat=options.repeat) / options.iterations
+
+
+@suite
+def scalar(options: Namespace) -> List[dict]:
+    return [
+        {
+            "name": "Scalar(data)",
+            "seconds": per_call(lambda: Scalar(data=1.0), options),
+        },
+        {"name": "Scalar()", "seconds": per_call(Scalar, options)},
+    ]
+
+
+@suite
+def operators(options: Namespace) -> List[dict]:
+    results = []
+
+    for make_operator, arguments in OPERATORS:
+        operator: Operator = make_operator()
+        result = operator(arguments=arguments)
+        result._gradient = 1.0
+
+        for method in ("forward", "backward"):
+            results.append(
+                {
+                    "name": f"{type(operator).__name__}.{method}",
+                    "seconds": per_call(getattr(operator, method), options),
+                    "num_arguments": operator.num_arguments,
+                }
+            )
+
+    return results
+
+
+def build_loss(options: Namespace, batch_size: int) -> Scalar:
+    random.seed(options.seed)
+    model = make_mlp(
+        options.input_dim, options.width, activation=relu, depth=options.depth
+    )
+    examples, labels = make_regression_data(
+        batch_size, options.input_dim, seed=options.seed
+    )
+    predictions = [model(inputs=example) for example in examples]
+
+    return mean_squared_error(labels, predictions)
+
+
+@suite
+def graph(options: Namespace) -> List[dict]:
+    results = []
+
+    for batch_size in options.graph_batch_sizes:
+        loss = build_loss(options, batch_size)
+        results.append(
+            {
+                "name": "create_scalar_graph",
+                "seconds": best_of(
+                    lambda: create_scalar_graph(root=loss), repeat=options.repeat
+                ),
+                "batch_size": batch_size,
+                "graph_size": len(create_scalar_graph(root=loss)),
+            }
+        )
+
+    return results
+
+
+@suite
+def step(options: Namespace) -> List[dict]:
+    loss = build_loss(options, options.batch_size)
+
+    return [
+        {
+            "name": "optimisation_step",
+            "seconds": best_of(
+                lambda: optimisation_step(root=loss, lr=0.0, retain_graph=True),
+                repeat=options.repeat,
+            ),
+            "batch_size": options.batch_size,
+            "graph_size": len(create_scalar_graph(root=loss)),
+        }
+    ]
+
+
+@suite
+def fit(options: Namespace) -> List[dict]:
+    results = []
+    tasks = (
+        ("regression", make_regression_data, mean_squared_error),
+        ("classification", make_classification_data, binary_crossentropy_from_logits),
+    )
+
+    for task, make_data, loss_fn in tasks:
+        examples, labels = make_data(
+            options.num_examples, options.input_dim, seed=options.seed
+        )
+
+        def run():
+            random.seed(options.seed)
+            model = make_mlp(
+                options.input_dim, options.width, activation=relu, depth=options.depth
+            )
+            model.compile(loss_fn=loss_fn, lr=0.01, engine=options.engine)
+            model.fit(
+                examples, labels, epochs=options.epochs, batch_size=options.batch_size
+            )
+
+        results.append(
+            {
+                "name": f"MLP.fit ({task})",
+                "seconds": best_of(run, repeat=options.repeat),
+                "engine": options.engine,
+                "num_examples": options.num_examples,
+                "epochs": options.epochs,
+                "batch_size": options.batch_size,
+                "width": options.width,
+                "depth": options.depth,
+            }
+        )
+
+    return results
@@ -0,0 +1,65 @@
+import random
+import time
+from typing import Callable, List, Tuple
+
+from scalarflow.layers import Dense
+from scalarflow.models import MLP
+
+
+def best_of(fn: Callable, repeat: int = 5) -> float:
+    """Returns the fastest of `repeat` runs of fn, in seconds."""
+
+    timings = []
+
+    for _ in range(0, repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def make_mlp(
+    input_dim: int, hidden_dim: int, activation: Callable = None, depth: int = 1
+) -> MLP:
+    """Returns an MLP with depth hidden layers of hidden_dim nodes and one output."""
+
+    layers = [Dense(output_dim=hidden_dim, input_dim=input_dim, activation=activation)]
+    layers += [
+        Dense(output_dim=hidden_dim, input_dim=hidden_dim, activation=activation)
+        for _ in range(1, depth)
+    ]
+    layers.append(Dense(output_dim=1, input_dim=hidden_dim))
+
+    return MLP(layers=tuple(layers))
+
+
+def make_regression_data(
+    num_examples: int, input_dim: int, seed: int = 0
+) -> Tuple[List[Tuple[float]], List[float]]:
+    rng = random.Random(seed)
+    examples = [
+        tuple(rng.uniform(-1, 1) for _ in range(0, input_dim))
+        for _ in range(0, num_examples)
+    ]
+    labels = [sum(example) for example in examples]
+    return examples, labels
+
+
+def make_classification_data(
+    num_examples: int, input_dim: int, seed: int = 0
+) -> Tuple[List[Tuple[float]], List[float]]:
+    examples, sums = make_regression_data(num_examples, input_dim, seed=seed)
+    return examples, [float(total > 0) for total in sums]
+
+
+def print_table(header: Tuple[str], rows: List[Tuple]) -> None:
+    print(" | ".join(f"{column:>14}" for column in header))
+
+    for row in rows:
+        print(
+            " | ".join(
+                f"{value:>14.6f}" if isinstance(value, float) else f"{value:>14}"
+                for value in row
+            )
+        )
@@ -1,18 +1,74 @@
 """scalarflow
 
 A Machine Learning library written in pure Python for educational purpose.
+
+Submodules are imported on first access (PEP 562), so `import scalarflow`
+is cheap, and only the parts a program uses are loaded.
 """
 
-from scalarflow import core, layers, losses, metrics, models, node, operators, training
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.1"
 __all__ = [
     "operators",
+    "cache",
+    "callbacks",
+    "compiler",
     "core",
+    "data",
     "layers",
     "losses",
     "models",
     "node",
+    "optimizers",
+    "parallel",
+    "passes",
+    "profiler",
+    "schedules",
+    "serialization",
+    "serving",
+    "tape",
     "training",
     "metrics",
 ]
+
+# Submodules resolved on first access, numpy_engine is left out of __all__
+# because it needs the optional numpy dependency
+_SUBMODULES = frozenset(__all__) | {"numpy_engine", "types"}
+
+if TYPE_CHECKING:
+    from scalarflow import (
+        cache,
+        callbacks,
+        compiler,
+        core,
+        data,
+        layers,
+        losses,
+        metrics,
+        models,
+        node,
+        operators,
+        optimizers,
+        parallel,
+        passes,
+        profiler,
+        schedules,
+        serialization,
+        serving,
+        tape,
+        training,
+    )
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        # importing sets the attribute on the package, so this runs once per name
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
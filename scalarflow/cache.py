@@ -0,0 +1,326 @@
+import hashlib
+import importlib.util
+import json
+import marshal
+import mmap
+import os
+import struct
+import types
+from types import CodeType
+from typing import Callable, Optional, Tuple
+
+from scalarflow import __version__
+from scalarflow.layers import Dense
+from scalarflow.serialization import _layer_config
+
+MAGIC = b"SFGC"
+FORMAT_VERSION = 1
+
+# Magic, format version and length of the JSON header in bytes
+_PREAMBLE = struct.Struct("<4sII")
+
+_SUFFIX = ".sfgc"
+
+
+def default_directory() -> str:
+    "$SCALARFLOW_CACHE_DIR, or scalarflow under the user's cache directory"
+
+    if "SCALARFLOW_CACHE_DIR" in os.environ:
+        return os.environ["SCALARFLOW_CACHE_DIR"]
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "scalarflow")
+
+
+class _Undescribable(Exception):
+    pass
+
+
+def _global_names(code: CodeType) -> set:
+    names = set(code.co_names)
+
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            names |= _global_names(constant)
+
+    return names
+
+
+def _describe(value, seen: set):
+    """JSON-serialisable description of a value a loss function depends on.
+
+    Functions are described by their bytecode, constants, defaults, closure
+    and the globals they read, recursively, so editing a function, or a
+    function it calls, changes its description.
+
+    Raises:
+        _Undescribable if a value has no stable description, like an object
+        whose repr is its address.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        return [_describe(item, seen) for item in value]
+    if isinstance(value, frozenset):
+        return [_describe(item, seen) for item in sorted(value, key=repr)]
+    if isinstance(value, types.ModuleType):
+        return value.__name__
+    if isinstance(value, (type, types.BuiltinFunctionType)):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, CodeType):
+        return {
+            "code": value.co_code.hex(),
+            "consts": [_describe(constant, seen) for constant in value.co_consts],
+            "names": list(value.co_names),
+        }
+    if isinstance(value, types.FunctionType):
+        name = f"{value.__module__}.{value.__qualname__}"
+
+        if id(value) in seen:
+            return name
+
+        seen.add(id(value))
+        namespace = value.__globals__
+
+        return {
+            "name": name,
+            "code": _describe(value.__code__, seen),
+            "defaults": _describe(value.__defaults__, seen),
+            "kwdefaults": _describe(sorted((value.__kwdefaults__ or {}).items()), seen),
+            "closure": [
+                _describe(cell.cell_contents, seen) for cell in value.__closure__ or ()
+            ],
+            "globals": dict(
+                (global_name, _describe_global(namespace[global_name], seen))
+                for global_name in sorted(_global_names(value.__code__))
+                if global_name in namespace
+            ),
+        }
+
+    raise _Undescribable(value)
+
+
+def _describe_global(value, seen: set):
+    # Module-level state, like the thread-local of no_grad, is not part of
+    # what a function computes, so it is described by its type alone
+    try:
+        return _describe(value, seen)
+    except _Undescribable:
+        return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def architecture_key(
+    layers: Tuple[Dense], loss_fn: Callable, batch_size: int, optimise: bool = False
+) -> Optional[str]:
+    """Content hash of everything the source of a compiled graph depends on.
+
+    That is the shapes and activations of the layers, the loss function, the
+    batch size, whether the graph was optimised, and the scalarflow version.
+    The loss function is described by its code and everything it reads, not
+    only its name, so two losses named the same, like `loss` of two scripts,
+    do not share entries. Parameter values are read at run time, so they
+    are not part of the key.
+
+    Returns:
+        Hex digest, or None if the architecture cannot be named reliably,
+        because an activation is not registered in
+        scalarflow.layers.ACTIVATIONS, the loss function is a lambda or a
+        local function, or it depends on values without a stable description
+    """
+
+    qualname = getattr(loss_fn, "__qualname__", "<unknown>")
+
+    if "<" in qualname:
+        return None
+
+    try:
+        configs = [_layer_config(layer) for layer in layers]
+        loss = _describe(loss_fn, seen=set())
+    except (ValueError, _Undescribable):
+        return None
+
+    description = json.dumps(
+        {
+            "version": __version__,
+            "format_version": FORMAT_VERSION,
+            "layers": configs,
+            "loss_fn": loss,
+            "batch_size": batch_size,
+            "optimise": optimise,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+class GraphCache:
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """Stores compiled graphs on disk, so new processes skip tracing, code
+        generation and compiling the generated source to bytecode.
+
+        Every entry is a file named after its key, holding a preamble, a JSON
+        header, the source and its marshalled code object. Entries are
+        memory-mapped when read, and ignored and removed if they were written
+        by another scalarflow or Python version or are corrupt. Reading an
+        entry marks it as recently used, and once the entries exceed
+        max_bytes the least recently used ones are evicted.
+
+        Args:
+            directory: Directory of the entries, created when first written,
+                defaults to default_directory()
+            max_bytes: Total size of entries kept on disk
+        """
+
+        self._directory = directory if directory is not None else default_directory()
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"GraphCache(directory={self._directory!r}, max_bytes={self._max_bytes})"
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[Tuple[str, CodeType]]:
+        "Returns the source and code object stored under key, or None"
+
+        path = self._path(key)
+        entry = None
+
+        try:
+            entry = self._read(path, key)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, EOFError, TypeError, AttributeError, struct.error):
+            self._remove(path)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry
+
+    @staticmethod
+    def _header(key: str, source_length: int) -> dict:
+        return {
+            "version": __version__,
+            "python": importlib.util.MAGIC_NUMBER.hex(),
+            "key": key,
+            "source_length": source_length,
+        }
+
+    def _read(self, path: str, key: str) -> Tuple[str, CodeType]:
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            magic, version, header_length = _PREAMBLE.unpack_from(mapped)
+
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a graph cache entry")
+
+            start = _PREAMBLE.size + header_length
+            header = json.loads(mapped[_PREAMBLE.size : start])
+
+            if header != self._header(key, header.get("source_length")):
+                raise ValueError(
+                    f"{path} was written by another scalarflow or Python version"
+                )
+
+            end = start + header["source_length"]
+            return mapped[start:end].decode("utf-8"), marshal.loads(mapped[end:])
+
+    def put(self, key: str, source: str, code: CodeType) -> None:
+        "Stores source and its code object under key, then evicts the least recently used entries"
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        encoded = source.encode("utf-8")
+        header = json.dumps(self._header(key, len(encoded))).encode("utf-8")
+        path = self._path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            file.write(header)
+            file.write(encoded)
+            file.write(marshal.dumps(code))
+
+        os.replace(temporary_path, path)
+        self._evict(keep=path)
+
+    def _entries(self) -> list:
+        entries = []
+
+        for name in os.listdir(self._directory):
+            if not name.endswith(_SUFFIX):
+                continue
+
+            path = os.path.join(self._directory, name)
+
+            try:
+                status = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            entries.append((status.st_mtime, status.st_size, path))
+
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+
+            if path != keep:
+                self._remove(path)
+                total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def size(self) -> int:
+        "Total size in bytes of the entries on disk"
+
+        if not os.path.isdir(self._directory):
+            return 0
+
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self) -> None:
+        if not os.path.isdir(self._directory):
+            return
+
+        for _, _, path in self._entries():
+            self._remove(path)
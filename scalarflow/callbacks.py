@@ -1,11 +1,37 @@
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from scalarflow.models import MLP
+
+
+def _is_improvement(
+    value: float, best: Optional[float], mode: str, min_delta: float = 0.0
+) -> bool:
+    "Whether value improves on best by more than min_delta, in the direction of mode"
+
+    if best is None:
+        return True
+    if mode == "min":
+        return value < best - min_delta
+    return value > best + min_delta
+
+
 class Callback:
     def __init__(self, name: str) -> None:
         self._name = name
+        self._model: Optional["MLP"] = None
+
+    def set_model(self, model: "MLP") -> None:
+        "Called by fit with the model being trained, before training starts"
+
+        self._model = model
 
     def on_training_start(self):
         return
 
     def on_training_end(self, epoch: int, metrics: dict):
+        "Called once training ends, also when an exception interrupted it"
+
         return
 
     def on_epoch_start(self, epoch: int):
@@ -35,3 +61,208 @@ class ConsoleLogger(Callback):
 
     def on_training_end(self, epoch: int, metrics: dict):
         self.log(epoch=epoch, metrics=metrics)
+
+
+class ModelCheckpoint(Callback):
+    def __init__(
+        self,
+        path: str,
+        every_n_epochs: int = 1,
+        monitor: Optional[str] = None,
+        mode: str = "min",
+    ) -> None:
+        """Saves the model during training.
+
+        Args:
+            path: Path to save the model to, can contain format fields for
+                the epoch and metrics, like "model-{epoch}-{loss:.3f}.sf"
+            every_n_epochs: Number of epochs between checks
+            monitor: Name of a metric, when set the model is only saved if
+                the metric improved on the best value so far
+            mode: Either "min" or "max", whether the monitored metric
+                improves when it decreases or increases
+        """
+
+        super().__init__(name="model_checkpoint")
+
+        assert mode in ("min", "max"), "mode must be either 'min' or 'max'"
+
+        self._path = path
+        self._every_n_epochs = every_n_epochs
+        self._monitor = monitor
+        self._mode = mode
+        self._best: Optional[float] = None
+
+    @property
+    def best(self) -> Optional[float]:
+        return self._best
+
+    def on_epoch_end(self, epoch: int, metrics: dict):
+        if (epoch + 1) % self._every_n_epochs != 0:
+            return
+
+        if self._monitor is not None:
+            # Metrics like val_loss are missing on epochs without validation
+            value = metrics.get(self._monitor)
+
+            if value is None or not _is_improvement(value, self._best, self._mode):
+                return
+
+            self._best = value
+
+        self._model.save(self._path.format(epoch=epoch, **metrics))
+
+
+class EarlyStopping(Callback):
+    def __init__(
+        self,
+        monitor: str = "loss",
+        min_delta: float = 0.0,
+        patience: int = 0,
+        mode: str = "min",
+        restore_best_weights: bool = False,
+    ) -> None:
+        """Stops training once a monitored metric stops improving.
+
+        Args:
+            monitor: Name of the metric to monitor
+            min_delta: Smallest change of the metric that counts as an
+                improvement
+            patience: Number of epochs without improvement after which
+                training is stopped
+            mode: Either "min" or "max", whether the monitored metric
+                improves when it decreases or increases
+            restore_best_weights: Set to restore the parameters of the
+                epoch with the best value of the metric when training ends
+        """
+
+        super().__init__(name="early_stopping")
+
+        assert mode in ("min", "max"), "mode must be either 'min' or 'max'"
+
+        self._monitor = monitor
+        self._min_delta = abs(min_delta)
+        self._patience = patience
+        self._mode = mode
+        self._restore_best_weights = restore_best_weights
+        self.on_training_start()
+
+    @property
+    def best(self) -> Optional[float]:
+        return self._best
+
+    @property
+    def stopped_epoch(self) -> Optional[int]:
+        return self._stopped_epoch
+
+    def on_training_start(self):
+        self._best: Optional[float] = None
+        self._best_weights: Optional[bytes] = None
+        self._wait = 0
+        self._stopped_epoch: Optional[int] = None
+
+    def on_epoch_end(self, epoch: int, metrics: dict):
+        value = metrics.get(self._monitor)
+
+        if value is None:
+            return
+
+        if _is_improvement(value, self._best, self._mode, self._min_delta):
+            self._best = value
+            self._wait = 0
+
+            if self._restore_best_weights:
+                self._best_weights = self._model.buffer.snapshot()
+            return
+
+        self._wait += 1
+
+        if self._wait >= self._patience:
+            self._stopped_epoch = epoch
+            self._model.stop_training = True
+
+    def on_training_end(self, epoch: int, metrics: dict):
+        if self._best_weights is not None:
+            self._model.buffer.restore(self._best_weights)
+
+
+class ReduceLROnPlateau(Callback):
+    def __init__(
+        self,
+        monitor: str = "loss",
+        factor: float = 0.1,
+        patience: int = 10,
+        min_delta: float = 1e-4,
+        mode: str = "min",
+        cooldown: int = 0,
+        min_lr: float = 0.0,
+    ) -> None:
+        """Multiplies the learning rate by factor once a monitored metric stops improving.
+
+        The reduced learning rate replaces any schedule of the optimizer.
+
+        Args:
+            monitor: Name of the metric to monitor
+            factor: Factor the learning rate is multiplied by
+            patience: Number of epochs without improvement after which the
+                learning rate is reduced
+            min_delta: Smallest change of the metric that counts as an
+                improvement
+            mode: Either "min" or "max", whether the monitored metric
+                improves when it decreases or increases
+            cooldown: Number of epochs to wait after a reduction before
+                counting epochs without improvement again
+            min_lr: Lower bound of the learning rate
+        """
+
+        super().__init__(name="reduce_lr_on_plateau")
+
+        assert 0.0 < factor < 1.0, "factor must be between 0 and 1"
+        assert mode in ("min", "max"), "mode must be either 'min' or 'max'"
+
+        self._monitor = monitor
+        self._factor = factor
+        self._patience = patience
+        self._min_delta = abs(min_delta)
+        self._mode = mode
+        self._cooldown = cooldown
+        self._min_lr = min_lr
+        self.on_training_start()
+
+    def on_training_start(self):
+        self._best: Optional[float] = None
+        self._wait = 0
+        self._cooldown_counter = 0
+
+    def on_epoch_end(self, epoch: int, metrics: dict):
+        value = metrics.get(self._monitor)
+
+        if value is None:
+            return
+
+        # Cooldown counts every epoch, and its epochs do not count towards patience
+        in_cooldown = self._cooldown_counter > 0
+
+        if in_cooldown:
+            self._cooldown_counter -= 1
+            self._wait = 0
+
+        if _is_improvement(value, self._best, self._mode, self._min_delta):
+            self._best = value
+            self._wait = 0
+            return
+
+        if in_cooldown:
+            return
+
+        self._wait += 1
+
+        if self._wait >= self._patience:
+            optimizer = self._model.optimizer
+            lr = max(optimizer.lr * self._factor, self._min_lr)
+
+            if lr < optimizer.lr:
+                optimizer.lr = lr
+
+            self._cooldown_counter = self._cooldown
+            self._wait = 0
@@ -0,0 +1,242 @@
+import hashlib
+import math
+from collections import OrderedDict
+from types import CodeType
+from typing import Callable, List, Optional, Tuple
+
+from scalarflow.core.operator import Sigmoid, SoftmaxCrossEntropy
+from scalarflow.core.parameter import Parameter, ParameterBuffer
+from scalarflow.core.scalar import Scalar
+from scalarflow.tape import Tape
+from scalarflow.types import ScalarLike
+
+# Names that generated source can refer to, besides builtins
+NAMESPACE = {
+    "exp": math.exp,
+    "log1p": math.log1p,
+    "sigmoid": Sigmoid.sigmoid,
+    "log_sum_exp": SoftmaxCrossEntropy.log_sum_exp,
+}
+
+# Number of compiled graphs kept in memory, least recently used first out
+CACHE_SIZE = 32
+
+# Compiled graphs by the hash of their source, in order of last use
+_CACHE: "OrderedDict[str, CompiledGraph]" = OrderedDict()
+
+
+def _literal(value: float) -> str:
+    return repr(value) if math.isfinite(value) else f"float('{value}')"
+
+
+def generate_source(tape: Tape) -> str:
+    """Generates the source of straight-line forward and gradients functions of a Tape.
+
+    Every Scalar of the tape becomes a local float variable: parameters are
+    read from the values of the ParameterBuffer by index, inputs and labels
+    from flat lists, other leaves are inlined as constants, and each
+    Operator contributes the expressions of its forward_source and
+    backward_source. Gradients are only computed for Scalars that depend on
+    a parameter.
+
+    The generated functions are:
+        forward(p, x, y) -> (loss, predictions)
+        gradients(p, g, x, y) -> (loss, predictions), that also writes the
+            gradient of every parameter of the graph into g
+
+    Raises:
+        ValueError if the graph has trainable Scalars that are not
+        Parameters.
+        NotImplementedError if the graph has an Operator without source.
+    """
+
+    slots = tape._slots
+    slot_index = dict((id(scalar), index) for index, scalar in enumerate(slots))
+    names = [f"s{index}" for index in range(0, len(slots))]
+
+    leaves = {}
+
+    for position, slot in enumerate(tape._input_slots):
+        if slot is not None:
+            leaves[slot] = f"x[{position}]"
+
+    for position, slot in enumerate(tape._label_slots):
+        if slot is not None:
+            leaves[slot] = f"y[{position}]"
+
+    parameters = []
+
+    for index, scalar in enumerate(slots):
+        if scalar._operator is not None or index in leaves:
+            continue
+
+        if isinstance(scalar, Parameter):
+            leaves[index] = f"p[{scalar.index}]"
+            parameters.append((index, scalar.index))
+        elif scalar._trainable:
+            raise ValueError(
+                "Only trainable Scalars in a ParameterBuffer can be compiled"
+            )
+        else:
+            leaves[index] = _literal(scalar._data)
+
+    # Instructions run in execution order, so an operator needs gradients as
+    # soon as one of its arguments does
+    requires_gradient = set(index for index, _ in parameters)
+    steps = []
+
+    for operator in tape._instructions:
+        arguments = tuple(slot_index[id(argument)] for argument in operator._arguments)
+        result = slot_index[id(operator.result)]
+        steps.append((operator, arguments, result))
+
+        if any(argument in requires_gradient for argument in arguments):
+            requires_gradient.add(result)
+
+    loads = [f"{names[index]} = {value}" for index, value in sorted(leaves.items())]
+    forward = [
+        f"{names[result]} = {operator.forward_source(tuple(names[index] for index in arguments))}"
+        for operator, arguments, result in steps
+    ]
+
+    loss = names[slot_index[id(tape.loss)]]
+    predictions = "".join(f"{names[slot]}, " for slot in tape._prediction_slots)
+    returns = f"return {loss}, ({predictions})"
+
+    backward = [f"d{index} = 0.0" for index in sorted(requires_gradient)]
+    root = slot_index[id(tape.loss)]
+
+    if root in requires_gradient:
+        backward.append(f"d{root} = 1.0")
+
+    for operator, arguments, result in reversed(steps):
+        if result not in requires_gradient:
+            continue
+
+        backward += operator.backward_source(
+            names[result],
+            f"d{result}",
+            tuple(names[index] for index in arguments),
+            tuple(
+                f"d{index}" if index in requires_gradient else None
+                for index in arguments
+            ),
+        )
+
+    writes = [f"g[{buffer_index}] = d{index}" for index, buffer_index in parameters]
+
+    def function(signature: str, body: List[str]) -> str:
+        return f"def {signature}:\n" + "".join(f"    {line}\n" for line in body)
+
+    return (
+        function("forward(p, x, y)", loads + forward + [returns])
+        + "\n\n"
+        + function(
+            "gradients(p, g, x, y)", loads + forward + backward + writes + [returns]
+        )
+    )
+
+
+def compile_code(source: str) -> CodeType:
+    return compile(source, "<scalarflow.compiler>", "exec")
+
+
+class CompiledGraph:
+    def __init__(self, source: str, code: Optional[CodeType] = None) -> None:
+        """Forward and gradients functions compiled from generated source.
+
+        Args:
+            source: Source generated by generate_source
+            code: Code object of source, compiled if not given
+        """
+
+        if code is None:
+            code = compile_code(source)
+
+        namespace = dict(NAMESPACE)
+        exec(code, namespace)
+
+        self._source = source
+        self._code = code
+        self._forward: Callable = namespace["forward"]
+        self._gradients: Callable = namespace["gradients"]
+
+    def __repr__(self) -> str:
+        return f"CompiledGraph(lines={self._source.count(chr(10))})"
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    @property
+    def code(self) -> CodeType:
+        return self._code
+
+    @staticmethod
+    def _flatten(
+        examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike]
+    ) -> Tuple[List[float], List[float]]:
+        make_float = Scalar.make_float
+        return (
+            [make_float(value) for example in examples for value in example],
+            [make_float(label) for label in labels],
+        )
+
+    def forward(
+        self,
+        buffer: ParameterBuffer,
+        examples: Tuple[Tuple[ScalarLike]],
+        labels: Tuple[ScalarLike],
+    ) -> Tuple[float, Tuple[float]]:
+        "Returns the loss and predictions of a batch"
+
+        return self._forward(buffer.data, *self._flatten(examples, labels))
+
+    def gradients(
+        self,
+        buffer: ParameterBuffer,
+        examples: Tuple[Tuple[ScalarLike]],
+        labels: Tuple[ScalarLike],
+    ) -> Tuple[float, Tuple[float]]:
+        """Writes the gradients of a batch into buffer, and returns the loss and predictions.
+
+        Gradients of parameters that are not part of the graph are zero.
+        """
+
+        buffer.zero_gradients()
+        return self._gradients(
+            buffer.data, buffer.gradients, *self._flatten(examples, labels)
+        )
+
+
+def compile_tape(tape: Tape) -> CompiledGraph:
+    """Compiles a Tape into straight-line Python functions.
+
+    The CACHE_SIZE most recently used compiled graphs are cached by a hash
+    of their source, which only depends on the topology of the graph, the
+    buffer indices of its parameters and its constants, so tapes of models
+    with the same layers share one CompiledGraph.
+    """
+
+    return compile_source(generate_source(tape))
+
+
+def compile_source(source: str, code: Optional[CodeType] = None) -> CompiledGraph:
+    "Returns the CompiledGraph of source generated by generate_source, from the cache if possible"
+
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key]
+
+    compiled_graph = _CACHE[key] = CompiledGraph(source, code=code)
+
+    while len(_CACHE) > CACHE_SIZE:
+        _CACHE.popitem(last=False)
+
+    return compiled_graph
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
@@ -1,4 +1,5 @@
 import uuid
+from typing import Optional
 
 
 class SetPropertyNotAllowedError(Exception):
@@ -12,18 +13,26 @@ class SetPropertyNotAllowedError(Exception):
 
 
 class Identifiable:
+    __slots__ = ("_uuid",)
+
     def __init__(self) -> None:
         """Base class to be extended for any classes that need identifiable instances.
         That is, every instance of this and derived classes will have a uuid
         property which can be used as a unique id
+
+        The uuid is generated the first time it is read, since most Scalars
+        and Operators created during training are never looked up by id.
         """
 
-        self._uuid = str(uuid.uuid4())
+        self._uuid: Optional[str] = None
 
     @property
     def uuid(self) -> str:
         "Returns the unique id of this Identifiable object as a string"
 
+        if self._uuid is None:
+            self._uuid = str(uuid.uuid4())
+
         return self._uuid
 
     @uuid.setter
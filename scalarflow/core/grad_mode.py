@@ -0,0 +1,28 @@
+import threading
+from contextlib import contextmanager
+
+_state = threading.local()
+
+
+def is_grad_enabled() -> bool:
+    "Returns False inside a no_grad block of the current thread"
+
+    return getattr(_state, "enabled", True)
+
+
+@contextmanager
+def no_grad():
+    """Context manager to compute without recording a graph.
+
+    Inside the block, the convenience functions in scalarflow.operators return
+    plain floats instead of creating Operators and Scalars, so nothing can be
+    backpropagated but inference is much cheaper. The setting is per thread.
+    """
+
+    previous = is_grad_enabled()
+    _state.enabled = False
+
+    try:
+        yield
+    finally:
+        _state.enabled = previous
@@ -1,11 +1,14 @@
 import math
-from typing import Optional, Tuple
+import weakref
+from typing import List, Optional, Tuple
 
 from scalarflow.core.common import Identifiable, SetPropertyNotAllowedError
 from scalarflow.core.scalar import Scalar
 
 
 class Operator(Identifiable):
+    __slots__ = ("_name", "_num_arguments", "_arguments", "_result")
+
     def __init__(self, name: str, num_arguments: int) -> None:
         """Operator does some sort of computation on given Scalar arguments.
 
@@ -23,21 +26,24 @@ class Operator(Identifiable):
         self._num_arguments = num_arguments
 
         self._arguments: Optional[Tuple[Scalar]] = None
-        self._result: Optional[Scalar] = None
+        # The result references this operator, so the operator only keeps a
+        # weak reference back to it, and graphs are freed by reference counting
+        self._result: Optional[weakref.ref] = None
 
     def __repr__(self) -> str:
         return f"Operator(name={self._name}, num_arguments={self._num_arguments})"
 
     def __call__(self, arguments: Tuple[Scalar | int | float]) -> Scalar:
         assert (
-            len(arguments) == self.num_arguments
-        ), f"Expected number of arguments: {self.num_arguments}, but given {len(arguments)}"
+            len(arguments) == self._num_arguments
+        ), f"Expected number of arguments: {self._num_arguments}, but given {len(arguments)}"
 
         self._arguments = tuple(
             [Scalar.make_scalar(argument) for argument in arguments]
         )
-        self._result = Scalar(data=self.forward(), operator=self)
-        return self._result
+        result = Scalar(data=self.forward(), operator=self)
+        self._result = weakref.ref(result)
+        return result
 
     @property
     def name(self) -> str:
@@ -65,117 +71,546 @@ class Operator(Identifiable):
 
     @property
     def result(self) -> Optional[Scalar]:
-        return self._result
+        "Scalar this Operator computed, None if it was not called yet"
+
+        return None if self._result is None else self._output()
+
+    def _output(self) -> Scalar:
+        result = self._result()
+
+        if result is None:
+            raise RuntimeError(
+                f"The result of Operator '{self._name}' was garbage collected, "
+                "keep a reference to the output of the graph to backpropagate through it"
+            )
+        return result
 
     @result.setter
     def result(self, *_) -> None:
         raise SetPropertyNotAllowedError("result")
 
+    @staticmethod
+    def compute(*values: float) -> float:
+        """Computes the result for plain float arguments, used without a graph."""
+
+        raise NotImplementedError("The method 'compute' is not yet implemented")
+
     def forward(self) -> float:
         raise NotImplementedError("The method 'forward' is not yet implemented")
 
     def backward(self) -> None:
         raise NotImplementedError("The method 'backward' is not yet implemented")
 
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        """Python expression of forward, used by scalarflow.compiler.
+
+        Args:
+            arguments: Variable names of the values of the arguments
+        """
+
+        raise NotImplementedError(
+            f"The operator '{self._name}' can not be compiled to source"
+        )
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        """Python statements of backward, used by scalarflow.compiler.
+
+        Args:
+            result: Variable name of the value of the result
+            gradient: Variable name of the gradient of the result
+            arguments: Variable names of the values of the arguments
+            gradients: Variable names of the gradients of the arguments, None
+                for arguments that need no gradient
+
+        Returns:
+            Statements that add to the gradients of the arguments
+        """
+
+        raise NotImplementedError(
+            f"The operator '{self._name}' can not be compiled to source"
+        )
+
+    @staticmethod
+    def accumulate_source(
+        gradients: Tuple[str], index: int, expression: str
+    ) -> List[str]:
+        "Statement that adds expression to the gradient of an argument, if it needs one"
+
+        if gradients[index] is None:
+            return []
+        return [f"{gradients[index]} += {expression}"]
+
 
 class Add(Operator):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(name="add", num_arguments=2)
 
+    @staticmethod
+    def compute(a: float, b: float) -> float:
+        return a + b
+
     def forward(self) -> float:
-        return self.arguments[0].data + self.arguments[1].data
+        a, b = self._arguments
+        return self.compute(a._data, b._data)
 
     def backward(self) -> None:
-        self.arguments[0].gradient += self.result.gradient
-        self.arguments[1].gradient += self.result.gradient
+        a, b = self._arguments
+        gradient = self._output()._gradient
+        a._gradient += gradient
+        b._gradient += gradient
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"{arguments[0]} + {arguments[1]}"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return self.accumulate_source(gradients, 0, gradient) + self.accumulate_source(
+            gradients, 1, gradient
+        )
 
 
 class Subtract(Operator):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(name="subtract", num_arguments=2)
 
+    @staticmethod
+    def compute(a: float, b: float) -> float:
+        return a - b
+
     def forward(self) -> float:
-        return self.arguments[0].data - self.arguments[1].data
+        a, b = self._arguments
+        return self.compute(a._data, b._data)
 
     def backward(self) -> None:
-        self.arguments[0].gradient += self.result.gradient
-        self.arguments[1].gradient += self.result.gradient * -1
+        a, b = self._arguments
+        gradient = self._output()._gradient
+        a._gradient += gradient
+        b._gradient += gradient * -1
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"{arguments[0]} - {arguments[1]}"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return self.accumulate_source(gradients, 0, gradient) + self.accumulate_source(
+            gradients, 1, f"{gradient} * -1"
+        )
 
 
 class Multiply(Operator):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(name="multiply", num_arguments=2)
 
+    @staticmethod
+    def compute(a: float, b: float) -> float:
+        return a * b
+
     def forward(self) -> float:
-        return self.arguments[0].data * self.arguments[1].data
+        a, b = self._arguments
+        return self.compute(a._data, b._data)
 
     def backward(self) -> None:
-        self.arguments[0].gradient += self.result.gradient * self.arguments[1].data
-        self.arguments[1].gradient += self.result.gradient * self.arguments[0].data
+        a, b = self._arguments
+        gradient = self._output()._gradient
+        a._gradient += gradient * b._data
+        b._gradient += gradient * a._data
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"{arguments[0]} * {arguments[1]}"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        a, b = arguments
+        return self.accumulate_source(
+            gradients, 0, f"{gradient} * {b}"
+        ) + self.accumulate_source(gradients, 1, f"{gradient} * {a}")
+
+
+class Sum(Operator):
+    __slots__ = ()
+
+    def __init__(self, num_arguments: int) -> None:
+        """Sum of any number of Scalars, in a single node."""
+
+        super().__init__(name="sum", num_arguments=num_arguments)
+
+    @staticmethod
+    def compute(*values: float) -> float:
+        return sum(values)
+
+    def forward(self) -> float:
+        return sum([argument._data for argument in self._arguments])
+
+    def backward(self) -> None:
+        gradient = self._output()._gradient
+
+        for argument in self._arguments:
+            argument._gradient += gradient
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return " + ".join(arguments)
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return [
+            statement
+            for index in range(0, len(arguments))
+            for statement in self.accumulate_source(gradients, index, gradient)
+        ]
+
+
+class Dot(Operator):
+    __slots__ = ("_size",)
+
+    def __init__(self, size: int) -> None:
+        """Dot product of two vectors of Scalars, in a single node.
+
+        The arguments are the `size` Scalars of the first vector followed by
+        the `size` Scalars of the second vector.
+        """
+
+        super().__init__(name="dot", num_arguments=2 * size)
+
+        self._size = size
+
+    @staticmethod
+    def compute(*values: float) -> float:
+        size = len(values) // 2
+        return sum([a * b for a, b in zip(values[:size], values[size:])])
+
+    def forward(self) -> float:
+        arguments = self._arguments
+        size = self._size
+        return sum(
+            [
+                a._data * b._data
+                for a, b in zip(arguments[:size], arguments[size : 2 * size])
+            ]
+        )
+
+    def backward(self) -> None:
+        arguments = self._arguments
+        size = self._size
+        gradient = self._output()._gradient
+
+        for a, b in zip(arguments[:size], arguments[size : 2 * size]):
+            a._gradient += gradient * b._data
+            b._gradient += gradient * a._data
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        size = self._size
+        return " + ".join(
+            [f"{a} * {b}" for a, b in zip(arguments[:size], arguments[size : 2 * size])]
+        )
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        size = self._size
+        statements = []
+
+        for index in range(0, size):
+            a, b = arguments[index], arguments[size + index]
+            statements += self.accumulate_source(gradients, index, f"{gradient} * {b}")
+            statements += self.accumulate_source(
+                gradients, size + index, f"{gradient} * {a}"
+            )
+
+        return statements
+
+
+class Linear(Dot):
+    __slots__ = ()
+
+    def __init__(self, size: int) -> None:
+        """Dot product of weights and inputs plus a bias, in a single node.
+
+        The arguments are the `size` weights, followed by the `size` inputs
+        and then the bias.
+        """
+
+        Operator.__init__(self, name="linear", num_arguments=2 * size + 1)
+
+        self._size = size
+
+    @staticmethod
+    def compute(*values: float) -> float:
+        return Dot.compute(*values[:-1]) + values[-1]
+
+    def forward(self) -> float:
+        return super().forward() + self._arguments[-1]._data
+
+    def backward(self) -> None:
+        super().backward()
+
+        self._arguments[-1]._gradient += self._output()._gradient
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"({super().forward_source(arguments)}) + {arguments[-1]}"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return super().backward_source(
+            result, gradient, arguments, gradients
+        ) + self.accumulate_source(gradients, len(arguments) - 1, gradient)
 
 
 class Divide(Operator):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(name="divide", num_arguments=2)
 
+    @staticmethod
+    def compute(a: float, b: float) -> float:
+        assert b != 0, "Can not divide by zero"
+        return a / b
+
     def forward(self) -> float:
-        assert self.arguments[1].data != 0, "Can not divide by zero"
-        return self.arguments[0].data / self.arguments[1].data
+        a, b = self._arguments
+        return self.compute(a._data, b._data)
 
     def backward(self) -> None:
-        self.arguments[0].gradient += self.result.gradient * (
-            self.arguments[1].data ** -1
-        )
-        self.arguments[1].gradient += self.result.gradient * (
-            -1 * self.arguments[0].data * (self.arguments[1].data ** -2)
+        a, b = self._arguments
+        gradient = self._output()._gradient
+        a._gradient += gradient * (b._data**-1)
+        b._gradient += gradient * (-1 * a._data * (b._data**-2))
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"{arguments[0]} / {arguments[1]}"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        a, b = arguments
+        return self.accumulate_source(
+            gradients, 0, f"{gradient} * ({b} ** -1)"
+        ) + self.accumulate_source(
+            gradients, 1, f"{gradient} * (-1 * {a} * ({b} ** -2))"
         )
 
 
 class Power(Operator):
+    __slots__ = ("_power",)
+
     def __init__(self, power: int) -> None:
         super().__init__(name=f"power_{power}", num_arguments=1)
 
         self._power = power
 
+    @staticmethod
+    def compute(a: float, power: int) -> float:
+        return a**power
+
     def forward(self) -> float:
-        return self.arguments[0].data ** self._power
+        return self.compute(self._arguments[0]._data, self._power)
 
     def backward(self) -> None:
-        self.arguments[0].gradient += (
-            self.result.gradient
-            * self._power
-            * self.arguments[0].data ** (self._power - 1)
+        a = self._arguments[0]
+        a._gradient += (
+            self._output()._gradient * self._power * a._data ** (self._power - 1)
+        )
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"{arguments[0]} ** {self._power!r}"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return self.accumulate_source(
+            gradients,
+            0,
+            f"{gradient} * {self._power!r} * {arguments[0]} ** ({self._power!r} - 1)",
         )
 
 
 class ReLU(Operator):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(name="relu", num_arguments=1)
 
+    @staticmethod
+    def compute(a: float) -> float:
+        return max(a, 0.0)
+
     def forward(self) -> float:
-        return max(self.arguments[0].data, 0.0)
+        return self.compute(self._arguments[0]._data)
 
     def backward(self) -> None:
-        self.arguments[0].gradient += float(self.result.data > 0) * self.result.gradient
+        result = self._output()
+        self._arguments[0]._gradient += float(result._data > 0) * result._gradient
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"max({arguments[0]}, 0.0)"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return self.accumulate_source(gradients, 0, f"float({result} > 0) * {gradient}")
 
 
 class Sigmoid(Operator):
-    def __init__(self, epsilon: float = 1e-7) -> None:
-        super().__init__(name="sigmoid", num_arguments=1)
+    __slots__ = ()
+
+    def __init__(self, epsilon: Optional[float] = None) -> None:
+        """Logistic function of its argument.
 
-        self._epsilon = epsilon
+        Args:
+            epsilon: Ignored, kept so that code passing it keeps working. The
+                gradient is computed from the cached result, which no longer
+                divides by 1 - sigmoid(x), so it needs no epsilon
+        """
+
+        super().__init__(name="sigmoid", num_arguments=1)
 
     @staticmethod
     def sigmoid(x: float) -> float:
-        return 1 / (1 + math.e ** (-x))
+        # Only ever exponentiate a non-positive number, so that large
+        # negative inputs do not overflow
+        if x >= 0:
+            return 1 / (1 + math.exp(-x))
+
+        z = math.exp(x)
+        return z / (1 + z)
+
+    compute = sigmoid
 
     def forward(self) -> float:
-        return self.sigmoid(self.arguments[0].data)
+        return self.compute(self._arguments[0]._data)
 
     def backward(self) -> None:
-        x = self.arguments[0].data
-        self.arguments[0].gradient += (
-            self.result.gradient
-            * self.sigmoid(x)
-            / (1 - self.sigmoid(x) + self._epsilon)
+        # d sigmoid(x) / dx = sigmoid(x) * (1 - sigmoid(x))
+        result = self._output()
+        y = result._data
+        self._arguments[0]._gradient += result._gradient * y * (1 - y)
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        return f"sigmoid({arguments[0]})"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        return self.accumulate_source(
+            gradients, 0, f"{gradient} * {result} * (1 - {result})"
         )
+
+
+class SigmoidBinaryCrossEntropy(Operator):
+    __slots__ = ("_probability",)
+
+    def __init__(self) -> None:
+        """Sigmoid followed by binary cross-entropy, in a single node.
+
+        The arguments are a logit and a label. The loss is computed directly
+        from the logit, which is stable for large logits, and the sigmoid of
+        the logit is cached in forward for the backward pass.
+        """
+
+        super().__init__(name="sigmoid_binary_crossentropy", num_arguments=2)
+
+        self._probability: Optional[float] = None
+
+    @staticmethod
+    def compute(logit: float, label: float) -> float:
+        # -y * log(sigmoid(z)) - (1 - y) * log(1 - sigmoid(z)) rewritten as
+        # max(z, 0) - z * y + log(1 + exp(-|z|))
+        return max(logit, 0.0) - logit * label + math.log1p(math.exp(-abs(logit)))
+
+    def forward(self) -> float:
+        logit, label = self._arguments
+        self._probability = Sigmoid.sigmoid(logit._data)
+        return self.compute(logit._data, label._data)
+
+    def backward(self) -> None:
+        logit, label = self._arguments
+        gradient = self._output()._gradient
+        logit._gradient += gradient * (self._probability - label._data)
+        label._gradient += gradient * -logit._data
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        logit, label = arguments
+        return f"max({logit}, 0.0) - {logit} * {label} + log1p(exp(-abs({logit})))"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        logit, label = arguments
+        return self.accumulate_source(
+            gradients, 0, f"{gradient} * (sigmoid({logit}) - {label})"
+        ) + self.accumulate_source(gradients, 1, f"{gradient} * -{logit}")
+
+
+class SoftmaxCrossEntropy(Operator):
+    __slots__ = ("_probabilities",)
+
+    def __init__(self, num_classes: int) -> None:
+        """Softmax followed by cross-entropy, in a single node.
+
+        The arguments are `num_classes` logits followed by the index of the
+        true class. The softmax probabilities are cached in forward for the
+        backward pass. No gradient flows to the class index.
+        """
+
+        super().__init__(name="softmax_crossentropy", num_arguments=num_classes + 1)
+
+        self._probabilities: Optional[Tuple[float]] = None
+
+    @staticmethod
+    def log_sum_exp(logits: Tuple[float]) -> float:
+        largest = max(logits)
+        return largest + math.log(sum([math.exp(z - largest) for z in logits]))
+
+    @staticmethod
+    def compute(*values: float) -> float:
+        logits, label = values[:-1], int(values[-1])
+        return SoftmaxCrossEntropy.log_sum_exp(logits) - logits[label]
+
+    def forward(self) -> float:
+        logits = [argument._data for argument in self._arguments[:-1]]
+        label = int(self._arguments[-1]._data)
+        log_sum_exp = self.log_sum_exp(logits)
+
+        self._probabilities = tuple([math.exp(z - log_sum_exp) for z in logits])
+        return log_sum_exp - logits[label]
+
+    def backward(self) -> None:
+        label = int(self._arguments[-1]._data)
+        gradient = self._output()._gradient
+
+        for index, (logit, probability) in enumerate(
+            zip(self._arguments[:-1], self._probabilities)
+        ):
+            logit._gradient += gradient * (probability - float(index == label))
+
+    def forward_source(self, arguments: Tuple[str]) -> str:
+        logits, label = arguments[:-1], arguments[-1]
+        return f"log_sum_exp(({', '.join(logits)},)) - ({', '.join(logits)},)[int({label})]"
+
+    def backward_source(
+        self, result: str, gradient: str, arguments: Tuple[str], gradients: Tuple[str]
+    ) -> List[str]:
+        logits, label = arguments[:-1], arguments[-1]
+        statements = [f"{result}_lse = log_sum_exp(({', '.join(logits)},))"]
+
+        for index, logit in enumerate(logits):
+            statements += self.accumulate_source(
+                gradients,
+                index,
+                f"{gradient} * (exp({logit} - {result}_lse) - float({index} == int({label})))",
+            )
+
+        return statements
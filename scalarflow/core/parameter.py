@@ -0,0 +1,116 @@
+from array import array
+
+from scalarflow.core.common import Identifiable
+from scalarflow.core.scalar import Scalar
+
+
+class ParameterBuffer:
+    def __init__(self) -> None:
+        """Contiguous storage for the values and gradients of a model's parameters.
+
+        Parameters are allocated one after the other and are Scalars that read
+        and write their value and gradient at their index in this buffer, so
+        zeroing gradients, updates and copying all weights in or out of a model
+        are single operations on two arrays of doubles.
+
+        Once a buffer is shared with another object through the buffer
+        protocol (for example a NumPy view) no more parameters can be
+        allocated.
+        """
+
+        self._data = array("d")
+        self._gradients = array("d")
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"ParameterBuffer(size={len(self._data)})"
+
+    @property
+    def data(self) -> array:
+        return self._data
+
+    @property
+    def gradients(self) -> array:
+        return self._gradients
+
+    def allocate(self, value: float) -> "Parameter":
+        """Appends a parameter with the given value and returns it."""
+
+        self._data.append(value)
+        self._gradients.append(0.0)
+
+        return Parameter(buffer=self, index=len(self._data) - 1)
+
+    def zero_gradients(self) -> None:
+        memoryview(self._gradients).cast("B")[:] = bytes(8 * len(self._gradients))
+
+    def sgd(self, lr: float) -> None:
+        "Applies a gradient descent update to all parameters"
+
+        self._data[:] = array(
+            "d", [x - lr * gradient for x, gradient in zip(self._data, self._gradients)]
+        )
+
+    def snapshot(self) -> bytes:
+        "Returns a copy of all parameter values"
+
+        return self._data.tobytes()
+
+    def restore(self, snapshot: bytes) -> None:
+        "Overwrites all parameter values with a snapshot of the same size"
+
+        assert len(snapshot) == 8 * len(
+            self._data
+        ), "Snapshot size does not match the number of parameters"
+
+        memoryview(self._data).cast("B")[:] = snapshot
+
+
+class Parameter(Scalar):
+    __slots__ = ("_buffer", "_index", "_values", "_gradients")
+
+    def __init__(self, buffer: ParameterBuffer, index: int) -> None:
+        """Trainable Scalar whose value and gradient live in a ParameterBuffer.
+
+        Args:
+            buffer: Buffer that holds the value and gradient
+            index: Position of this parameter in the buffer
+        """
+
+        Identifiable.__init__(self)
+
+        self._buffer = buffer
+        self._index = index
+        self._values = buffer._data
+        self._gradients = buffer._gradients
+        self._operator = None
+        self._trainable = True
+
+    def __reduce__(self):
+        return (Parameter, (self._buffer, self._index))
+
+    @property
+    def buffer(self) -> ParameterBuffer:
+        return self._buffer
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def _data(self) -> float:
+        return self._values[self._index]
+
+    @_data.setter
+    def _data(self, value: float) -> None:
+        self._values[self._index] = value
+
+    @property
+    def _gradient(self) -> float:
+        return self._gradients[self._index]
+
+    @_gradient.setter
+    def _gradient(self, value: float) -> None:
+        self._gradients[self._index] = value
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 
 
 class Scalar(Identifiable):
+    __slots__ = ("_data", "_operator", "_trainable", "_gradient", "__weakref__")
+
     def __init__(
         self,
         data: Optional[int | float] = None,
@@ -0,0 +1,426 @@
+import csv
+import mmap
+import queue
+import random
+import threading
+import weakref
+from array import array
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from scalarflow.core.scalar import Scalar
+from scalarflow.types import ScalarLike
+
+Example = Tuple[ScalarLike]
+Batch = Tuple[List[Example], List[ScalarLike]]
+
+
+class Dataset:
+    def __init__(self, name: str) -> None:
+        """Source of (example, label) pairs that can be iterated once per epoch.
+
+        Subclasses implement __iter__, and can override batches when they can
+        assemble a batch more efficiently than one pair at a time. Only one
+        batch is held in memory at a time.
+        """
+
+        self._name = name
+
+    def __repr__(self) -> str:
+        return f"Dataset(name={self._name})"
+
+    def __iter__(self) -> Iterator[Tuple[Example, ScalarLike]]:
+        raise NotImplementedError("Method '__iter__' not implemented")
+
+    def batches(self, batch_size: int) -> Iterator[Batch]:
+        "Yields lists of examples and labels, the last batch may be smaller"
+
+        examples, labels = [], []
+
+        for example, label in self:
+            examples.append(example)
+            labels.append(label)
+
+            if len(labels) == batch_size:
+                yield examples, labels
+                examples, labels = [], []
+
+        if len(labels) > 0:
+            yield examples, labels
+
+
+class ArrayDataset(Dataset):
+    def __init__(self, examples: Tuple[Example], labels: Tuple[ScalarLike]) -> None:
+        """Examples and labels that are already in memory."""
+
+        super().__init__(name="array")
+
+        assert len(examples) == len(
+            labels
+        ), "Number of examples and labels must be the same"
+
+        self._examples = examples
+        self._labels = labels
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __getitem__(self, index: int) -> Tuple[Example, ScalarLike]:
+        return self._examples[index], self._labels[index]
+
+    def __iter__(self) -> Iterator[Tuple[Example, ScalarLike]]:
+        return zip(self._examples, self._labels)
+
+    def batches(self, batch_size: int) -> Iterator[Batch]:
+        for start in range(0, len(self._labels), batch_size):
+            yield (
+                self._examples[start : start + batch_size],
+                self._labels[start : start + batch_size],
+            )
+
+
+class GeneratorDataset(Dataset):
+    def __init__(
+        self, factory: Callable[[], Iterable[Tuple[Example, ScalarLike]]]
+    ) -> None:
+        """Pairs produced by a generator.
+
+        Args:
+            factory: Callable that returns a new iterable of (example, label)
+                pairs, called once per epoch, for example a generator function
+        """
+
+        super().__init__(name="generator")
+
+        self._factory = factory
+
+    def __iter__(self) -> Iterator[Tuple[Example, ScalarLike]]:
+        return iter(self._factory())
+
+
+class CSVDataset(Dataset):
+    def __init__(
+        self,
+        path: str,
+        label_column: int = -1,
+        skip_header: bool = False,
+        delimiter: str = ",",
+    ) -> None:
+        """Rows of a CSV file of numbers, read one row at a time.
+
+        Args:
+            path: Path of the CSV file
+            label_column: Index of the column that holds the label, all other
+                columns are inputs
+            skip_header: Set if the first row holds column names
+            delimiter: Column delimiter
+        """
+
+        super().__init__(name="csv")
+
+        self._path = path
+        self._label_column = label_column
+        self._skip_header = skip_header
+        self._delimiter = delimiter
+
+    def __iter__(self) -> Iterator[Tuple[Example, ScalarLike]]:
+        with open(self._path, "r", newline="") as f:
+            reader = csv.reader(f, delimiter=self._delimiter)
+
+            if self._skip_header:
+                next(reader, None)
+
+            for row in reader:
+                if len(row) == 0:
+                    continue
+
+                values = [float(value) for value in row]
+                label = values.pop(self._label_column)
+
+                yield tuple(values), label
+
+
+def _close_mapping(file, mapped: mmap.mmap, values: memoryview) -> None:
+    # The view has to be released before the mapping it exports can be closed
+    values.release()
+    mapped.close()
+    file.close()
+
+
+class MemmapDataset(Dataset):
+    def __init__(self, path: str, num_inputs: int) -> None:
+        """Memory-mapped binary file of float64 rows, each row being the inputs
+        of an example followed by its label.
+
+        Pages are read by the operating system on demand, so the file can be
+        larger than the available memory. This is the raw layout written by
+        `write`, or by numpy.ndarray.tofile for a float64 array of shape
+        (num_examples, num_inputs + 1).
+
+        The file stays open until close is called, the dataset is used as a
+        context manager, or it is garbage collected.
+
+        Args:
+            path: Path of the binary file
+            num_inputs: Number of inputs per example
+        """
+
+        super().__init__(name="memmap")
+
+        self._path = path
+        self._num_inputs = num_inputs
+        self._row_size = num_inputs + 1
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._values: Optional[memoryview] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+        self._open()
+
+    def _open(self) -> None:
+        self._file = open(self._path, "rb")
+
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+
+        self._values = memoryview(self._mmap).cast("d")
+        self._finalizer = weakref.finalize(
+            self, _close_mapping, self._file, self._mmap, self._values
+        )
+
+        assert (
+            len(self._values) % self._row_size == 0
+        ), f"File size is not a multiple of rows of {self._row_size} float64 values"
+
+    def close(self) -> None:
+        "Releases the memory map and closes the file, the dataset can not be read afterwards"
+
+        if self._finalizer is not None:
+            self._finalizer()
+
+        self._file = None
+        self._mmap = None
+        self._values = None
+        self._finalizer = None
+
+    def __enter__(self) -> "MemmapDataset":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # Memory maps can not be pickled, the file is mapped again instead
+        state = dict(self.__dict__)
+        state.update(_file=None, _mmap=None, _values=None, _finalizer=None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._open()
+
+    @staticmethod
+    def write(
+        path: str, examples: Iterable[Example], labels: Iterable[ScalarLike]
+    ) -> None:
+        "Writes examples and labels in the layout read by MemmapDataset"
+
+        with open(path, "wb") as f:
+            for example, label in zip(examples, labels):
+                array("d", [*example, label]).tofile(f)
+
+    def __len__(self) -> int:
+        return len(self._values) // self._row_size
+
+    def _rows(self, start: int, end: int) -> List[Tuple[Example, float]]:
+        values = self._values[start * self._row_size : end * self._row_size].tolist()
+
+        return [
+            (
+                tuple(values[offset : offset + self._num_inputs]),
+                values[offset + self._num_inputs],
+            )
+            for offset in range(0, len(values), self._row_size)
+        ]
+
+    def __getitem__(self, index: int) -> Tuple[Example, float]:
+        return self._rows(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[Tuple[Example, float]]:
+        for examples, labels in self.batches(batch_size=1024):
+            yield from zip(examples, labels)
+
+    def batches(self, batch_size: int) -> Iterator[Batch]:
+        for start in range(0, len(self), batch_size):
+            rows = self._rows(start, min(start + batch_size, len(self)))
+            yield [example for example, _ in rows], [label for _, label in rows]
+
+
+def as_dataset(
+    examples: Dataset | Tuple[Example], labels: Optional[Tuple[ScalarLike]]
+) -> Dataset:
+    """Returns examples if it is a Dataset, otherwise an ArrayDataset of
+    examples and labels.
+    """
+
+    if isinstance(examples, Dataset):
+        assert labels is None, "Labels must not be given separately for a Dataset"
+        return examples
+
+    assert labels is not None, "Labels are required unless examples is a Dataset"
+    return ArrayDataset(examples=examples, labels=labels)
+
+
+def collate_scalars(examples: List[Example], labels: List[ScalarLike]) -> Batch:
+    "Converts every input and label of a batch to a Scalar"
+
+    return (
+        [tuple(Scalar.make_scalar(value) for value in example) for example in examples],
+        [Scalar.make_scalar(label) for label in labels],
+    )
+
+
+def collate_floats(examples: List[Example], labels: List[ScalarLike]) -> Batch:
+    "Converts every input and label of a batch to a float"
+
+    return (
+        [tuple(Scalar.make_float(value) for value in example) for example in examples],
+        [Scalar.make_float(label) for label in labels],
+    )
+
+
+# Marks the end of the batches in a prefetch queue
+_END = object()
+
+
+class DataLoader:
+    def __init__(
+        self,
+        dataset: Dataset,
+        batch_size: int = 32,
+        shuffle: bool = False,
+        seed: Optional[int] = None,
+        drop_last: bool = False,
+        collate_fn: Callable[
+            [List[Example], List[ScalarLike]], Batch
+        ] = collate_scalars,
+        prefetch: int = 0,
+    ) -> None:
+        """Iterable of batches of a Dataset, with optional shuffling and prefetching.
+
+        Args:
+            dataset: Dataset to load, must support len and indexing to shuffle
+            batch_size: Number of examples per batch
+            shuffle: Set to visit examples in a different order every epoch
+            seed: Seed of the shuffling, the order of epoch n only depends on
+                seed and n
+            drop_last: Set to skip the last batch if it is smaller than
+                batch_size
+            collate_fn: Converts the examples and labels of a batch, by default
+                into Scalars
+            prefetch: Number of batches prepared ahead in a background thread,
+                0 prepares every batch when it is requested
+        """
+
+        if shuffle:
+            assert hasattr(dataset, "__len__") and hasattr(
+                dataset, "__getitem__"
+            ), "Shuffling requires a Dataset that supports len and indexing"
+
+        self._dataset = dataset
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+        self._seed = seed
+        self._drop_last = drop_last
+        self._collate_fn = collate_fn
+        self._prefetch = prefetch
+        self._epoch = 0
+
+    def __repr__(self) -> str:
+        return f"DataLoader(dataset={self._dataset}, batch_size={self._batch_size}, shuffle={self._shuffle}, prefetch={self._prefetch})"
+
+    @property
+    def dataset(self) -> Dataset:
+        return self._dataset
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def __len__(self) -> int:
+        if self._drop_last:
+            return len(self._dataset) // self._batch_size
+        return -(-len(self._dataset) // self._batch_size)
+
+    def _batches(self) -> Iterator[Batch]:
+        if self._shuffle:
+            seed = None if self._seed is None else f"{self._seed}:{self._epoch}"
+            indices = list(range(0, len(self._dataset)))
+            random.Random(seed).shuffle(indices)
+
+            for start in range(0, len(indices), self._batch_size):
+                pairs = [
+                    self._dataset[index]
+                    for index in indices[start : start + self._batch_size]
+                ]
+                yield [example for example, _ in pairs], [label for _, label in pairs]
+        else:
+            yield from self._dataset.batches(self._batch_size)
+
+    def _collated(self) -> Iterator[Batch]:
+        for examples, labels in self._batches():
+            if self._drop_last and len(labels) < self._batch_size:
+                return
+
+            yield self._collate_fn(examples, labels)
+
+    def __iter__(self) -> Iterator[Batch]:
+        batches = self._collated()
+        self._epoch += 1
+
+        if self._prefetch > 0:
+            return self._prefetched(batches)
+        return batches
+
+    def _prefetched(self, batches: Iterator[Batch]) -> Iterator[Batch]:
+        prefetched = queue.Queue(maxsize=self._prefetch)
+        stop = threading.Event()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    prefetched.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    put(batch)
+
+                    if stop.is_set():
+                        return
+
+                put(_END)
+            except BaseException as error:
+                put(error)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = prefetched.get()
+
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+
+                yield item
+        finally:
+            stop.set()
+            producer.join()
@@ -1,7 +1,32 @@
-from typing import Callable, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+from scalarflow.core.parameter import ParameterBuffer
 from scalarflow.core.scalar import Scalar
 from scalarflow.node import Node
+from scalarflow.operators import relu, sigmoid
+
+# Activations of Dense layers by name, used to save and load models
+ACTIVATIONS: Dict[str, Optional[Callable]] = {
+    "linear": None,
+    "relu": relu,
+    "sigmoid": sigmoid,
+}
+
+
+def activation_name(activation: Optional[Callable]) -> str:
+    """Returns the name an activation is registered with in ACTIVATIONS.
+
+    Raises:
+        ValueError if the activation is not registered.
+    """
+
+    for name, registered in ACTIVATIONS.items():
+        if registered is activation:
+            return name
+
+    raise ValueError(
+        f"Activation {activation} is not registered in scalarflow.layers.ACTIVATIONS"
+    )
 
 
 class Dense:
@@ -10,16 +35,42 @@ class Dense:
     ) -> None:
         self._output_dim = output_dim
         self._input_dim = input_dim
+        self._activation = activation
 
         self._nodes = [
             Node(num_inputs=input_dim, activation=activation)
             for _ in range(0, output_dim)
         ]
 
+    @property
+    def input_dim(self) -> int:
+        return self._input_dim
+
     @property
     def output_dim(self) -> int:
         return self._output_dim
 
+    @property
+    def activation(self) -> Optional[Callable]:
+        return self._activation
+
+    @property
+    def nodes(self) -> List[Node]:
+        return self._nodes
+
+    def bind(self, buffer: ParameterBuffer) -> None:
+        """Moves the weights and biases of all nodes into a ParameterBuffer.
+
+        Parameters are laid out node by node, each node's weights followed by
+        its bias, so the layer occupies an (output_dim, input_dim + 1) block.
+        """
+
+        for node in self._nodes:
+            node.bind(buffer)
+
+    def parameters(self) -> List[Scalar]:
+        return [parameter for node in self._nodes for parameter in node.parameters()]
+
     def __call__(self, inputs: Tuple[Scalar]) -> Union[Tuple[Scalar], Scalar]:
         if self._output_dim == 1:
             return self._nodes[0](inputs=inputs)
@@ -1,7 +1,21 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from scalarflow.core.scalar import Scalar
-from scalarflow.operators import add, divide, power, subtract
+from scalarflow.operators import (
+    add_n,
+    divide,
+    power,
+    sigmoid_binary_crossentropy,
+    softmax_crossentropy,
+    subtract,
+)
+
+
+def _mean(errors: List[Scalar]) -> Scalar:
+    if len(errors) == 1:
+        return errors[0]
+
+    return divide(add_n(errors), len(errors))
 
 
 def squared_error(y_true: Scalar, y_pred: Scalar) -> Scalar:
@@ -10,15 +24,40 @@ def squared_error(y_true: Scalar, y_pred: Scalar) -> Scalar:
 
 
 def mean_squared_error(y_true: Tuple[Scalar], y_pred: Tuple[Scalar]) -> Scalar:
-    num_examples = len(y_true)
-
-    if num_examples == 1:
-        return squared_error(y_true[0], y_pred[0])
-
-    error = None
-
-    for true, pred in zip(y_true, y_pred):
-        current_error = squared_error(true, pred)
-        error = current_error if error is None else add(error, current_error)
-
-    return divide(error, num_examples)
+    return _mean([squared_error(true, pred) for true, pred in zip(y_true, y_pred)])
+
+
+def binary_crossentropy_from_logits(
+    y_true: Tuple[Scalar], y_pred: Tuple[Scalar]
+) -> Scalar:
+    """Mean binary cross-entropy, where predictions are logits.
+
+    The final layer of the model should have no activation, since the sigmoid
+    is computed as part of the loss. Predictions of the model are then logits,
+    so a BinaryAccuracy metric should use a threshold of 0.
+    """
+
+    return _mean(
+        [
+            sigmoid_binary_crossentropy(logit=pred, label=true)
+            for true, pred in zip(y_true, y_pred)
+        ]
+    )
+
+
+def softmax_crossentropy_from_logits(
+    y_true: Tuple[int], y_pred: Tuple[Tuple[Scalar]]
+) -> Scalar:
+    """Mean cross-entropy, where labels are class indices and every prediction
+    is a tuple of logits, one per class.
+
+    It needs several logits per example, so it cannot be the loss of MLP,
+    whose final layer has a single output.
+    """
+
+    return _mean(
+        [
+            softmax_crossentropy(logits=pred, label=true)
+            for true, pred in zip(y_true, y_pred)
+        ]
+    )
@@ -6,7 +6,15 @@ from scalarflow.types import ScalarLike
 
 class Metric:
     def __init__(self, name: str) -> None:
+        """Metric that is either computed on a whole set of labels and predictions,
+        or accumulated batch by batch with reset, update and result.
+
+        Subclasses implement compute, and can override reset, update and result
+        to accumulate a running state instead of all labels and predictions.
+        """
+
         self._name = name
+        self.reset()
 
     def __call__(self, y_true: Tuple[ScalarLike], y_pred: Tuple[ScalarLike]) -> float:
         y_true: List[float] = [Scalar.make_float(label) for label in y_true]
@@ -16,6 +24,17 @@ class Metric:
     def compute(self, y_true: Tuple[ScalarLike], y_pred: Tuple[ScalarLike]) -> float:
         raise NotImplementedError("Method 'compute' not implemented")
 
+    def reset(self) -> None:
+        self._y_true: List[float] = []
+        self._y_pred: List[float] = []
+
+    def update(self, y_true: Tuple[ScalarLike], y_pred: Tuple[ScalarLike]) -> None:
+        self._y_true.extend(Scalar.make_float(label) for label in y_true)
+        self._y_pred.extend(Scalar.make_float(label) for label in y_pred)
+
+    def result(self) -> float:
+        return self.compute(self._y_true, self._y_pred)
+
 
 class BinaryAccuracy(Metric):
     def __init__(self, threshold: float = 0.5) -> None:
@@ -31,3 +50,19 @@ class BinaryAccuracy(Metric):
                 for gt, pred in zip(y_true, y_pred)
             ]
         ) / len(y_true)
+
+    def reset(self) -> None:
+        self._correct = 0
+        self._total = 0
+
+    def update(self, y_true: Tuple[ScalarLike], y_pred: Tuple[ScalarLike]) -> None:
+        make_float = Scalar.make_float
+
+        for gt, pred in zip(y_true, y_pred):
+            self._correct += float(make_float(pred) > self._threshold) == make_float(gt)
+
+        self._total += len(y_true)
+
+    def result(self) -> float:
+        assert self._total > 0
+        return self._correct / self._total
@@ -1,12 +1,33 @@
-from typing import Callable, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
+from scalarflow import serialization
 from scalarflow.callbacks import Callback
+from scalarflow.core.grad_mode import no_grad
+from scalarflow.core.parameter import Parameter, ParameterBuffer
 from scalarflow.core.scalar import Scalar
+from scalarflow.data import (
+    DataLoader,
+    Dataset,
+    as_dataset,
+    collate_floats,
+    collate_scalars,
+)
 from scalarflow.layers import Dense
 from scalarflow.metrics import Metric
-from scalarflow.training import optimisation_step
+from scalarflow.optimizers import SGD, Optimizer
+from scalarflow.tape import Tape
+from scalarflow.training import accumulate_gradients
 from scalarflow.types import ScalarLike
 
+# Backends only some engines need are imported on first use, so that
+# importing the models stays cheap for inference
+if TYPE_CHECKING:
+    from scalarflow.cache import GraphCache
+    from scalarflow.compiler import CompiledGraph
+    from scalarflow.parallel import DataParallel
+
+ENGINES = ("graph", "tape", "numpy", "compiled")
+
 
 class MLP:
     def __init__(self, layers: Tuple[Dense]) -> None:
@@ -15,20 +36,54 @@ class MLP:
         Args:
             layers: Tuple of layers
 
+        Layers already bound by another model share its ParameterBuffer, so
+        training either model updates the weights of both.
+
         Raises:
             AssertionError if the output dimension is not set to 1
             for the final layer.
+            ValueError if the layers are bound to the ParameterBuffer of a
+            model with other layers.
         """
 
         self._layers = layers
+        self._buffer = ParameterBuffer()
         self._metrics: Optional[Tuple[Metric]] = None
-        self._lr: float = 0.1
+        self._optimizer: Optimizer = SGD(lr=0.1)
+        self._engine: str = "graph"
+        self._optimise = False
+        self._graph_cache: Optional["GraphCache"] = None
+        self._tapes: Dict[int, Tape] = {}
+        self._compiled_graphs: Dict[int, "CompiledGraph"] = {}
+        self._numpy_engine = None
+        self._data_parallel: Optional["DataParallel"] = None
         self._history = {"epochs": [], "loss": []}
+        self._stop_training = False
 
         assert (
             layers[-1].output_dim == 1
         ), "Final layer of MLP must have output dimension of 1"
 
+        parameters = [parameter for layer in layers for parameter in layer.parameters()]
+
+        if isinstance(parameters[0], Parameter):
+            # Layers shared with another model keep training the weights in
+            # its buffer, which must hold exactly these layers
+            self._buffer = parameters[0].buffer
+
+            if len(self._buffer) != len(parameters) or any(
+                not isinstance(parameter, Parameter)
+                or parameter.buffer is not self._buffer
+                or parameter.index != index
+                for index, parameter in enumerate(parameters)
+            ):
+                raise ValueError(
+                    "Layers are bound to the ParameterBuffer of a model with other layers"
+                )
+        else:
+            for layer in layers:
+                layer.bind(self._buffer)
+
     def __call__(self, inputs: Tuple[Scalar]) -> Tuple[Scalar] | Scalar:
         outputs = inputs
 
@@ -37,81 +92,478 @@ class MLP:
 
         return outputs
 
-    def compile(self, loss_fn: Callable, lr: float, metrics: Tuple[Metric]) -> None:
+    @property
+    def optimizer(self) -> Optimizer:
+        return self._optimizer
+
+    @property
+    def buffer(self) -> ParameterBuffer:
+        return self._buffer
+
+    @property
+    def stop_training(self) -> bool:
+        "Set by a callback to stop fit after the current epoch"
+
+        return self._stop_training
+
+    @stop_training.setter
+    def stop_training(self, value: bool) -> None:
+        self._stop_training = value
+
+    def parameters(self) -> List[Scalar]:
+        return [parameter for layer in self._layers for parameter in layer.parameters()]
+
+    def save(self, path: str) -> None:
+        """Saves the layers and parameter values of the model to a binary file.
+
+        Optimizer state, metrics and history are not saved.
+        """
+
+        serialization.save(path=path, layers=self._layers, buffer=self._buffer)
+
+    def load_weights(self, path: str) -> None:
+        "Overwrites the parameters with those saved at path, by a model of the same layers"
+
+        serialization.load_parameters(
+            path=path, layers=self._layers, buffer=self._buffer
+        )
+
+    @staticmethod
+    def load(path: str) -> "MLP":
+        "Returns a new model with the layers and parameters saved at path"
+
+        model = MLP(layers=tuple(serialization.load_layers(path=path)))
+        model.load_weights(path=path)
+        return model
+
+    def predict(self, examples: Tuple[Tuple[ScalarLike]]) -> List[float]:
+        """Predictions for a batch of examples, computed without building a graph.
+
+        Args:
+            examples: Tuple of examples, each a tuple of inputs
+
+        Returns:
+            List of predictions as floats
+        """
+
+        with no_grad():
+            return [self.__call__(inputs=example) for example in examples]
+
+    def compile(
+        self,
+        loss_fn: Callable,
+        lr: Optional[float] = None,
+        metrics: Tuple[Metric] = (),
+        engine: str = "graph",
+        optimizer: Optional[Optimizer] = None,
+        optimise: bool = False,
+        graph_cache: Optional["GraphCache"] = None,
+    ) -> None:
+        """Configures the model for training.
+
+        Args:
+            loss_fn: Loss function, called with labels and predictions
+            lr: Learning rate of plain gradient descent, if no optimizer is given
+            metrics: Tuple of metrics computed at the end of every epoch
+            engine: "graph" builds a new graph for every batch, "tape"
+                records the graph once per batch size and replays it,
+                "numpy" runs whole batches with NumPy matrix multiplications
+                (requires numpy), "compiled" records the graph once per batch
+                size and compiles it to straight-line Python
+            optimizer: Optimizer that updates the parameters, instead of lr
+            optimise: Whether the "tape" and "compiled" engines fold
+                constants, reduce strength and eliminate common
+                subexpressions of the recorded graph, see passes.optimise_graph
+            graph_cache: On-disk cache the "compiled" engine reads and writes
+                the source of compiled graphs to, so models of the same
+                architecture skip tracing in later processes
+        """
+
+        assert engine in ENGINES, f"engine must be one of {ENGINES}, not '{engine}'"
+        assert (lr is None) != (
+            optimizer is None
+        ), "Exactly one of 'lr' and 'optimizer' must be given"
+
         self._loss_fn = loss_fn
-        self._lr = lr
+        self._optimizer = optimizer if optimizer is not None else SGD(lr=lr)
         self._metrics = metrics
-
-    def fit(
+        self._engine = engine
+        self._optimise = optimise
+        self._graph_cache = graph_cache
+        self._tapes = {}
+        self._compiled_graphs = {}
+        self._numpy_engine = None
+
+    def _trace(self, batch_size: int) -> Tape:
+        return Tape(
+            model=self.__call__,
+            loss_fn=self._loss_fn,
+            input_dim=self._layers[0].input_dim,
+            batch_size=batch_size,
+            optimise=self._optimise,
+        )
+
+    def _tape(self, batch_size: int) -> Tape:
+        if batch_size not in self._tapes:
+            self._tapes[batch_size] = self._trace(batch_size)
+
+        return self._tapes[batch_size]
+
+    def _compiled_graph(self, batch_size: int) -> "CompiledGraph":
+        if batch_size not in self._compiled_graphs:
+            self._compiled_graphs[batch_size] = self._compile(batch_size)
+
+        return self._compiled_graphs[batch_size]
+
+    def _compile(self, batch_size: int) -> "CompiledGraph":
+        from scalarflow.cache import architecture_key
+        from scalarflow.compiler import compile_source, compile_tape
+
+        # The tape is only needed to generate the source, so it is not kept
+        if self._graph_cache is None:
+            return compile_tape(self._trace(batch_size))
+
+        key = architecture_key(
+            layers=self._layers,
+            loss_fn=self._loss_fn,
+            batch_size=batch_size,
+            optimise=self._optimise,
+        )
+        entry = self._graph_cache.get(key) if key is not None else None
+
+        if entry is not None:
+            source, code = entry
+            return compile_source(source, code=code)
+
+        compiled_graph = compile_tape(self._trace(batch_size))
+
+        if key is not None:
+            self._graph_cache.put(key, compiled_graph.source, compiled_graph.code)
+
+        return compiled_graph
+
+    def _train_step(
         self,
         examples: Tuple[Tuple[ScalarLike]],
         labels: Tuple[ScalarLike],
+        micro_batch_size: Optional[int] = None,
+    ) -> Tuple[float, Sequence[ScalarLike]]:
+        """Runs one training step and returns the loss and predictions of the batch,
+        computed before the update."""
+
+        if self._engine == "numpy":
+            loss = self._numpy_engine.gradients(examples=examples, labels=labels)
+            predictions = self._numpy_engine.predictions
+        elif self._engine == "compiled":
+            loss, predictions = self._compiled_graph(len(labels)).gradients(
+                buffer=self._buffer, examples=examples, labels=labels
+            )
+        elif self._engine == "tape":
+            tape = self._tape(len(labels))
+            loss = tape.gradients(examples=examples, labels=labels)
+            predictions = tape.predictions
+        elif self._data_parallel is not None:
+            loss = self._data_parallel.gradients(examples=examples, labels=labels)
+            predictions = self._data_parallel.predictions
+        elif micro_batch_size is not None:
+            # The loss is expected to average over examples, so every micro-batch
+            # contributes its share of the batch to the loss and gradients
+            loss = 0.0
+            predictions = []
+            self._buffer.zero_gradients()
+
+            for start in range(0, len(labels), micro_batch_size):
+                micro_labels = labels[start : start + micro_batch_size]
+                micro_predictions = [
+                    self.__call__(inputs=example)
+                    for example in examples[start : start + micro_batch_size]
+                ]
+                root = self._loss_fn(micro_labels, micro_predictions)
+                weight = len(micro_labels) / len(labels)
+
+                accumulate_gradients(root=root, gradient=weight)
+                loss += weight * root.data
+
+                # Keep only values, so the graph of the micro-batch can be freed
+                predictions.extend(prediction.data for prediction in micro_predictions)
+                del root, micro_predictions
+        else:
+            predictions = []
+
+            for example in examples:
+                predictions.append(self.__call__(inputs=example))
+
+            root = self._loss_fn(labels, predictions)
+
+            self._buffer.zero_gradients()
+            accumulate_gradients(root=root)
+            loss = root.data
+
+        self._optimizer.apply(self._buffer)
+
+        return loss, predictions
+
+    def fit(
+        self,
+        examples: DataLoader | Dataset | Tuple[Tuple[ScalarLike]],
+        labels: Optional[Tuple[ScalarLike]] = None,
+        epochs: int = 1,
+        batch_size: int = 32,
+        callbacks: Tuple[Callback] = (),
+        workers: int = 1,
+        validation_data: Optional[
+            DataLoader | Dataset | Tuple[Tuple[Tuple[ScalarLike]], Tuple[ScalarLike]]
+        ] = None,
+        validation_freq: int = 1,
+        micro_batch_size: Optional[int] = None,
+    ) -> dict:
+        """Trains the model.
+
+        Args:
+            examples: Either a DataLoader, a Dataset, or a tuple of examples,
+                each a tuple of inputs
+            labels: Tuple of labels, one per example, if examples is not a
+                DataLoader or Dataset
+            epochs: Number of passes over all examples
+            batch_size: Number of examples per optimisation step, ignored if
+                examples is a DataLoader
+            callbacks: Tuple of callbacks
+            workers: Number of processes that every batch is sharded across,
+                only supported by the "graph" engine
+            validation_data: Either a DataLoader, a Dataset, or a tuple of
+                examples and labels, to evaluate the model on after training
+                epochs, reported with the prefix "val_"
+            validation_freq: Number of epochs between validation passes
+            micro_batch_size: Number of examples whose graph is built and
+                backpropagated at a time, gradients are accumulated over the
+                micro-batches of a batch before one update, so peak memory
+                depends on micro_batch_size instead of batch_size. Only
+                supported by the "graph" engine with a single worker
+
+        Returns:
+            History of the loss and metrics for every epoch
+
+        Raises:
+            ValueError if there are no batches to train on, because the
+            dataset is empty or has fewer examples than a batch and the
+            last partial batch is dropped, or no examples to validate on
+        """
+
+        if isinstance(examples, DataLoader):
+            assert labels is None, "labels must be None when examples is a DataLoader"
+            loader = examples
+        else:
+            # Only the graph engine consumes Scalars, the others copy floats
+            convert_to_scalars = self._engine == "graph" and workers == 1
+
+            loader = DataLoader(
+                dataset=as_dataset(examples=examples, labels=labels),
+                batch_size=batch_size,
+                collate_fn=collate_scalars if convert_to_scalars else collate_floats,
+            )
+
+        if hasattr(loader.dataset, "__len__") and len(loader) == 0:
+            raise ValueError(
+                f"No batches to train on: {len(loader.dataset)} examples with a batch size of {loader.batch_size}"
+            )
+
+        if micro_batch_size is not None:
+            assert (
+                self._engine == "graph" and workers == 1
+            ), "Micro-batching is only supported by the graph engine with a single worker"
+            assert (
+                micro_batch_size >= 1
+            ), f"micro_batch_size must be at least 1, not {micro_batch_size}"
+
+        if validation_data is None:
+            validation = None
+        elif isinstance(validation_data, DataLoader):
+            validation = (validation_data.dataset, validation_data.batch_size)
+        elif isinstance(validation_data, Dataset):
+            validation = (validation_data, batch_size)
+        else:
+            validation = (as_dataset(*validation_data), batch_size)
+
+        if (
+            validation is not None
+            and hasattr(validation[0], "__len__")
+            and len(validation[0]) == 0
+        ):
+            raise ValueError("No examples to validate on: the dataset is empty")
+
+        if self._engine == "numpy":
+            from scalarflow.numpy_engine import NumpyEngine
+
+            self._numpy_engine = NumpyEngine(
+                layers=self._layers, loss_fn=self._loss_fn, buffer=self._buffer
+            )
+
+        if workers > 1:
+            assert (
+                self._engine == "graph"
+            ), "Training with multiple workers is only supported by the graph engine"
+
+            from scalarflow.parallel import DataParallel
+
+            self._data_parallel = DataParallel(
+                layers=self._layers,
+                loss_fn=self._loss_fn,
+                buffer=self._buffer,
+                workers=workers,
+            )
+
+        try:
+            return self._fit(
+                loader=loader,
+                epochs=epochs,
+                callbacks=callbacks,
+                validation=validation,
+                validation_freq=validation_freq,
+                micro_batch_size=micro_batch_size,
+            )
+        finally:
+            if self._data_parallel is not None:
+                self._data_parallel.close()
+                self._data_parallel = None
+
+    def _fit(
+        self,
+        loader: DataLoader,
         epochs: int,
-        batch_size: int,
         callbacks: Tuple[Callback],
+        validation: Optional[Tuple[Dataset, int]],
+        validation_freq: int,
+        micro_batch_size: Optional[int] = None,
     ) -> dict:
-        total_examples = len(labels)
-        steps_per_epoch = total_examples // batch_size
-
-        if total_examples % batch_size > 0:
-            steps_per_epoch += 1
+        self._stop_training = False
 
         for callback in callbacks:
+            callback.set_model(self)
             callback.on_training_start()
 
-        for epoch in range(0, epochs):
-            total_loss = 0
+        epoch = 0
+        computed_metrics = {}
+
+        # Callbacks are told training ended even if it raised, so they can
+        # release what they set up in on_training_start or on_epoch_start
+        try:
+            for epoch in range(0, epochs):
+                total_loss = 0
+                steps = 0
+
+                for callback in callbacks:
+                    callback.on_epoch_start(epoch=epoch)
+
+                for metric in self._metrics:
+                    metric.reset()
+
+                for batch_examples, batch_labels in loader:
+                    loss, predictions = self._train_step(
+                        examples=batch_examples,
+                        labels=batch_labels,
+                        micro_batch_size=micro_batch_size,
+                    )
+                    total_loss += loss
+                    steps += 1
+
+                    for metric in self._metrics:
+                        metric.update(y_true=batch_labels, y_pred=predictions)
+
+                if steps == 0:
+                    raise ValueError("No batches to train on: the dataset is empty")
+
+                total_loss /= steps
+
+                self._history["epochs"].append(epoch)
+                computed_metrics = {"loss": total_loss}
+                computed_metrics.update(
+                    (metric._name, metric.result()) for metric in self._metrics
+                )
 
+                if validation is not None and (epoch + 1) % validation_freq == 0:
+                    validation_loss, validation_metrics = self._evaluate(*validation)
+                    computed_metrics["val_loss"] = validation_loss
+                    computed_metrics.update(
+                        (f"val_{name}", value)
+                        for name, value in validation_metrics.items()
+                    )
+
+                for metric_name, metric_value in computed_metrics.items():
+                    if metric_name not in self._history:
+                        self._history[metric_name] = []
+
+                    self._history[metric_name].append(metric_value)
+
+                for callback in callbacks:
+                    callback.on_epoch_end(epoch=epoch, metrics=computed_metrics)
+
+                if self._stop_training:
+                    break
+        finally:
             for callback in callbacks:
-                callback.on_epoch_start(epoch=epoch)
+                callback.on_training_end(epoch=epoch, metrics=computed_metrics)
 
-            for step in range(0, steps_per_epoch):
-                start_index = step * batch_size
-                end_index = min((step + 1) * batch_size, total_examples)
+        return self._history
 
-                batch_examples = examples[start_index:end_index]
-                batch_labels = labels[start_index:end_index]
+    def _evaluate(self, dataset: Dataset, batch_size: int) -> Tuple[float, dict]:
+        total_loss = 0.0
+        total_examples = 0
 
-                predictions = []
+        for metric in self._metrics:
+            metric.reset()
 
-                for batch_example in batch_examples:
-                    predictions.append(self.__call__(inputs=batch_example))
+        for batch_examples, batch_labels in dataset.batches(batch_size):
+            if self._numpy_engine is not None:
+                predictions = self._numpy_engine.predict(batch_examples).tolist()
+            else:
+                predictions = self.predict(examples=batch_examples)
 
+            with no_grad():
                 loss = self._loss_fn(batch_labels, predictions)
-                optimisation_step(root=loss, lr=self._lr)
 
-                total_loss += loss.data
+            total_loss += loss * len(batch_labels)
+            total_examples += len(batch_labels)
 
-            total_loss /= steps_per_epoch
+            for metric in self._metrics:
+                metric.update(y_true=batch_labels, y_pred=predictions)
 
-            self._history["epochs"].append(epoch)
-            computed_metrics = {"loss": total_loss}
+        if total_examples == 0:
+            raise ValueError("No examples to evaluate on: the dataset is empty")
 
-            if len(self._metrics) > 0:
-                predictions = []
+        metric_values = dict(
+            (metric._name, metric.result()) for metric in self._metrics
+        )
 
-                for example in examples:
-                    predictions.append(self.__call__(inputs=example))
+        return total_loss / total_examples, metric_values
 
-                computed_metrics.update(
-                    dict(
-                        (metric._name, metric(y_true=labels, y_pred=predictions))
-                        for metric in self._metrics
-                    )
-                )
+    def evaluate(
+        self,
+        examples: Dataset | Tuple[Tuple[ScalarLike]],
+        labels: Optional[Tuple[ScalarLike]] = None,
+        batch_size: int = 32,
+    ) -> dict:
+        """Computes the loss and metrics of the model, without training.
 
-            for metric_name, metric_value in computed_metrics.items():
-                if metric_name not in self._history:
-                    self._history[metric_name] = []
+        Args:
+            examples: Either a Dataset, or a tuple of examples, each a tuple
+                of inputs
+            labels: Tuple of labels, one per example, if examples is not a
+                Dataset
+            batch_size: Number of examples predicted at a time
 
-                self._history[metric_name].append(metric_value)
+        Returns:
+            Loss and metrics, keyed by name
 
-            for callback in callbacks:
-                callback.on_epoch_end(epoch=epoch, metrics=computed_metrics)
+        Raises:
+            ValueError if there are no examples to evaluate on
+        """
 
-        for callback in callbacks:
-            callback.on_training_end(epoch=epoch, metrics=computed_metrics)
-        return self._history
+        loss, metric_values = self._evaluate(
+            dataset=as_dataset(examples=examples, labels=labels),
+            batch_size=batch_size,
+        )
+
+        return {"loss": loss, **metric_values}
 
     def summary(self) -> None:
         print("=" * 10, "Model", "=" * 10)
@@ -1,7 +1,8 @@
-from typing import Callable, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
+from scalarflow.core.parameter import Parameter, ParameterBuffer
 from scalarflow.core.scalar import Scalar
-from scalarflow.operators import add, multiply
+from scalarflow.operators import linear
 
 
 class Node:
@@ -15,18 +16,45 @@ class Node:
     def __repr__(self) -> str:
         return f"Node(num_inputs={self._num_inputs}, activation={self._activation})"
 
+    @property
+    def weights(self) -> List[Scalar]:
+        return self._weights
+
+    @property
+    def bias(self) -> Scalar:
+        return self._bias
+
+    @property
+    def activation(self) -> Optional[Callable]:
+        return self._activation
+
+    def bind(self, buffer: ParameterBuffer) -> None:
+        """Moves the weights and bias of this node into a ParameterBuffer.
+
+        Raises:
+            ValueError if the node is already bound to another buffer, as
+            moving its parameters would silently detach them from the
+            model that owns that buffer.
+        """
+
+        if any(
+            isinstance(parameter, Parameter) and parameter.buffer is not buffer
+            for parameter in self.parameters()
+        ):
+            raise ValueError("Node is already bound to another ParameterBuffer")
+
+        self._weights = [buffer.allocate(weight.data) for weight in self._weights]
+        self._bias = buffer.allocate(self._bias.data)
+
+    def parameters(self) -> List[Scalar]:
+        return self._weights + [self._bias]
+
     def __call__(self, inputs: Tuple[Scalar]) -> Scalar:
         assert (
             len(inputs) == self._num_inputs
         ), "Node can only accept the number of inputs specified during initialisation"
 
-        total = None
-
-        for index, _input in enumerate(inputs):
-            weighted = multiply(_input, self._weights[index])
-            total = weighted if total is None else add(weighted, total)
-
-        result = add(total, self._bias)
+        result = linear(self._weights, inputs, self._bias)
 
         if self._activation is None:
             return result
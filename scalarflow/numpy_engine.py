@@ -0,0 +1,175 @@
+"""Vectorised execution of Dense layers with NumPy.
+
+NumPy is an optional dependency of scalarflow, this module is only imported
+when a model is compiled with engine="numpy".
+"""
+
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from scalarflow.core.parameter import ParameterBuffer
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import binary_crossentropy_from_logits, mean_squared_error
+from scalarflow.operators import relu, sigmoid
+from scalarflow.types import ScalarLike
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    # Same as Sigmoid.sigmoid, only exponentiates non-positive numbers
+    exp = np.exp(-np.abs(z))
+    return np.where(z >= 0, 1 / (1 + exp), exp / (1 + exp))
+
+
+# Activation -> (forward, derivative computed from the activation output)
+ACTIVATIONS = {
+    None: (lambda z: z, lambda a: np.ones_like(a)),
+    relu: (lambda z: np.maximum(z, 0.0), lambda a: (a > 0).astype(a.dtype)),
+    sigmoid: (_sigmoid, lambda a: a * (1 - a)),
+}
+
+
+def _mean_squared_error(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> Tuple[float, np.ndarray]:
+    difference = y_true - y_pred
+    return float(np.sum(difference**2) / len(y_true)), -2 * difference / len(y_true)
+
+
+def _binary_crossentropy_from_logits(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> Tuple[float, np.ndarray]:
+    losses = np.maximum(y_pred, 0) - y_pred * y_true + np.log1p(np.exp(-np.abs(y_pred)))
+    return float(np.mean(losses)), (_sigmoid(y_pred) - y_true) / len(y_true)
+
+
+# Loss function -> function returning the loss and its gradient wrt y_pred
+LOSSES = {
+    mean_squared_error: _mean_squared_error,
+    binary_crossentropy_from_logits: _binary_crossentropy_from_logits,
+}
+
+
+def as_array(values: Tuple[ScalarLike]) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except TypeError:
+        return np.vectorize(Scalar.make_float, otypes=[np.float64])(
+            np.asarray(values, dtype=object)
+        )
+
+
+class NumpyEngine:
+    def __init__(
+        self, layers: Tuple[Dense], loss_fn: Callable, buffer: ParameterBuffer
+    ) -> None:
+        """Runs a stack of Dense layers on whole batches with NumPy.
+
+        The weights and gradients of every layer are NumPy views into the
+        ParameterBuffer of the model, a weight matrix and a bias vector per
+        layer, so forward and backward passes are matrix multiplications and
+        updates are visible to the Scalars of the model without copying.
+
+        Args:
+            layers: Tuple of Dense layers, bound to buffer
+            loss_fn: Loss function of the model
+            buffer: ParameterBuffer of the model
+
+        Raises:
+            NotImplementedError if an activation or the loss function has
+            no vectorised implementation.
+        """
+
+        for layer in layers:
+            if layer.activation not in ACTIVATIONS:
+                raise NotImplementedError(
+                    f"Activation {layer.activation} is not supported by the numpy engine"
+                )
+
+        if loss_fn not in LOSSES:
+            raise NotImplementedError(
+                f"Loss function {loss_fn} is not supported by the numpy engine"
+            )
+
+        self._layers = layers
+        self._loss_fn = LOSSES[loss_fn]
+        self._data = np.frombuffer(buffer.data, dtype=np.float64)
+        self._gradients = np.frombuffer(buffer.gradients, dtype=np.float64)
+
+        self._weights: List[np.ndarray] = []
+        self._biases: List[np.ndarray] = []
+        self._weight_gradients: List[np.ndarray] = []
+        self._bias_gradients: List[np.ndarray] = []
+        self._predictions = np.zeros(0)
+
+        for layer in layers:
+            # Every node is its weights followed by its bias, see Dense.bind
+            start = layer.parameters()[0].index
+            shape = (layer.output_dim, layer.input_dim + 1)
+            end = start + shape[0] * shape[1]
+
+            data = self._data[start:end].reshape(shape)
+            gradients = self._gradients[start:end].reshape(shape)
+
+            self._weights.append(data[:, :-1])
+            self._biases.append(data[:, -1])
+            self._weight_gradients.append(gradients[:, :-1])
+            self._bias_gradients.append(gradients[:, -1])
+
+    @property
+    def weight_gradients(self) -> List[np.ndarray]:
+        return self._weight_gradients
+
+    @property
+    def bias_gradients(self) -> List[np.ndarray]:
+        return self._bias_gradients
+
+    @property
+    def predictions(self) -> np.ndarray:
+        """Predictions of the batch that gradients was last called with."""
+
+        return self._predictions
+
+    def _forward(self, inputs: np.ndarray) -> List[np.ndarray]:
+        activations = [inputs]
+
+        for layer, weights, biases in zip(self._layers, self._weights, self._biases):
+            forward, _ = ACTIVATIONS[layer.activation]
+            activations.append(forward(activations[-1] @ weights.T + biases))
+
+        return activations
+
+    def predict(self, examples: Tuple[Tuple[ScalarLike]]) -> np.ndarray:
+        return self._forward(as_array(examples))[-1][:, 0]
+
+    def gradients(
+        self, examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike]
+    ) -> float:
+        """Computes the loss for a batch and writes all gradients into the buffer."""
+
+        activations = self._forward(as_array(examples))
+        self._predictions = activations[-1][:, 0]
+        loss, gradient = self._loss_fn(as_array(labels), self._predictions)
+        gradient = gradient[:, None]
+
+        for index in reversed(range(0, len(self._layers))):
+            _, derivative = ACTIVATIONS[self._layers[index].activation]
+            gradient = gradient * derivative(activations[index + 1])
+
+            self._weight_gradients[index][...] = gradient.T @ activations[index]
+            self._bias_gradients[index][...] = gradient.sum(axis=0)
+
+            gradient = gradient @ self._weights[index]
+
+        return loss
+
+    def step(
+        self, examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike], lr: float
+    ) -> float:
+        """Runs one training step on a batch and returns the loss."""
+
+        loss = self.gradients(examples=examples, labels=labels)
+        self._data -= lr * self._gradients
+
+        return loss
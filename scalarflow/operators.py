@@ -1,11 +1,19 @@
+from typing import Tuple
+
+from scalarflow.core.grad_mode import is_grad_enabled
 from scalarflow.core.operator import (
     Add,
     Divide,
+    Dot,
+    Linear,
     Multiply,
     Power,
     ReLU,
     Sigmoid,
+    SigmoidBinaryCrossEntropy,
+    SoftmaxCrossEntropy,
     Subtract,
+    Sum,
 )
 from scalarflow.core.scalar import Scalar
 
@@ -19,9 +27,25 @@ def add(a: Scalar, b: Scalar) -> Scalar:
     Returns:
         a + b
     """
+    if not is_grad_enabled():
+        return Add.compute(Scalar.make_float(a), Scalar.make_float(b))
     return Add()(arguments=(a, b))
 
 
+def add_n(arguments: Tuple[Scalar]) -> Scalar:
+    """Convenience function to add any number of Scalars with a single Operator.
+
+    Args:
+        arguments: Tuple of Scalars
+
+    Returns:
+        Sum of all arguments
+    """
+    if not is_grad_enabled():
+        return Sum.compute(*[Scalar.make_float(a) for a in arguments])
+    return Sum(num_arguments=len(arguments))(arguments=tuple(arguments))
+
+
 def subtract(a: Scalar, b: Scalar) -> Scalar:
     """Convenience function to subtract two Scalars.
 
@@ -32,6 +56,8 @@ def subtract(a: Scalar, b: Scalar) -> Scalar:
     Returns:
         a - b
     """
+    if not is_grad_enabled():
+        return Subtract.compute(Scalar.make_float(a), Scalar.make_float(b))
     return Subtract()(arguments=(a, b))
 
 
@@ -45,6 +71,8 @@ def multiply(a: Scalar, b: Scalar) -> Scalar:
     Returns:
         a * b
     """
+    if not is_grad_enabled():
+        return Multiply.compute(Scalar.make_float(a), Scalar.make_float(b))
     return Multiply()(arguments=(a, b))
 
 
@@ -58,9 +86,50 @@ def divide(a: Scalar, b: Scalar) -> Scalar:
     Returns:
         a / b
     """
+    if not is_grad_enabled():
+        return Divide.compute(Scalar.make_float(a), Scalar.make_float(b))
     return Divide()(arguments=(a, b))
 
 
+def dot(a: Tuple[Scalar], b: Tuple[Scalar]) -> Scalar:
+    """Convenience function for the dot product of two vectors of Scalars.
+
+    Args:
+        a: Tuple of Scalars
+        b: Tuple of Scalars with the same length as a
+
+    Returns:
+        a[0] * b[0] + a[1] * b[1] + ...
+    """
+    assert len(a) == len(b), "Dot product requires vectors of the same length"
+
+    if not is_grad_enabled():
+        return Dot.compute(*[Scalar.make_float(x) for x in (*a, *b)])
+    return Dot(size=len(a))(arguments=(*a, *b))
+
+
+def linear(weights: Tuple[Scalar], inputs: Tuple[Scalar], bias: Scalar) -> Scalar:
+    """Convenience function for a weighted sum of inputs plus a bias.
+
+    Args:
+        weights: Tuple of Scalars
+        inputs: Tuple of Scalars with the same length as weights
+        bias: Scalar
+
+    Returns:
+        dot(weights, inputs) + bias
+    """
+    assert len(weights) == len(
+        inputs
+    ), "Number of weights must be the same as number of inputs"
+
+    if not is_grad_enabled():
+        return Linear.compute(
+            *[Scalar.make_float(x) for x in (*weights, *inputs, bias)]
+        )
+    return Linear(size=len(weights))(arguments=(*weights, *inputs, bias))
+
+
 def power(a: Scalar, b: int) -> Scalar:
     """Convenience function to compute power of a Scalar.
 
@@ -71,14 +140,54 @@ def power(a: Scalar, b: int) -> Scalar:
     Returns:
         a ** b
     """
+    if not is_grad_enabled():
+        return Power.compute(Scalar.make_float(a), b)
     return Power(power=b)(arguments=(a,))
 
 
 def relu(a: Scalar) -> Scalar:
     """Convenience function for ReLU activation."""
+    if not is_grad_enabled():
+        return ReLU.compute(Scalar.make_float(a))
     return ReLU()(arguments=(a,))
 
 
 def sigmoid(a: Scalar) -> Scalar:
     """Convenience function for Sigmoid activation"""
+    if not is_grad_enabled():
+        return Sigmoid.compute(Scalar.make_float(a))
     return Sigmoid()(arguments=(a,))
+
+
+def sigmoid_binary_crossentropy(logit: Scalar, label: Scalar) -> Scalar:
+    """Convenience function for binary cross-entropy of sigmoid(logit).
+
+    Args:
+        logit: Scalar, the input to the sigmoid
+        label: Scalar, 0 or 1
+
+    Returns:
+        -label * log(sigmoid(logit)) - (1 - label) * log(1 - sigmoid(logit))
+    """
+    if not is_grad_enabled():
+        return SigmoidBinaryCrossEntropy.compute(
+            Scalar.make_float(logit), Scalar.make_float(label)
+        )
+    return SigmoidBinaryCrossEntropy()(arguments=(logit, label))
+
+
+def softmax_crossentropy(logits: Tuple[Scalar], label: int) -> Scalar:
+    """Convenience function for cross-entropy of softmax(logits).
+
+    Args:
+        logits: Tuple of Scalars, one per class
+        label: Index of the true class
+
+    Returns:
+        -log(softmax(logits)[label])
+    """
+    if not is_grad_enabled():
+        return SoftmaxCrossEntropy.compute(
+            *[Scalar.make_float(x) for x in (*logits, label)]
+        )
+    return SoftmaxCrossEntropy(num_classes=len(logits))(arguments=(*logits, label))
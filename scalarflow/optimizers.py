@@ -0,0 +1,181 @@
+import math
+from array import array
+from typing import Dict
+
+from scalarflow.core.parameter import ParameterBuffer
+from scalarflow.schedules import Constant, Schedule
+
+
+class Optimizer:
+    def __init__(self, name: str, lr: float | Schedule) -> None:
+        """Updates the parameters of a ParameterBuffer from their gradients.
+
+        Any per-parameter state, like momentum, is kept in arrays of doubles
+        with the same layout as the buffer.
+
+        Args:
+            name: Name of the optimizer
+            lr: Learning rate, either a float or a Schedule of the number of
+                steps taken
+        """
+
+        self._name = name
+        self._schedule = lr if isinstance(lr, Schedule) else Constant(lr)
+        self._iterations = 0
+        self._state: Dict[str, array] = {}
+
+    def __repr__(self) -> str:
+        return f"Optimizer(name={self._name}, lr={self.lr})"
+
+    @property
+    def iterations(self) -> int:
+        return self._iterations
+
+    @property
+    def lr(self) -> float:
+        "Learning rate for the next step"
+
+        return self._schedule(self._iterations)
+
+    @lr.setter
+    def lr(self, updated_value: float | Schedule) -> None:
+        self._schedule = (
+            updated_value
+            if isinstance(updated_value, Schedule)
+            else Constant(updated_value)
+        )
+
+    def state(self, name: str, size: int) -> array:
+        "Returns the state array with the given name, created with zeros"
+
+        if name not in self._state:
+            self._state[name] = array("d", bytes(8 * size))
+
+        return self._state[name]
+
+    def apply(self, buffer: ParameterBuffer) -> None:
+        "Applies one update to all parameters of buffer"
+
+        self.update(buffer.data, buffer.gradients, self.lr)
+        self._iterations += 1
+
+    def update(self, data: array, gradients: array, lr: float) -> None:
+        raise NotImplementedError("Method 'update' not implemented")
+
+
+class SGD(Optimizer):
+    def __init__(
+        self, lr: float | Schedule = 0.01, momentum: float = 0.0, nesterov: bool = False
+    ) -> None:
+        super().__init__(name="sgd", lr=lr)
+
+        self._momentum = momentum
+        self._nesterov = nesterov
+
+    def update(self, data: array, gradients: array, lr: float) -> None:
+        if self._momentum == 0.0:
+            data[:] = array("d", [x - lr * g for x, g in zip(data, gradients)])
+            return
+
+        momentum = self._momentum
+        velocities = self.state("velocity", len(data))
+
+        for index, gradient in enumerate(gradients):
+            velocity = momentum * velocities[index] - lr * gradient
+            velocities[index] = velocity
+
+            if self._nesterov:
+                data[index] += momentum * velocity - lr * gradient
+            else:
+                data[index] += velocity
+
+
+class Adam(Optimizer):
+    def __init__(
+        self,
+        lr: float | Schedule = 0.001,
+        beta_1: float = 0.9,
+        beta_2: float = 0.999,
+        epsilon: float = 1e-7,
+        weight_decay: float = 0.0,
+    ) -> None:
+        """Adam, with optional decoupled weight decay as in AdamW."""
+
+        super().__init__(name="adam", lr=lr)
+
+        self._beta_1 = beta_1
+        self._beta_2 = beta_2
+        self._epsilon = epsilon
+        self._weight_decay = weight_decay
+
+    def update(self, data: array, gradients: array, lr: float) -> None:
+        beta_1, beta_2 = self._beta_1, self._beta_2
+        step = self._iterations + 1
+        corrected_lr = lr * math.sqrt(1 - beta_2**step) / (1 - beta_1**step)
+        decay = lr * self._weight_decay
+
+        first_moments = self.state("first_moment", len(data))
+        second_moments = self.state("second_moment", len(data))
+
+        for index, gradient in enumerate(gradients):
+            first_moment = beta_1 * first_moments[index] + (1 - beta_1) * gradient
+            second_moment = (
+                beta_2 * second_moments[index] + (1 - beta_2) * gradient * gradient
+            )
+            first_moments[index] = first_moment
+            second_moments[index] = second_moment
+
+            data[index] -= decay * data[index] + corrected_lr * first_moment / (
+                math.sqrt(second_moment) + self._epsilon
+            )
+
+
+class AdamW(Adam):
+    def __init__(
+        self,
+        lr: float | Schedule = 0.001,
+        weight_decay: float = 0.004,
+        beta_1: float = 0.9,
+        beta_2: float = 0.999,
+        epsilon: float = 1e-7,
+    ) -> None:
+        super().__init__(
+            lr=lr,
+            beta_1=beta_1,
+            beta_2=beta_2,
+            epsilon=epsilon,
+            weight_decay=weight_decay,
+        )
+
+        self._name = "adamw"
+
+
+class RMSProp(Optimizer):
+    def __init__(
+        self,
+        lr: float | Schedule = 0.001,
+        rho: float = 0.9,
+        momentum: float = 0.0,
+        epsilon: float = 1e-7,
+    ) -> None:
+        super().__init__(name="rmsprop", lr=lr)
+
+        self._rho = rho
+        self._momentum = momentum
+        self._epsilon = epsilon
+
+    def update(self, data: array, gradients: array, lr: float) -> None:
+        rho = self._rho
+        averages = self.state("average", len(data))
+        velocities = self.state("velocity", len(data)) if self._momentum else None
+
+        for index, gradient in enumerate(gradients):
+            average = rho * averages[index] + (1 - rho) * gradient * gradient
+            averages[index] = average
+            increment = lr * gradient / (math.sqrt(average) + self._epsilon)
+
+            if velocities is not None:
+                increment += self._momentum * velocities[index]
+                velocities[index] = increment
+
+            data[index] -= increment
@@ -0,0 +1,149 @@
+import multiprocessing
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from scalarflow.core.parameter import ParameterBuffer
+from scalarflow.layers import Dense
+from scalarflow.training import accumulate_gradients
+from scalarflow.types import ScalarLike
+
+# Copy of the model in a worker process, set by _initialise_worker
+_layers: Optional[Tuple[Dense]] = None
+_loss_fn: Optional[Callable] = None
+_buffer: Optional[ParameterBuffer] = None
+
+
+def _initialise_worker(
+    layers: Tuple[Dense], loss_fn: Callable, buffer: ParameterBuffer
+) -> None:
+    global _layers, _loss_fn, _buffer
+
+    _layers = layers
+    _loss_fn = loss_fn
+    _buffer = buffer
+
+
+def _shard_gradients(
+    parameters: bytes,
+    examples: Tuple[Tuple[ScalarLike]],
+    labels: Tuple[ScalarLike],
+) -> Tuple[float, bytes, List[float]]:
+    """Runs forward and backward over a shard in a worker process.
+
+    Args:
+        parameters: Snapshot of the ParameterBuffer of the model
+
+    Returns:
+        Loss of the shard, the gradients of the ParameterBuffer as bytes and
+        the predictions of the shard
+    """
+
+    _buffer.restore(parameters)
+    _buffer.zero_gradients()
+
+    predictions = []
+
+    for example in examples:
+        outputs = example
+
+        for layer in _layers:
+            outputs = layer(inputs=outputs)
+
+        predictions.append(outputs)
+
+    loss = _loss_fn(labels, predictions)
+    accumulate_gradients(root=loss)
+
+    return (
+        loss.data,
+        _buffer.gradients.tobytes(),
+        [prediction.data for prediction in predictions],
+    )
+
+
+class DataParallel:
+    def __init__(
+        self,
+        layers: Tuple[Dense],
+        loss_fn: Callable,
+        buffer: ParameterBuffer,
+        workers: int,
+    ) -> None:
+        """Computes gradients of a batch by sharding it across a pool of processes.
+
+        Every worker holds a copy of the layers and their ParameterBuffer. For
+        each batch it receives a snapshot of the parameters and one contiguous
+        shard, and returns the loss and gradients of that shard. Shard results
+        are reduced in shard order, so the result only depends on the
+        parameters, the batch and the number of workers.
+
+        The loss function is expected to average over examples, shard losses
+        and gradients are weighted by the fraction of the batch in the shard.
+
+        Args:
+            layers: Tuple of layers of the model, bound to buffer
+            loss_fn: Loss function of the model
+            buffer: ParameterBuffer of the model
+            workers: Number of worker processes
+        """
+
+        assert workers > 1, "DataParallel requires at least 2 workers"
+
+        self._buffer = buffer
+        self._workers = workers
+        self._predictions: List[float] = []
+        self._pool = multiprocessing.get_context("spawn").Pool(
+            processes=workers,
+            initializer=_initialise_worker,
+            initargs=(layers, loss_fn, buffer),
+        )
+
+    @property
+    def predictions(self) -> List[float]:
+        """Predictions of the batch that gradients was last called with."""
+
+        return self._predictions
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def gradients(
+        self, examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike]
+    ) -> float:
+        """Computes the gradients of a batch into the buffer and returns the loss."""
+
+        total_examples = len(labels)
+        shard_size = -(-total_examples // self._workers)
+        shards = [
+            (examples[start : start + shard_size], labels[start : start + shard_size])
+            for start in range(0, total_examples, shard_size)
+        ]
+
+        parameters = self._buffer.snapshot()
+        results = self._pool.starmap(
+            _shard_gradients,
+            [
+                (parameters, shard_examples, shard_labels)
+                for shard_examples, shard_labels in shards
+            ],
+        )
+
+        loss = 0.0
+        gradients = [0.0] * len(self._buffer)
+        self._predictions = []
+
+        for (_, shard_labels), (shard_loss, shard_gradients, shard_predictions) in zip(
+            shards, results
+        ):
+            self._predictions.extend(shard_predictions)
+            weight = len(shard_labels) / total_examples
+            loss += weight * shard_loss
+            gradients = [
+                total + weight * gradient
+                for total, gradient in zip(gradients, array("d", shard_gradients))
+            ]
+
+        self._buffer.gradients[:] = array("d", gradients)
+
+        return loss
@@ -0,0 +1,130 @@
+import weakref
+from typing import Dict, Iterable, Optional, Tuple
+
+from scalarflow.core.operator import Add, Divide, Multiply, Operator, Power
+from scalarflow.core.scalar import Scalar
+from scalarflow.training import create_scalar_graph
+
+# Operators whose arguments can be reordered without changing the result
+COMMUTATIVE = (Add, Multiply)
+
+
+def _is_constant(scalar: Scalar, variables: set) -> bool:
+    return (
+        scalar._operator is None
+        and not scalar._trainable
+        and id(scalar) not in variables
+    )
+
+
+def _replace_operator(result: Scalar, operator: Operator, arguments: Tuple[Scalar]):
+    operator._arguments = arguments
+    operator._result = weakref.ref(result)
+    result._operator = operator
+    return operator
+
+
+def optimise_graph(
+    root: Scalar, variables: Iterable[Scalar] = (), outputs: Iterable[Scalar] = ()
+) -> Dict[str, int]:
+    """Rewrites the graph that resulted in root in place, so it computes the same
+    values with fewer nodes.
+
+    Operators are visited in execution order and the following passes are
+    applied to each of them:
+        - Constant folding: an operator whose arguments are all constants is
+          replaced by its result as a constant
+        - Strength reduction: Power(2) becomes Multiply(x, x), and dividing by
+          a constant becomes multiplying by its reciprocal
+        - Common-subexpression elimination: constants of the same value, and
+          operators with the same name and arguments, are merged into one
+
+    Constants are leaf Scalars that are not trainable and not variables. The
+    values of rewritten Scalars can differ from the original graph by
+    rounding, as x / c and x * (1 / c) are not always equal.
+
+    Args:
+        root: Scalar the graph resulted in
+        variables: Leaf Scalars whose values change between runs of the
+            graph, like the inputs and labels of a Tape, that are not folded
+        outputs: Scalars besides root that must remain part of the graph,
+            like predictions, that are not merged into others
+
+    Returns:
+        Number of nodes before and after, and the number of folded,
+        strength reduced and deduplicated nodes
+    """
+
+    graph = create_scalar_graph(root=root)
+    variables = set(id(scalar) for scalar in variables)
+    pinned = set(id(scalar) for scalar in outputs) | {id(root)}
+
+    replacements: Dict[int, Scalar] = {}
+    constants: Dict[str, Scalar] = {}
+    expressions: Dict[tuple, Scalar] = {}
+    report = {
+        "nodes_before": len(graph),
+        "folded": 0,
+        "strength_reduced": 0,
+        "deduplicated": 0,
+    }
+
+    def canonical(scalar: Scalar) -> Scalar:
+        scalar = replacements.get(id(scalar), scalar)
+
+        if not _is_constant(scalar, variables) or id(scalar) in pinned:
+            return scalar
+
+        # float.hex tells 0.0 and -0.0 apart
+        existing = constants.setdefault(scalar._data.hex(), scalar)
+
+        if existing is not scalar:
+            replacements[id(scalar)] = existing
+            report["deduplicated"] += 1
+
+        return existing
+
+    operators = [
+        op_or_scalar for op_or_scalar in graph if isinstance(op_or_scalar, Operator)
+    ]
+
+    for operator in reversed(operators):
+        result: Scalar = operator.result
+        arguments = tuple(canonical(argument) for argument in operator._arguments)
+        operator._arguments = arguments
+
+        if all(_is_constant(argument, variables) for argument in arguments):
+            result._data = operator.forward()
+            result._operator = None
+            report["folded"] += 1
+            continue
+
+        if isinstance(operator, Power) and operator._power == 2:
+            operator = _replace_operator(result, Multiply(), (arguments[0],) * 2)
+            report["strength_reduced"] += 1
+        elif (
+            isinstance(operator, Divide)
+            and _is_constant(arguments[1], variables)
+            and arguments[1]._data != 0
+        ):
+            reciprocal = canonical(Scalar(data=1.0 / arguments[1]._data))
+            operator = _replace_operator(result, Multiply(), (arguments[0], reciprocal))
+            report["strength_reduced"] += 1
+
+        argument_ids = [id(argument) for argument in operator._arguments]
+
+        if isinstance(operator, COMMUTATIVE):
+            argument_ids.sort()
+
+        key = (type(operator), operator._name, tuple(argument_ids))
+        existing: Optional[Scalar] = expressions.get(key)
+
+        if existing is None:
+            expressions[key] = result
+        elif id(result) not in pinned:
+            replacements[id(result)] = existing
+            report["deduplicated"] += 1
+
+    report["nodes_after"] = len(create_scalar_graph(root=root))
+
+    return report
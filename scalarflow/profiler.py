@@ -0,0 +1,246 @@
+import time
+from typing import Callable, Dict, List, Optional
+
+from scalarflow import tape, training
+from scalarflow.callbacks import Callback
+from scalarflow.core.operator import Operator
+from scalarflow.core.scalar import Scalar
+from scalarflow.optimizers import Optimizer
+
+# Profiler that is currently installed, at most one at a time
+_active: Optional["Profiler"] = None
+
+
+def _operator_classes(cls: type = Operator) -> List[type]:
+    classes = []
+
+    for subclass in cls.__subclasses__():
+        classes.append(subclass)
+        classes.extend(_operator_classes(subclass))
+
+    return classes
+
+
+class Profiler:
+    def __init__(self) -> None:
+        """Records where time goes while it is active, used as a context manager.
+
+        Entering the profiler replaces the hot-path methods (Operator.__call__,
+        forward and backward of every Operator class, Scalar and Operator
+        construction, create_scalar_graph and parameter updates) with timed
+        wrappers, and exiting restores the originals, so nothing is measured
+        and nothing is slowed down while no profiler is active.
+
+        Times are inclusive: the call time of an operator includes its forward.
+        """
+
+        self._patches = []
+        self._depth = 0
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"Profiler(active={self.active})"
+
+    @property
+    def active(self) -> bool:
+        return _active is self
+
+    def reset(self) -> None:
+        self._operators: Dict[str, Dict[str, float]] = {}
+        self._allocations = {"scalars": 0, "operators": 0}
+        self._graphs = {"calls": 0, "time": 0.0, "nodes": []}
+        self._updates = {"calls": 0, "time": 0.0}
+
+    def report(self) -> dict:
+        """Returns the statistics recorded since the last reset.
+
+        Returns:
+            Dictionary with the keys:
+                operators: Calls and cumulative call, forward and backward
+                    times in seconds, keyed by Operator class name
+                allocations: Number of Scalars and Operators constructed
+                graphs: Number and cumulative time of create_scalar_graph
+                    calls, and the number of nodes of every graph
+                updates: Number and cumulative time of parameter updates
+        """
+
+        return {
+            "operators": dict(
+                (name, dict(stats)) for name, stats in self._operators.items()
+            ),
+            "allocations": dict(self._allocations),
+            "graphs": {**self._graphs, "nodes": list(self._graphs["nodes"])},
+            "updates": dict(self._updates),
+        }
+
+    def totals(self) -> Dict[str, float]:
+        "Flat summary of the report, suitable for logging next to metrics"
+
+        operators = self._operators.values()
+        nodes = self._graphs["nodes"]
+
+        return {
+            "operator_calls": sum(stats["calls"] for stats in operators),
+            "forward_time": sum(stats["forward_time"] for stats in operators),
+            "backward_time": sum(stats["backward_time"] for stats in operators),
+            "graph_nodes": sum(nodes) / len(nodes) if nodes else 0.0,
+            "scalar_allocations": self._allocations["scalars"],
+            "update_time": self._updates["time"],
+        }
+
+    def summary(self) -> None:
+        print("=" * 10, "Profile", "=" * 10)
+
+        for name, stats in sorted(
+            self._operators.items(), key=lambda item: -item[1]["call_time"]
+        ):
+            print(
+                f"{name}: calls={stats['calls']:.0f}, call={stats['call_time']:.4f}s, "
+                f"forward={stats['forward_time']:.4f}s, backward={stats['backward_time']:.4f}s"
+            )
+
+        for key, value in self.totals().items():
+            print(f"{key}: {value:.4f}")
+
+    def _stats(self, operator: Operator) -> Dict[str, float]:
+        name = type(operator).__name__
+
+        if name not in self._operators:
+            self._operators[name] = {
+                "calls": 0,
+                "call_time": 0.0,
+                "forward_calls": 0,
+                "forward_time": 0.0,
+                "backward_calls": 0,
+                "backward_time": 0.0,
+            }
+
+        return self._operators[name]
+
+    def _patch(self, owner, name: str, wrap: Callable) -> None:
+        original = getattr(owner, name)
+        self._patches.append((owner, name, original))
+        setattr(owner, name, wrap(original))
+
+    def _timed_operator(self, kind: str) -> Callable:
+        def wrap(method: Callable) -> Callable:
+            def timed(operator, *args, **kwargs):
+                # Nested calls, like Linear.forward calling Dot.forward, are
+                # attributed to the outermost operator only
+                if self._depth > 0 and kind != "call":
+                    return method(operator, *args, **kwargs)
+
+                self._depth += kind != "call"
+                start = time.perf_counter()
+
+                try:
+                    return method(operator, *args, **kwargs)
+                finally:
+                    stats = self._stats(operator)
+                    stats[f"{kind}_time"] += time.perf_counter() - start
+                    stats["calls" if kind == "call" else f"{kind}_calls"] += 1
+                    self._depth -= kind != "call"
+
+            return timed
+
+        return wrap
+
+    def _counted(self, key: str) -> Callable:
+        def wrap(init: Callable) -> Callable:
+            def counted(instance, *args, **kwargs):
+                self._allocations[key] += 1
+                init(instance, *args, **kwargs)
+
+            return counted
+
+        return wrap
+
+    def _timed_graph(self, create_scalar_graph: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            graph = create_scalar_graph(*args, **kwargs)
+            self._graphs["time"] += time.perf_counter() - start
+            self._graphs["calls"] += 1
+            self._graphs["nodes"].append(len(graph))
+            return graph
+
+        return timed
+
+    def _timed_update(self, update: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            update(*args, **kwargs)
+            self._updates["time"] += time.perf_counter() - start
+            self._updates["calls"] += 1
+
+        return timed
+
+    def __enter__(self) -> "Profiler":
+        global _active
+
+        assert _active is None, "Only one Profiler can be active at a time"
+        _active = self
+
+        self._patch(Operator, "__call__", self._timed_operator("call"))
+        self._patch(Operator, "__init__", self._counted("operators"))
+        self._patch(Scalar, "__init__", self._counted("scalars"))
+
+        for cls in _operator_classes():
+            for kind in ("forward", "backward"):
+                if kind in cls.__dict__:
+                    self._patch(cls, kind, self._timed_operator(kind))
+
+        self._patch(training, "create_scalar_graph", self._timed_graph)
+        self._patch(tape, "create_scalar_graph", self._timed_graph)
+        self._patch(training, "_update", self._timed_update)
+        self._patch(Optimizer, "apply", self._timed_update)
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        global _active
+
+        if not self.active:
+            return
+
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            setattr(owner, name, original)
+
+        self._depth = 0
+        _active = None
+
+
+class ProfilerCallback(Callback):
+    def __init__(self) -> None:
+        """Profiles every epoch of training.
+
+        The totals of each epoch are added to the metrics passed to the
+        callbacks that follow, so a ConsoleLogger placed after this callback
+        logs them. They are not added to the history of the model.
+        """
+
+        super().__init__(name="profiler")
+
+        self._profiler = Profiler()
+        self._reports: List[dict] = []
+
+    @property
+    def reports(self) -> List[dict]:
+        "Report of every epoch"
+
+        return self._reports
+
+    def on_epoch_start(self, epoch: int):
+        # An epoch that raised leaves the profiler active until training ends
+        self._profiler.__exit__()
+        self._profiler.reset()
+        self._profiler.__enter__()
+
+    def on_epoch_end(self, epoch: int, metrics: dict):
+        self._profiler.__exit__()
+        self._reports.append(self._profiler.report())
+        metrics.update(self._profiler.totals())
+
+    def on_training_end(self, epoch: int, metrics: dict):
+        self._profiler.__exit__()
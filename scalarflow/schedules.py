@@ -0,0 +1,74 @@
+import math
+
+
+class Schedule:
+    def __init__(self, name: str) -> None:
+        """Learning rate as a function of the number of optimisation steps taken."""
+
+        self._name = name
+
+    def __repr__(self) -> str:
+        return f"Schedule(name={self._name})"
+
+    def __call__(self, step: int) -> float:
+        raise NotImplementedError("Method '__call__' not implemented")
+
+
+class Constant(Schedule):
+    def __init__(self, lr: float) -> None:
+        super().__init__(name="constant")
+
+        self._lr = lr
+
+    def __call__(self, step: int) -> float:
+        return self._lr
+
+
+class StepDecay(Schedule):
+    def __init__(self, lr: float, step_size: int, factor: float = 0.1) -> None:
+        """Multiplies the learning rate by factor every step_size steps."""
+
+        super().__init__(name="step_decay")
+
+        self._lr = lr
+        self._step_size = step_size
+        self._factor = factor
+
+    def __call__(self, step: int) -> float:
+        return self._lr * self._factor ** (step // self._step_size)
+
+
+class CosineDecay(Schedule):
+    def __init__(self, lr: float, decay_steps: int, alpha: float = 0.0) -> None:
+        """Decays the learning rate from lr to alpha * lr along a half cosine
+        over decay_steps, and keeps it at alpha * lr afterwards.
+        """
+
+        super().__init__(name="cosine_decay")
+
+        self._lr = lr
+        self._decay_steps = decay_steps
+        self._alpha = alpha
+
+    def __call__(self, step: int) -> float:
+        progress = min(step, self._decay_steps) / self._decay_steps
+        cosine = 0.5 * (1 + math.cos(math.pi * progress))
+        return self._lr * ((1 - self._alpha) * cosine + self._alpha)
+
+
+class Warmup(Schedule):
+    def __init__(self, schedule: Schedule, warmup_steps: int) -> None:
+        """Linearly increases the learning rate to schedule(0) over warmup_steps,
+        then follows schedule, starting from its step 0.
+        """
+
+        super().__init__(name="warmup")
+
+        self._schedule = schedule
+        self._warmup_steps = warmup_steps
+
+    def __call__(self, step: int) -> float:
+        if step < self._warmup_steps:
+            return self._schedule(0) * (step + 1) / self._warmup_steps
+
+        return self._schedule(step - self._warmup_steps)
@@ -0,0 +1,153 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from scalarflow.core.parameter import ParameterBuffer
+from scalarflow.layers import ACTIVATIONS, Dense, activation_name
+
+MAGIC = b"SFLW"
+FORMAT_VERSION = 1
+
+# Magic, format version and length of the JSON header in bytes
+_PREAMBLE = struct.Struct("<4sII")
+
+
+def _payload_offset(header_length: int) -> int:
+    # Payload starts at the next multiple of 8 bytes, so it can be read as doubles
+    return -(-(_PREAMBLE.size + header_length) // 8) * 8
+
+
+def save(path: str, layers: Tuple[Dense], buffer: ParameterBuffer) -> None:
+    """Writes the shapes and activations of layers, and the values of buffer, to path.
+
+    The file is a fixed preamble, a JSON header describing every Dense layer
+    and a payload of little-endian float64 parameter values in buffer order.
+    It is written to a temporary file first and then renamed, so an
+    interrupted save never leaves a truncated file at path.
+
+    Raises:
+        ValueError if an activation is not registered in
+        scalarflow.layers.ACTIVATIONS.
+    """
+
+    header = json.dumps(
+        {
+            "layers": [_layer_config(layer) for layer in layers],
+            "num_parameters": len(buffer),
+        }
+    ).encode("utf-8")
+
+    payload = array("d", buffer.data)
+
+    if sys.byteorder == "big":
+        payload.byteswap()
+
+    offset = _payload_offset(len(header))
+    temporary_path = f"{path}.tmp"
+
+    with open(temporary_path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        file.write(header)
+        file.write(b"\0" * (offset - _PREAMBLE.size - len(header)))
+        file.write(payload.tobytes())
+
+    os.replace(temporary_path, path)
+
+
+def _layer_config(layer: Dense) -> dict:
+    return {
+        "input_dim": layer.input_dim,
+        "output_dim": layer.output_dim,
+        "activation": activation_name(layer.activation),
+    }
+
+
+@contextmanager
+def _open(path: str) -> Iterator[Tuple[dict, memoryview]]:
+    """Memory-maps a saved model, yields its header and a view of its payload."""
+
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if len(mapped) < _PREAMBLE.size:
+            raise ValueError(f"{path} is not a saved scalarflow model")
+
+        magic, version, header_length = _PREAMBLE.unpack_from(mapped)
+
+        if magic != MAGIC or version > FORMAT_VERSION:
+            raise ValueError(
+                f"{path} is not a saved scalarflow model of format version {FORMAT_VERSION} or older"
+            )
+
+        header = json.loads(mapped[_PREAMBLE.size : _PREAMBLE.size + header_length])
+        offset = _payload_offset(header_length)
+
+        with memoryview(mapped) as view:
+            with view[offset : offset + 8 * header["num_parameters"]] as payload:
+                yield header, payload
+
+
+def load_layers(path: str) -> List[Dense]:
+    """Returns new Dense layers with the shapes and activations saved at path.
+
+    Raises:
+        ValueError if the file is not a saved model, or an activation is
+        not registered in scalarflow.layers.ACTIVATIONS.
+    """
+
+    with _open(path) as (header, _):
+        configs = header["layers"]
+
+    for config in configs:
+        if config["activation"] not in ACTIVATIONS:
+            raise ValueError(
+                f"Activation {config['activation']} is not registered in scalarflow.layers.ACTIVATIONS"
+            )
+
+    return [
+        Dense(
+            output_dim=config["output_dim"],
+            input_dim=config["input_dim"],
+            activation=ACTIVATIONS[config["activation"]],
+        )
+        for config in configs
+    ]
+
+
+def load_parameters(path: str, layers: Tuple[Dense], buffer: ParameterBuffer) -> None:
+    """Overwrites the values of buffer with the parameters saved at path.
+
+    The payload is memory-mapped and copied into buffer in one go, without
+    creating a float object per parameter.
+
+    Args:
+        path: Path of a file written by save
+        layers: Layers bound to buffer, that must match the saved layers
+        buffer: ParameterBuffer to write the saved values into
+
+    Raises:
+        ValueError if the file is not a saved model, the saved layers do
+        not match layers, or the payload is truncated.
+    """
+
+    with _open(path) as (header, payload):
+        if header["layers"] != [_layer_config(layer) for layer in layers]:
+            raise ValueError(f"Layers saved at {path} do not match the model")
+
+        if len(payload) != 8 * len(buffer) or header["num_parameters"] != len(buffer):
+            raise ValueError(
+                f"{path} holds {len(payload) // 8} parameter values, expected {len(buffer)}"
+            )
+
+        if sys.byteorder == "big":
+            values = array("d")
+            values.frombytes(payload)
+            values.byteswap()
+            buffer.restore(values.tobytes())
+        else:
+            buffer.restore(payload)
@@ -0,0 +1,385 @@
+"""Serves predictions of a trained MLP over HTTP or stdin.
+
+python -m scalarflow.serving model.sf --port 8000
+python -m scalarflow.serving model.sf --stdin
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import deque
+from typing import IO, Callable, Deque, List, Optional, Tuple
+
+from scalarflow.models import MLP
+from scalarflow.types import ScalarLike
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    "Nearest-rank percentile of values, q between 0 and 100"
+
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = math.ceil(q / 100 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+class BatchPredictor:
+    def __init__(
+        self,
+        predict: Callable[[List[Tuple[ScalarLike]]], List[float]],
+        max_batch_size: int = 32,
+        max_latency: float = 0.002,
+        window: int = 10_000,
+    ) -> None:
+        """Coalesces concurrent prediction requests into batches.
+
+        Requests are queued, and a batch is predicted once max_batch_size
+        examples are waiting, or max_latency seconds after the first example
+        of the batch arrived. Predictions run in a worker thread, so the
+        event loop keeps accepting requests while a batch is computed.
+
+        Args:
+            predict: Maps a batch of examples to their predictions, like
+                MLP.predict
+            max_batch_size: Largest number of examples predicted at a time
+            max_latency: Longest time in seconds an example waits for others
+                to join its batch
+            window: Number of most recent requests latency percentiles are
+                computed from
+        """
+
+        self._predict = predict
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._requests = 0
+        self._batches = 0
+        self._started = time.perf_counter()
+
+    def __repr__(self) -> str:
+        return f"BatchPredictor(max_batch_size={self._max_batch_size}, max_latency={self._max_latency})"
+
+    def start(self) -> None:
+        "Starts coalescing requests, must be called from a running event loop"
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        self._started = time.perf_counter()
+
+    async def stop(self) -> None:
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def predict(self, example: Tuple[ScalarLike]) -> float:
+        "Returns the prediction for one example, once its batch is computed"
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((example, future, time.perf_counter()))
+        return await future
+
+    async def _next_batch(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self._max_latency
+
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - time.perf_counter()
+
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._next_batch()
+
+            try:
+                results = await loop.run_in_executor(
+                    None, self._predict, [example for example, _, _ in batch]
+                )
+            except Exception as error:
+                # One malformed example fails its whole batch, so the others
+                # are predicted one by one
+                results = (
+                    [error]
+                    if len(batch) == 1
+                    else [
+                        await self._predict_one(loop, example)
+                        for example, _, _ in batch
+                    ]
+                )
+
+            finished = time.perf_counter()
+            self._batches += 1
+
+            for (_, future, received), result in zip(batch, results):
+                if future.done():
+                    continue
+
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                    continue
+
+                self._requests += 1
+                self._latencies.append(finished - received)
+                future.set_result(result)
+
+    async def _predict_one(
+        self, loop: asyncio.AbstractEventLoop, example: Tuple[ScalarLike]
+    ) -> float | Exception:
+        try:
+            return (await loop.run_in_executor(None, self._predict, [example]))[0]
+        except Exception as error:
+            return error
+
+    def stats(self) -> dict:
+        """Returns counters of the requests served so far.
+
+        Returns:
+            Dictionary with the number of requests and batches, the mean
+            batch size, the p50 and p99 latency in seconds of recent
+            requests, and the throughput in requests per second
+        """
+
+        latencies = list(self._latencies)
+
+        return {
+            "requests": self._requests,
+            "batches": self._batches,
+            "mean_batch_size": self._requests / self._batches if self._batches else 0.0,
+            "p50_latency": percentile(latencies, 50),
+            "p99_latency": percentile(latencies, 99),
+            "throughput": self._requests / (time.perf_counter() - self._started),
+        }
+
+
+def _examples(body) -> Tuple[List[Tuple[float]], bool]:
+    """Parses a request body into examples, and whether it held a single example."""
+
+    if isinstance(body, dict):
+        if "inputs" in body:
+            return [tuple(body["inputs"])], True
+        if "examples" in body:
+            return [tuple(example) for example in body["examples"]], False
+
+    raise ValueError('Expected a JSON object with "inputs" or "examples"')
+
+
+class Server:
+    def __init__(
+        self, model: MLP, max_batch_size: int = 32, max_latency: float = 0.002
+    ) -> None:
+        """Serves predictions of a model, coalescing concurrent requests into batches.
+
+        Predictions use MLP.predict, which computes plain floats without
+        building a graph.
+
+        HTTP endpoints:
+            POST /predict with {"inputs": [...]} returns {"prediction": ...},
+                and with {"examples": [[...], ...]} returns {"predictions": [...]}
+            GET /stats returns the counters of BatchPredictor.stats
+
+        Args:
+            model: Trained model
+            max_batch_size: Largest number of examples predicted at a time
+            max_latency: Longest time in seconds an example waits for others
+                to join its batch
+        """
+
+        self._model = model
+        self._predictor = BatchPredictor(
+            predict=model.predict,
+            max_batch_size=max_batch_size,
+            max_latency=max_latency,
+        )
+
+    @property
+    def predictor(self) -> BatchPredictor:
+        return self._predictor
+
+    async def handle(self, body) -> dict:
+        "Returns the response to a parsed request body"
+
+        examples, single = _examples(body)
+        predictions = await asyncio.gather(
+            *(self._predictor.predict(example) for example in examples)
+        )
+
+        if single:
+            return {"prediction": predictions[0]}
+        return {"predictions": list(predictions)}
+
+    async def _respond(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "Use GET for /stats"}
+            return 200, self._predictor.stats()
+
+        if path != "/predict":
+            return 404, {"error": f"Unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST for /predict"}
+
+        try:
+            return 200, await self.handle(json.loads(body))
+        except (ValueError, TypeError, AssertionError) as error:
+            return 400, {"error": str(error) or type(error).__name__}
+        except Exception as error:
+            # Any other failure of the model still gets a response
+            return 500, {"error": f"Prediction failed: {type(error).__name__}"}
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+
+                if not request_line.strip():
+                    break
+
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+
+                while True:
+                    line = await reader.readline()
+
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, response = await self._respond(method, path, body)
+                payload = json.dumps(response).encode("utf-8")
+
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        """Starts the HTTP server, port 0 picks a free port.
+
+        Returns:
+            asyncio.Server, whose sockets hold the bound address
+        """
+
+        self._predictor.start()
+        return await asyncio.start_server(self._connection, host=host, port=port)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        server = await self.start(host=host, port=port)
+
+        async with server:
+            await server.serve_forever()
+
+    async def serve_stream(self, input: IO[str], output: IO[str]) -> None:
+        """Answers one JSON request per line of input with one JSON line on output.
+
+        Requests are handled concurrently, so they can share batches, and
+        responses are written as they complete. An "id" field of a request
+        is copied to its response.
+        """
+
+        loop = asyncio.get_running_loop()
+        self._predictor.start()
+        pending = set()
+
+        async def answer(line: str) -> None:
+            try:
+                body = json.loads(line)
+                response = await self.handle(body)
+
+                if isinstance(body, dict) and "id" in body:
+                    response["id"] = body["id"]
+            except (ValueError, TypeError, AssertionError) as error:
+                response = {"error": str(error) or type(error).__name__}
+            except Exception as error:
+                response = {"error": f"Prediction failed: {type(error).__name__}"}
+
+            output.write(json.dumps(response) + "\n")
+            output.flush()
+
+        while True:
+            line = await loop.run_in_executor(None, input.readline)
+
+            if not line:
+                break
+            if not line.strip():
+                continue
+
+            task = loop.create_task(answer(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending)
+
+        await self._predictor.stop()
+
+
+def main(arguments: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scalarflow.serving")
+    parser.add_argument("model", help="Path of a model saved with MLP.save")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--stdin", action="store_true", help="Read JSON lines from stdin instead"
+    )
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-latency", type=float, default=0.002, help="In seconds")
+    options = parser.parse_args(arguments)
+
+    server = Server(
+        model=MLP.load(options.model),
+        max_batch_size=options.max_batch_size,
+        max_latency=options.max_latency,
+    )
+
+    if options.stdin:
+        asyncio.run(server.serve_stream(input=sys.stdin, output=sys.stdout))
+    else:
+        asyncio.run(server.serve(host=options.host, port=options.port))
+
+
+if __name__ == "__main__":
+    main()
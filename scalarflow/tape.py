@@ -0,0 +1,172 @@
+from typing import Callable, Dict, Optional, Tuple
+
+from scalarflow.core.operator import Operator
+from scalarflow.core.scalar import Scalar
+from scalarflow.passes import optimise_graph
+from scalarflow.training import create_scalar_graph
+from scalarflow.types import ScalarLike
+
+
+class Tape:
+    def __init__(
+        self,
+        model: Callable,
+        loss_fn: Callable,
+        input_dim: int,
+        batch_size: int,
+        optimise: bool = False,
+    ) -> None:
+        """Graph of a model and its loss, recorded once and replayed for every batch.
+
+        The model and loss are traced on placeholder Scalars for the inputs and
+        labels. The traced graph is flattened into a table of Scalar slots and a
+        list of Operator instructions in execution order, so a training step
+        only rebinds the input and label slots and replays the instructions,
+        without allocating new Scalars or sorting the graph again.
+
+        Args:
+            model: Callable that maps a tuple of input Scalars to a prediction
+            loss_fn: Loss function, called with labels and predictions
+            input_dim: Number of inputs per example
+            batch_size: Number of examples per batch
+            optimise: Whether to run passes.optimise_graph on the traced graph
+                before flattening it
+        """
+
+        self._input_dim = input_dim
+        self._batch_size = batch_size
+
+        inputs = [
+            tuple(Scalar(data=0.0) for _ in range(0, input_dim))
+            for _ in range(0, batch_size)
+        ]
+        labels = tuple(Scalar(data=0.0) for _ in range(0, batch_size))
+        predictions = [model(inputs=example) for example in inputs]
+
+        self._loss: Scalar = loss_fn(labels, predictions)
+        self._report: Optional[Dict[str, int]] = None
+
+        if optimise:
+            self._report = optimise_graph(
+                root=self._loss,
+                variables=[scalar for example in inputs for scalar in example]
+                + list(labels),
+                outputs=predictions,
+            )
+
+        graph = create_scalar_graph(root=self._loss)
+
+        self._slots: Tuple[Scalar] = tuple(
+            op_or_scalar for op_or_scalar in graph if isinstance(op_or_scalar, Scalar)
+        )
+        self._instructions: Tuple[Operator] = tuple(
+            op_or_scalar
+            for op_or_scalar in reversed(graph)
+            if isinstance(op_or_scalar, Operator)
+        )
+
+        self._results: Tuple[Scalar] = tuple(
+            operator.result for operator in self._instructions
+        )
+
+        slot_index = dict(
+            (id(scalar), index) for index, scalar in enumerate(self._slots)
+        )
+
+        self._input_slots = tuple(
+            slot_index.get(id(scalar)) for example in inputs for scalar in example
+        )
+        self._label_slots = tuple(slot_index.get(id(label)) for label in labels)
+        self._prediction_slots = tuple(
+            slot_index[id(prediction)] for prediction in predictions
+        )
+        self._parameters: Tuple[Scalar] = tuple(
+            scalar for scalar in self._slots if scalar.trainable
+        )
+
+    def __repr__(self) -> str:
+        return f"Tape(input_dim={self._input_dim}, batch_size={self._batch_size}, num_instructions={len(self._instructions)})"
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def loss(self) -> Scalar:
+        return self._loss
+
+    @property
+    def parameters(self) -> Tuple[Scalar]:
+        return self._parameters
+
+    @property
+    def report(self) -> Optional[Dict[str, int]]:
+        """Node counts of passes.optimise_graph, if the tape was optimised."""
+
+        return self._report
+
+    @property
+    def predictions(self) -> Tuple[float]:
+        """Predictions of the batch that was last replayed."""
+
+        return tuple(self._slots[slot]._data for slot in self._prediction_slots)
+
+    def bind(
+        self, examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike]
+    ) -> None:
+        """Writes a batch of examples and labels into the input and label slots.
+
+        Inputs that do not affect the loss have no slot and are skipped.
+        """
+
+        assert (
+            len(examples) == self._batch_size and len(labels) == self._batch_size
+        ), f"Tape was recorded for a batch size of {self._batch_size}"
+
+        values = [Scalar.make_float(value) for example in examples for value in example]
+
+        for slot, value in zip(self._input_slots, values):
+            if slot is not None:
+                self._slots[slot]._data = value
+
+        for slot, label in zip(self._label_slots, labels):
+            if slot is not None:
+                self._slots[slot]._data = Scalar.make_float(label)
+
+    def forward(self) -> float:
+        for operator, result in zip(self._instructions, self._results):
+            result._data = operator.forward()
+
+        return self._loss._data
+
+    def backward(self) -> None:
+        for scalar in self._slots:
+            scalar._gradient = 0.0
+
+        self._loss._gradient = 1.0
+
+        for operator in reversed(self._instructions):
+            operator.backward()
+
+    def gradients(
+        self, examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike]
+    ) -> float:
+        """Computes the gradients of all parameters for a batch and returns the loss."""
+
+        self.bind(examples=examples, labels=labels)
+        loss = self.forward()
+        self.backward()
+
+        return loss
+
+    def step(
+        self, examples: Tuple[Tuple[ScalarLike]], labels: Tuple[ScalarLike], lr: float
+    ) -> float:
+        """Runs one training step on a batch and returns the loss."""
+
+        loss = self.gradients(examples=examples, labels=labels)
+
+        for parameter in self._parameters:
+            parameter._data -= lr * parameter._gradient
+
+        return loss
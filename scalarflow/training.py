@@ -1,56 +1,151 @@
-from typing import Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 from scalarflow.core.operator import Operator
 from scalarflow.core.scalar import Scalar
 
 
+def _children(op_or_scalar: Union[Scalar, Operator]) -> Tuple[Optional[Scalar]]:
+    if isinstance(op_or_scalar, Operator):
+        if op_or_scalar._arguments is None:
+            raise RuntimeError(
+                "Trying to go through a graph a second time, but it was freed "
+                "after backward, pass retain_graph=True to keep it"
+            )
+        return op_or_scalar._arguments
+    if isinstance(op_or_scalar, Scalar):
+        return (op_or_scalar.operator,)
+
+    raise TypeError(
+        f"_root can only be either Scalar or Operator, not of type {type(op_or_scalar)}"
+    )
+
+
 def create_scalar_graph(root: Scalar) -> Tuple[Scalar]:
-    visited = []
-    op_or_scalar = []
+    """Topologically sorts the graph that resulted in root.
+
+    The traversal is a depth-first search using an explicit stack, so deep
+    graphs do not hit the recursion limit, and visited nodes are tracked in a
+    set of object ids, so the sort is linear in the size of the graph.
 
-    def _build(_root: Union[Scalar, Operator]):
-        if _root not in visited and _root is not None:
-            visited.append(_root)
+    Args:
+        root: Scalar at the end of the graph, usually the loss
 
-            if isinstance(_root, Operator):
-                children = _root.arguments
-            elif isinstance(_root, Scalar):
-                children = [_root.operator]
-            else:
-                raise TypeError(
-                    f"_root can only be either Scalar or Operator, not of type {type(_root)}"
-                )
+    Returns:
+        Tuple of Scalars and Operators starting at root, where every item
+        appears before the items it was computed from
 
-            for child in children:
-                _build(child)
+    Raises:
+        RuntimeError if the graph was released by a previous backward.
+    """
 
+    if root is None:
+        return ()
+
+    visited = {id(root)}
+    op_or_scalar = []
+    stack = [(root, iter(_children(root)))]
+
+    while stack:
+        _root, children = stack[-1]
+
+        for child in children:
+            if child is not None and id(child) not in visited:
+                visited.add(id(child))
+                stack.append((child, iter(_children(child))))
+                break
+        else:
+            stack.pop()
             op_or_scalar.append(_root)
 
-    _build(root)
     return tuple(reversed(op_or_scalar))
 
 
-def backward(graph: Tuple[Scalar]) -> None:
+def backward(graph: Tuple[Scalar], retain_graph: bool = False) -> None:
+    """Runs backward of every Operator of a graph sorted by create_scalar_graph.
+
+    Args:
+        graph: Topologically sorted graph
+        retain_graph: Set to keep the graph, by default the edges between its
+            Scalars and Operators are released afterwards, so intermediate
+            Scalars are freed as soon as nothing else references them and a
+            second backward through the same graph raises a RuntimeError
+    """
+
     for op_or_scalar in graph:
         if isinstance(op_or_scalar, Operator):
             op_or_scalar.backward()
 
+    if not retain_graph:
+        release_graph(graph=graph)
 
-def optimisation_step(root: Scalar, lr: float) -> None:
-    graph = create_scalar_graph(root=root)
+
+def release_graph(graph: Tuple[Scalar]) -> None:
+    """Detaches every Operator of a graph from its arguments.
+
+    Scalars keep their Operator, whose missing arguments mark the graph as
+    released, so going through it again raises instead of treating computed
+    Scalars as leaves.
+    """
 
     for op_or_scalar in graph:
-        if isinstance(op_or_scalar, Scalar):
-            op_or_scalar.gradient = 0.0
+        if isinstance(op_or_scalar, Operator):
+            op_or_scalar._arguments = None
 
-    root.gradient = 1.0
 
-    backward(graph=graph)
+def compute_gradients(root: Scalar, retain_graph: bool = False) -> List[Scalar]:
+    """Backpropagates from root, after zeroing the gradients of the whole graph.
 
-    for op_or_scalar in graph:
-        if isinstance(op_or_scalar, Scalar):
-            if op_or_scalar.trainable:
-                op_or_scalar.data = op_or_scalar.data - lr * op_or_scalar.gradient
+    Args:
+        root: Scalar to backpropagate from
+        retain_graph: Set to keep the graph for another backward pass
+
+    Returns:
+        List of all Scalars in the graph
+    """
+
+    graph = create_scalar_graph(root=root)
+    scalars = [
+        op_or_scalar for op_or_scalar in graph if isinstance(op_or_scalar, Scalar)
+    ]
+
+    for scalar in scalars:
+        scalar._gradient = 0.0
+
+    root._gradient = 1.0
+
+    backward(graph=graph, retain_graph=retain_graph)
+
+    return scalars
+
+
+def accumulate_gradients(
+    root: Scalar, gradient: float = 1.0, retain_graph: bool = False
+) -> None:
+    """Backpropagates from root, adding to the existing gradients of all leaves.
+
+    Unlike compute_gradients, nothing is zeroed, so this expects every
+    intermediate Scalar of the graph to be freshly computed, which is the case
+    for a new forward pass. Gradients of parameters keep accumulating until
+    they are explicitly zeroed.
+
+    Args:
+        root: Scalar to backpropagate from
+        gradient: Gradient of root, scales every accumulated gradient
+        retain_graph: Set to keep the graph for another backward pass
+    """
+
+    root._gradient = gradient
+    backward(graph=create_scalar_graph(root=root), retain_graph=retain_graph)
+
+
+def _update(scalars: List[Scalar], lr: float) -> None:
+    for scalar in scalars:
+        if scalar._trainable:
+            scalar._data -= lr * scalar._gradient
+
+
+def optimisation_step(root: Scalar, lr: float, retain_graph: bool = False) -> None:
+    _update(scalars=compute_gradients(root=root, retain_graph=retain_graph), lr=lr)
 
 
 def accuracy(
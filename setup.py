@@ -17,8 +17,11 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/am1tyadav/scalarflow.git",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(
+        exclude=("benchmarks", "benchmarks.*", "tests", "tests.*")
+    ),
     install_requires=install_requires,
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
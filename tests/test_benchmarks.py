@@ -0,0 +1,33 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.suites import SUITES
+
+
+def test_benchmarks_write_json(tmp_path):
+    # Smallest possible run of every suite, only checks the report
+
+    path = str(tmp_path / "results.json")
+    main(
+        [
+            "--json",
+            path,
+            "--repeat",
+            "1",
+            "--iterations",
+            "1",
+            "--graph-batch-sizes",
+            "1",
+            "--batch-size",
+            "2",
+            "--num-examples",
+            "4",
+        ]
+    )
+
+    with open(path) as file:
+        report = json.load(file)
+
+    assert set(result["suite"] for result in report["results"]) == set(SUITES)
+    assert all(result["seconds"] >= 0 for result in report["results"])
+    assert report["options"]["batch_size"] == 2
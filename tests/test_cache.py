@@ -0,0 +1,166 @@
+import os
+import random
+
+import pytest
+
+from scalarflow.cache import GraphCache, architecture_key
+from scalarflow.compiler import clear_cache, compile_code
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import multiply, relu, sigmoid
+
+EXAMPLES = ((0.5, -1.0), (1.0, 2.0), (-0.25, 0.25), (0.1, 0.9))
+LABELS = (1.0, 0.0, 0.5, -1.0)
+
+
+def make_model(activation=relu) -> MLP:
+    random.seed(0)
+    return MLP(
+        layers=(
+            Dense(output_dim=3, input_dim=2, activation=activation),
+            Dense(output_dim=1, input_dim=3),
+        )
+    )
+
+
+def test_architecture_key():
+    layers = make_model()._layers
+    key = architecture_key(layers, mean_squared_error, batch_size=4)
+
+    assert key == architecture_key(make_model()._layers, mean_squared_error, 4)
+    assert key != architecture_key(make_model(sigmoid)._layers, mean_squared_error, 4)
+    assert key != architecture_key(layers, mean_squared_error, batch_size=2)
+    assert key != architecture_key(layers, mean_squared_error, 4, optimise=True)
+    assert architecture_key(layers, lambda labels, predictions: 0.0, 4) is None
+
+
+def test_graph_cache_round_trip(tmp_path):
+    cache = GraphCache(directory=str(tmp_path / "graphs"))
+    source = "def forward(p, x, y):\n    return 1.0, ()\n"
+
+    assert cache.get("key") is None
+
+    cache.put("key", source, compile_code(source))
+    loaded_source, code = cache.get("key")
+    namespace = {}
+    exec(code, namespace)
+
+    assert loaded_source == source
+    assert namespace["forward"](None, None, None) == (1.0, ())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_graph_cache_ignores_corrupt_entries(tmp_path):
+    cache = GraphCache(directory=str(tmp_path))
+    source = "x = 1\n"
+    cache.put("key", source, compile_code(source))
+
+    path = tmp_path / "key.sfgc"
+    path.write_bytes(path.read_bytes()[:20])
+
+    assert cache.get("key") is None
+    assert not path.exists()
+
+
+def test_graph_cache_evicts_least_recently_used(tmp_path):
+    cache = GraphCache(directory=str(tmp_path))
+    source = "x = 1\n" * 100
+
+    for index, key in enumerate(("a", "b")):
+        cache.put(key, source, compile_code(source))
+        os.utime(tmp_path / f"{key}.sfgc", (index, index))
+
+    # Reading a marks it as recently used, so b is evicted for c
+    cache._max_bytes = cache.size()
+    cache.get("a")
+    cache.put("c", source, compile_code(source))
+
+    assert sorted(os.listdir(tmp_path)) == ["a.sfgc", "c.sfgc"]
+
+
+def test_compiled_engine_loads_graphs_from_cache(tmp_path, monkeypatch):
+    cache = GraphCache(directory=str(tmp_path))
+    histories = []
+
+    for _ in range(2):
+        clear_cache()
+        model = make_model()
+        model.compile(
+            loss_fn=mean_squared_error, lr=0.1, engine="compiled", graph_cache=cache
+        )
+        histories.append(model.fit(EXAMPLES, LABELS, epochs=2, batch_size=4)["loss"])
+
+        # The second model must not trace its graph
+        monkeypatch.setattr(MLP, "_trace", None)
+
+    assert histories[1] == histories[0]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_compiled_engine_without_key_skips_cache(tmp_path):
+    cache = GraphCache(directory=str(tmp_path))
+    model = make_model()
+    model.compile(
+        loss_fn=lambda labels, predictions: mean_squared_error(labels, predictions),
+        lr=0.1,
+        engine="compiled",
+        graph_cache=cache,
+    )
+    model.fit(EXAMPLES, LABELS, epochs=1, batch_size=4)
+
+    assert cache.size() == 0
+    assert cache.misses == 0
+
+
+def test_default_directory(monkeypatch):
+    monkeypatch.setenv("SCALARFLOW_CACHE_DIR", "/tmp/scalarflow-graphs")
+
+    assert GraphCache().directory == "/tmp/scalarflow-graphs"
+
+
+def test_architecture_key_tells_same_named_losses_apart():
+    # Like `loss` in two scripts, or in one script before and after an edit
+    def make_loss(scale):
+        def loss(labels, predictions):
+            return multiply(mean_squared_error(labels, predictions), scale)
+
+        return loss
+
+    def loss(labels, predictions):
+        return mean_squared_error(labels, predictions)
+
+    layers = make_model()._layers
+    losses = [make_loss(1.0), make_loss(100.0), loss]
+
+    for function in losses:
+        function.__qualname__ = "loss"
+
+    keys = [architecture_key(layers, function, batch_size=4) for function in losses]
+
+    assert None not in keys
+    assert len(set(keys)) == 3
+    assert keys[0] == architecture_key(layers, losses[0], batch_size=4)
+
+
+def test_compiled_engine_misses_for_same_named_losses(tmp_path):
+    def make_loss(scale):
+        def loss(labels, predictions):
+            return multiply(mean_squared_error(labels, predictions), scale)
+
+        loss.__qualname__ = "loss"
+        return loss
+
+    cache = GraphCache(directory=str(tmp_path))
+    losses = []
+
+    for scale in (1.0, 100.0):
+        clear_cache()
+        model = make_model()
+        model.compile(
+            loss_fn=make_loss(scale), lr=0.0, engine="compiled", graph_cache=cache
+        )
+        losses.append(model.fit(EXAMPLES, LABELS, batch_size=4)["loss"][0])
+
+    assert cache.misses == 2
+    assert losses[1] == pytest.approx(100.0 * losses[0])
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from scalarflow.callbacks import (
+    Callback,
+    EarlyStopping,
+    ModelCheckpoint,
+    ReduceLROnPlateau,
+)
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+
+EXAMPLES = ((0.5, -1.0), (1.0, 2.0), (-0.25, 0.25), (0.0, 1.0))
+LABELS = (1.0, 0.0, 0.5, -1.0)
+
+
+def fit(callback: ModelCheckpoint, epochs: int = 4) -> MLP:
+    random.seed(0)
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+    model.compile(loss_fn=mean_squared_error, lr=0.05)
+    model.fit(EXAMPLES, LABELS, epochs=epochs, callbacks=(callback,))
+    return model
+
+
+def test_model_checkpoint_every_n_epochs(tmp_path):
+    fit(ModelCheckpoint(str(tmp_path / "model-{epoch}.sf"), every_n_epochs=2))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "model-1.sf",
+        "model-3.sf",
+    ]
+
+
+def test_model_checkpoint_best_metric(tmp_path):
+    # The loss decreases every epoch, so the last epoch is the best
+
+    path = str(tmp_path / "best.sf")
+    callback = ModelCheckpoint(path, monitor="loss")
+    model = fit(callback)
+
+    assert callback.best == model._history["loss"][-1]
+    assert min(model._history["loss"]) == callback.best
+    assert MLP.load(path).predict(EXAMPLES) == model.predict(EXAMPLES)
+
+    callback = ModelCheckpoint(path, monitor="loss", mode="max")
+    fit(callback)
+
+    assert callback.best == model._history["loss"][0]
+
+
+class Record(Callback):
+    def __init__(self, name: str, values: list) -> None:
+        super().__init__(name=name)
+
+        self._values = values
+
+    def on_epoch_end(self, epoch: int, metrics: dict):
+        metrics[self._name] = self._values[epoch]
+
+
+def test_early_stopping():
+    # Monitored values improve until epoch 2, then plateau
+
+    values = [3.0, 2.0, 1.0, 1.5, 0.99, 0.995, 2.0, 2.0]
+    callback = EarlyStopping(monitor="score", min_delta=0.1, patience=3)
+
+    random.seed(0)
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+    model.compile(loss_fn=mean_squared_error, lr=0.05)
+    history = model.fit(
+        EXAMPLES, LABELS, epochs=8, callbacks=(Record("score", values), callback)
+    )
+
+    assert history["epochs"] == [0, 1, 2, 3, 4, 5]
+    assert callback.stopped_epoch == 5
+    assert callback.best == 1.0
+
+
+def test_early_stopping_restores_best_weights():
+    # Raising the learning rate makes the loss diverge after the first epochs
+
+    class Diverge(Callback):
+        def on_epoch_end(self, epoch: int, metrics: dict):
+            if epoch == 1:
+                self._model.optimizer.lr = 10.0
+
+    random.seed(0)
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+    model.compile(loss_fn=mean_squared_error, lr=0.05)
+
+    callback = EarlyStopping(patience=2, restore_best_weights=True)
+    history = model.fit(
+        EXAMPLES,
+        LABELS,
+        epochs=20,
+        callbacks=(Diverge(name="diverge"), callback),
+    )
+
+    assert len(history["epochs"]) < 20
+    assert model.evaluate(EXAMPLES, LABELS)["loss"] < history["loss"][-1]
+
+
+def reduce_lr_on_plateau(values: list, **kwargs) -> list:
+    "Learning rate after every epoch of ReduceLROnPlateau monitoring values"
+
+    random.seed(0)
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+    model.compile(loss_fn=mean_squared_error, lr=0.1)
+
+    lrs = []
+
+    class RecordLR(Callback):
+        def on_epoch_end(self, epoch: int, metrics: dict):
+            lrs.append(self._model.optimizer.lr)
+
+    model.fit(
+        EXAMPLES,
+        LABELS,
+        epochs=len(values),
+        callbacks=(
+            Record("score", values),
+            ReduceLROnPlateau(monitor="score", factor=0.5, **kwargs),
+            RecordLR(name="record_lr"),
+        ),
+    )
+
+    return lrs
+
+
+def test_reduce_lr_on_plateau():
+    lrs = reduce_lr_on_plateau(
+        [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5, 0.5], patience=2, cooldown=1, min_lr=0.03
+    )
+
+    assert lrs == pytest.approx([0.1, 0.1, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03])
+
+
+def test_reduce_lr_on_plateau_cooldown_counts_improving_epochs():
+    # The improving third epoch is the first of the two cooldown epochs
+    lrs = reduce_lr_on_plateau([1.0, 1.0, 0.5, 0.5, 0.5], patience=1, cooldown=2)
+
+    assert lrs == pytest.approx([0.1, 0.05, 0.05, 0.05, 0.025])
@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from scalarflow import compiler
+from scalarflow.compiler import (
+    clear_cache,
+    compile_source,
+    compile_tape,
+    generate_source,
+)
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import binary_crossentropy_from_logits, mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import (
+    add,
+    add_n,
+    divide,
+    dot,
+    multiply,
+    power,
+    relu,
+    sigmoid,
+    softmax_crossentropy,
+    subtract,
+)
+from scalarflow.tape import Tape
+
+EXAMPLES = ((0.5, -1.0), (1.0, 2.0), (-0.25, 0.25))
+LABELS = (1.0, 0.0, 2.0)
+
+
+def make_model(activation=relu) -> MLP:
+    random.seed(0)
+    return MLP(
+        layers=(
+            Dense(output_dim=3, input_dim=2, activation=activation),
+            Dense(output_dim=1, input_dim=3),
+        )
+    )
+
+
+def every_operator_loss(labels, predictions):
+    # Exercises every operator that has a source, not a meaningful loss
+
+    logits = [sigmoid(prediction) for prediction in predictions]
+    scaled = divide(power(subtract(logits[0], labels[1]), 2), add(add_n(logits), 1.0))
+
+    return add_n(
+        [
+            softmax_crossentropy(logits=logits, label=labels[2]),
+            multiply(scaled, dot(logits[:2], (3.0, 2.0))),
+            binary_crossentropy_from_logits(labels[:2], predictions[:2]),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="loss_fn",
+    argvalues=(
+        mean_squared_error,
+        binary_crossentropy_from_logits,
+        every_operator_loss,
+    ),
+)
+def test_compiled_gradients_match_tape(loss_fn):
+    model = make_model()
+    tape = Tape(model=model, loss_fn=loss_fn, input_dim=2, batch_size=3)
+
+    loss = tape.gradients(EXAMPLES, LABELS)
+    gradients = list(model.buffer.gradients)
+    compiled_loss, predictions = compile_tape(tape).gradients(
+        model.buffer, EXAMPLES, LABELS
+    )
+
+    assert compiled_loss == pytest.approx(loss)
+    assert predictions == pytest.approx(tape.predictions)
+    assert list(model.buffer.gradients) == pytest.approx(gradients)
+    assert (
+        compile_tape(tape).forward(model.buffer, EXAMPLES, LABELS)[0] == compiled_loss
+    )
+
+
+def test_compiled_graphs_are_cached_by_topology():
+    tapes = [
+        Tape(model=model, loss_fn=mean_squared_error, input_dim=2, batch_size=3)
+        for model in (make_model(), make_model(), make_model(activation=sigmoid))
+    ]
+
+    assert compile_tape(tapes[0]) is compile_tape(tapes[1])
+    assert compile_tape(tapes[0]) is not compile_tape(tapes[2])
+
+
+def test_compile_rejects_trainable_scalars_outside_a_buffer():
+    weight = Scalar(data=1.0, trainable=True)
+    tape = Tape(
+        model=lambda inputs: multiply(weight, inputs[0]),
+        loss_fn=mean_squared_error,
+        input_dim=1,
+        batch_size=1,
+    )
+
+    with pytest.raises(ValueError):
+        generate_source(tape)
+
+
+def test_fit_with_compiled_engine_matches_tape():
+    histories = []
+
+    for engine in ("tape", "compiled"):
+        model = make_model()
+        model.compile(loss_fn=mean_squared_error, lr=0.05, engine=engine)
+        history = model.fit(EXAMPLES, LABELS, epochs=5, batch_size=2)
+        histories.append((history["loss"], list(model.buffer.data)))
+
+    assert histories[1][0] == pytest.approx(histories[0][0])
+    assert histories[1][1] == pytest.approx(histories[0][1])
+
+
+def test_compile_source_keeps_recent_graphs(monkeypatch):
+    monkeypatch.setattr(compiler, "CACHE_SIZE", 2)
+    clear_cache()
+    sources = [
+        f"def forward(p, x, y):\n    return {index}.0, ()\n"
+        "def gradients(p, g, x, y):\n    return forward(p, x, y)\n"
+        for index in range(3)
+    ]
+
+    first = compile_source(sources[0])
+    compile_source(sources[1])
+
+    assert compile_source(sources[0]) is first
+
+    compile_source(sources[2])
+
+    assert compile_source(sources[0]) is first
+    assert len(compiler._CACHE) == 2
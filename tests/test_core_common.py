@@ -10,3 +10,16 @@ def test_identifiable():
 
     with pytest.raises(SetPropertyNotAllowedError):
         identifiable.uuid = "new_id"
+
+
+def test_identifiable_uuid_is_lazy():
+    # uuid is only generated when read, and is stable afterwards
+
+    identifiable = Identifiable()
+
+    assert identifiable._uuid is None
+
+    uuid = identifiable.uuid
+
+    assert identifiable.uuid == uuid
+    assert Identifiable().uuid != uuid
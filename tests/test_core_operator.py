@@ -1,8 +1,21 @@
+import math
+
 import pytest
 
 from scalarflow.core.common import SetPropertyNotAllowedError
-from scalarflow.core.operator import Add, Operator, Subtract
+from scalarflow.core.operator import (
+    Add,
+    Dot,
+    Linear,
+    Operator,
+    Sigmoid,
+    SigmoidBinaryCrossEntropy,
+    SoftmaxCrossEntropy,
+    Subtract,
+    Sum,
+)
 from scalarflow.core.scalar import Scalar
+from scalarflow.operators import multiply
 
 
 def test_repr():
@@ -111,8 +124,7 @@ def test_add_forward_and_backward(
 
     assert output.data == forward_result
 
-    add._result = Scalar(trainable=True)
-    add._result.gradient = backward_result
+    output._gradient = backward_result
 
     add.backward()
 
@@ -134,10 +146,168 @@ def test_subtract_forward_and_backward(
 
     assert output.data == forward_result
 
-    subtract._result = Scalar(trainable=True)
-    subtract._result.gradient = backward_result
+    output._gradient = backward_result
 
     subtract.backward()
 
     assert subtract.arguments[0].gradient == backward_result
     assert subtract.arguments[1].gradient == backward_result * -1
+
+
+def test_sigmoid_forward_and_backward():
+    # Gradient of sigmoid at 0 is sigmoid(0) * (1 - sigmoid(0)) = 0.25
+
+    sigmoid = Sigmoid()
+    output = sigmoid(arguments=(0,))
+
+    assert output.data == 0.5
+
+    output.gradient = 1.0
+    sigmoid.backward()
+
+    assert sigmoid.arguments[0].gradient == 0.25
+
+
+def test_sigmoid_accepts_epsilon():
+    sigmoid = Sigmoid(epsilon=1e-7)
+
+    assert sigmoid(arguments=(0,)).data == 0.5
+
+
+def test_operators_have_no_instance_dict():
+    for operator in (Add(), Subtract(), Sigmoid()):
+        with pytest.raises(AttributeError):
+            operator.__dict__
+
+
+def test_sum_forward_and_backward():
+    a = Scalar(data=1.0)
+    b = Scalar(data=2.0)
+
+    total = Sum(num_arguments=4)
+    output = total(arguments=(a, b, 3, a))
+
+    assert output.data == 7.0
+
+    output.gradient = 2.0
+    total.backward()
+
+    assert a.gradient == 4.0
+    assert b.gradient == 2.0
+
+
+def test_dot_forward_and_backward():
+    weights = (Scalar(data=1.0), Scalar(data=2.0))
+    inputs = (Scalar(data=3.0), Scalar(data=-4.0))
+
+    dot = Dot(size=2)
+    output = dot(arguments=(*weights, *inputs))
+
+    assert output.data == -5.0
+
+    output.gradient = 1.0
+    dot.backward()
+
+    assert [weight.gradient for weight in weights] == [3.0, -4.0]
+    assert [_input.gradient for _input in inputs] == [1.0, 2.0]
+
+
+def test_linear_forward_and_backward():
+    weights = (Scalar(data=1.0), Scalar(data=2.0))
+    inputs = (Scalar(data=3.0), Scalar(data=-4.0))
+    bias = Scalar(data=0.5)
+
+    linear = Linear(size=2)
+    output = linear(arguments=(*weights, *inputs, bias))
+
+    assert output.data == -4.5
+    assert Linear.compute(1.0, 2.0, 3.0, -4.0, 0.5) == -4.5
+
+    output.gradient = 2.0
+    linear.backward()
+
+    assert [weight.gradient for weight in weights] == [6.0, -8.0]
+    assert [_input.gradient for _input in inputs] == [2.0, 4.0]
+    assert bias.gradient == 2.0
+
+
+@pytest.mark.parametrize(argnames="x", argvalues=(-1000.0, -2.0, 0.0, 3.0, 1000.0))
+def test_sigmoid_is_stable(x: float):
+    y = Sigmoid.sigmoid(x)
+
+    assert 0.0 <= y <= 1.0
+    assert y == pytest.approx(1 / (1 + math.exp(-x)) if abs(x) < 700 else float(x > 0))
+
+
+@pytest.mark.parametrize(
+    argnames="logit, label", argvalues=((-3.0, 1.0), (0.5, 0.0), (2.0, 1.0))
+)
+def test_sigmoid_binary_crossentropy_forward_and_backward(logit: float, label: float):
+    p = 1 / (1 + math.exp(-logit))
+
+    op = SigmoidBinaryCrossEntropy()
+    output = op(arguments=(logit, label))
+
+    assert output.data == pytest.approx(
+        -label * math.log(p) - (1 - label) * math.log(1 - p)
+    )
+
+    output.gradient = 1.0
+    op.backward()
+
+    assert op.arguments[0].gradient == pytest.approx(p - label)
+
+
+def test_sigmoid_binary_crossentropy_is_stable_for_large_logits():
+    op = SigmoidBinaryCrossEntropy()
+    output = op(arguments=(-1000.0, 1.0))
+
+    assert output.data == pytest.approx(1000.0)
+
+    output.gradient = 1.0
+    op.backward()
+
+    assert op.arguments[0].gradient == pytest.approx(-1.0)
+
+
+def test_softmax_crossentropy_forward_and_backward():
+    logits = (Scalar(data=1.0), Scalar(data=2.0), Scalar(data=1000.0))
+    label = 1
+
+    op = SoftmaxCrossEntropy(num_classes=3)
+    output = op(arguments=(*logits, label))
+
+    assert output.data == pytest.approx(998.0)
+    assert SoftmaxCrossEntropy.compute(1.0, 2.0, 1000.0, 1) == output.data
+
+    output.gradient = 1.0
+    op.backward()
+
+    assert [logit.gradient for logit in logits] == pytest.approx([0.0, -1.0, 1.0])
+
+
+def test_softmax_crossentropy_matches_finite_differences():
+    values = [0.3, -1.2, 0.8]
+    logits = [Scalar(data=value) for value in values]
+
+    op = SoftmaxCrossEntropy(num_classes=3)
+    output = op(arguments=(*logits, 2))
+    output.gradient = 1.0
+    op.backward()
+
+    for index in range(0, 3):
+        shifted = list(values)
+        shifted[index] += 1e-6
+        difference = (SoftmaxCrossEntropy.compute(*shifted, 2) - output.data) / 1e-6
+
+        assert logits[index].gradient == pytest.approx(difference, abs=1e-5)
+
+
+def test_backward_after_result_was_collected_raises():
+    operator = multiply(Scalar(data=2.0, trainable=True), 3.0).operator
+
+    with pytest.raises(RuntimeError, match="garbage collected"):
+        operator.backward()
+
+    with pytest.raises(RuntimeError, match="garbage collected"):
+        operator.result
@@ -0,0 +1,83 @@
+import pickle
+
+import pytest
+
+from scalarflow.core.common import SetPropertyNotAllowedError
+from scalarflow.core.parameter import ParameterBuffer
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import multiply
+
+
+def test_parameters_are_views_into_buffer():
+    buffer = ParameterBuffer()
+    a = buffer.allocate(1.0)
+    b = buffer.allocate(2.0)
+
+    assert len(buffer) == 2
+    assert (a.index, b.index) == (0, 1)
+
+    a.data = 3.0
+    b.gradient = 4.0
+
+    assert list(buffer.data) == [3.0, 2.0]
+    assert list(buffer.gradients) == [0.0, 4.0]
+
+    with pytest.raises(SetPropertyNotAllowedError):
+        a.operator = None
+
+
+def test_bulk_operations():
+    buffer = ParameterBuffer()
+    a = buffer.allocate(1.0)
+    b = buffer.allocate(2.0)
+
+    product = multiply(a, b)
+    product.gradient = 1.0
+    product.operator.backward()
+
+    snapshot = buffer.snapshot()
+
+    buffer.sgd(lr=0.5)
+
+    assert (a.data, b.data) == (0.0, 1.5)
+
+    buffer.zero_gradients()
+
+    assert list(buffer.gradients) == [0.0, 0.0]
+
+    buffer.restore(snapshot)
+
+    assert (a.data, b.data) == (1.0, 2.0)
+
+
+def test_pickled_parameters_share_buffer():
+    buffer = ParameterBuffer()
+    parameters = [buffer.allocate(1.0), buffer.allocate(2.0)]
+
+    copied = pickle.loads(pickle.dumps(parameters))
+    copied[0].data = 5.0
+
+    assert copied[0]._buffer is copied[1]._buffer
+    assert list(copied[1]._buffer.data) == [5.0, 2.0]
+    assert parameters[0].data == 1.0
+
+
+def test_models_sharing_layers_share_buffer():
+    # Building a second model used to move the weights out of the first one's buffer
+    layers = (Dense(output_dim=1, input_dim=2),)
+    a = MLP(layers=layers)
+    b = MLP(layers=layers)
+    a.compile(loss_fn=mean_squared_error, lr=0.1)
+
+    history = a.fit(((1.0, 2.0), (0.5, -1.0)), (1.0, 0.0), epochs=3, batch_size=2)
+
+    assert a.buffer is b.buffer
+    assert history["loss"][-1] < history["loss"][0]
+
+    with pytest.raises(ValueError):
+        MLP(layers=(Dense(output_dim=2, input_dim=2), *layers))
+
+    with pytest.raises(ValueError):
+        layers[0].bind(ParameterBuffer())
@@ -119,3 +119,8 @@ def test_make_float_raises_error(scalar_like):
 
     with pytest.raises(TypeError):
         Scalar.make_float(scalar_like=scalar_like)
+
+
+def test_scalar_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Scalar().__dict__
@@ -0,0 +1,202 @@
+import pickle
+import random
+
+import pytest
+
+from scalarflow.core.scalar import Scalar
+from scalarflow.data import (
+    ArrayDataset,
+    CSVDataset,
+    DataLoader,
+    GeneratorDataset,
+    MemmapDataset,
+    as_dataset,
+    collate_floats,
+)
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.metrics import BinaryAccuracy
+from scalarflow.models import MLP
+
+EXAMPLES = ((0.5, -1.0), (1.0, 2.0), (-0.25, 0.25), (0.0, 1.0), (2.0, -2.0))
+LABELS = (1.0, 0.0, 0.5, -1.0, 0.25)
+
+
+def test_array_dataset_batches():
+    dataset = ArrayDataset(examples=EXAMPLES, labels=LABELS)
+    batches = list(dataset.batches(batch_size=2))
+
+    assert len(dataset) == 5
+    assert dataset[1] == (EXAMPLES[1], LABELS[1])
+    assert [len(labels) for _, labels in batches] == [2, 2, 1]
+    assert batches[2] == (EXAMPLES[4:], LABELS[4:])
+
+
+def test_generator_dataset_can_be_iterated_again():
+    def pairs():
+        yield from zip(EXAMPLES, LABELS)
+
+    dataset = GeneratorDataset(factory=pairs)
+
+    assert list(dataset) == list(dataset) == list(zip(EXAMPLES, LABELS))
+    assert [len(labels) for _, labels in dataset.batches(batch_size=3)] == [3, 2]
+
+
+def test_csv_dataset(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "label,x1,x2\n"
+        + "".join(f"{label},{x1},{x2}\n" for (x1, x2), label in zip(EXAMPLES, LABELS))
+    )
+
+    dataset = CSVDataset(path=str(path), label_column=0, skip_header=True)
+
+    assert list(dataset) == list(zip(EXAMPLES, LABELS))
+
+
+def test_memmap_dataset(tmp_path):
+    path = str(tmp_path / "data.bin")
+    MemmapDataset.write(path, EXAMPLES, LABELS)
+
+    dataset = MemmapDataset(path=path, num_inputs=2)
+
+    assert len(dataset) == 5
+    assert dataset[3] == (EXAMPLES[3], LABELS[3])
+    assert list(dataset) == list(zip(EXAMPLES, LABELS))
+    assert list(dataset.batches(batch_size=4))[1] == ([EXAMPLES[4]], [LABELS[4]])
+    assert list(pickle.loads(pickle.dumps(dataset))) == list(dataset)
+
+
+def test_as_dataset():
+    dataset = ArrayDataset(examples=EXAMPLES, labels=LABELS)
+
+    assert as_dataset(examples=dataset, labels=None) is dataset
+    assert isinstance(as_dataset(examples=EXAMPLES, labels=LABELS), ArrayDataset)
+
+    with pytest.raises(AssertionError):
+        as_dataset(examples=EXAMPLES, labels=None)
+
+
+def test_fit_and_evaluate_on_memmap_dataset(tmp_path):
+    path = str(tmp_path / "data.bin")
+    MemmapDataset.write(path, EXAMPLES, LABELS)
+
+    results = []
+
+    for examples, labels in (
+        (EXAMPLES, LABELS),
+        (MemmapDataset(path=path, num_inputs=2), None),
+    ):
+        random.seed(0)
+        model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+        model.compile(loss_fn=mean_squared_error, lr=0.1, metrics=(BinaryAccuracy(),))
+        history = model.fit(examples=examples, labels=labels, epochs=3, batch_size=2)
+        results.append(
+            (history, model.evaluate(examples=examples, labels=labels, batch_size=2))
+        )
+
+    assert results[0] == results[1]
+    assert results[0][1]["loss"] == pytest.approx(
+        mean_squared_error(LABELS, model.predict(EXAMPLES)).data
+    )
+
+
+def test_data_loader_collates_scalars():
+    examples, labels = next(iter(DataLoader(ArrayDataset(EXAMPLES, LABELS), 2)))
+
+    assert all(isinstance(value, Scalar) for value in examples[0] + tuple(labels))
+    assert [value.data for value in examples[1]] == [1.0, 2.0]
+
+
+def test_data_loader_seeded_shuffle():
+    # Same seed gives the same order, and every epoch is a new permutation
+
+    def epochs(loader, count):
+        return [[labels for _, labels in loader] for _ in range(0, count)]
+
+    dataset = ArrayDataset(EXAMPLES, LABELS)
+    first = epochs(DataLoader(dataset, 2, True, 7, collate_fn=collate_floats), 3)
+    second = epochs(DataLoader(dataset, 2, True, 7, collate_fn=collate_floats), 3)
+
+    assert first == second
+    assert len(set(str(epoch) for epoch in first)) > 1
+
+    for epoch in first:
+        assert sorted(sum(epoch, [])) == sorted(LABELS)
+
+
+def test_data_loader_drop_last():
+    loader = DataLoader(ArrayDataset(EXAMPLES, LABELS), 2, drop_last=True)
+
+    assert len(loader) == 2
+    assert [len(labels) for _, labels in loader] == [2, 2]
+
+
+def test_data_loader_prefetch():
+    dataset = ArrayDataset(EXAMPLES, LABELS)
+    loader = DataLoader(dataset, 2, collate_fn=collate_floats)
+    prefetching = DataLoader(dataset, 2, collate_fn=collate_floats, prefetch=2)
+
+    assert list(prefetching) == list(loader)
+
+    # Stopping early does not leave the background thread blocked
+    for _ in prefetching:
+        break
+
+
+def test_data_loader_prefetch_raises_errors():
+    def broken():
+        yield (1.0,), 1.0
+        raise ValueError("broken")
+
+    loader = DataLoader(GeneratorDataset(broken), 1, prefetch=1)
+
+    with pytest.raises(ValueError):
+        list(loader)
+
+
+def test_fit_on_data_loader():
+    model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+    model.compile(loss_fn=mean_squared_error, lr=0.01)
+
+    loader = DataLoader(ArrayDataset(EXAMPLES, LABELS), 2, True, 0, prefetch=1)
+    history = model.fit(loader, epochs=3)
+
+    assert len(history["loss"]) == 3
+
+
+def test_memmap_dataset_close(tmp_path):
+    path = str(tmp_path / "data.bin")
+    MemmapDataset.write(path, EXAMPLES, LABELS)
+
+    with MemmapDataset(path=path, num_inputs=2) as dataset:
+        mapping = dataset._mmap
+        assert len(dataset) == 5
+
+    assert mapping.closed
+    dataset.close()
+
+
+def test_fit_without_batches_raises_value_error():
+    model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+    model.compile(loss_fn=mean_squared_error, lr=0.01)
+
+    with pytest.raises(ValueError):
+        model.fit(DataLoader(ArrayDataset(EXAMPLES, LABELS), 8, drop_last=True))
+
+    with pytest.raises(ValueError):
+        model.fit(GeneratorDataset(factory=lambda: iter(())))
+
+
+def test_evaluate_without_examples_raises_value_error():
+    model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+    model.compile(loss_fn=mean_squared_error, lr=0.01)
+
+    with pytest.raises(ValueError):
+        model.evaluate(ArrayDataset((), ()))
+
+    with pytest.raises(ValueError):
+        model.evaluate(GeneratorDataset(factory=lambda: iter(())))
+
+    with pytest.raises(ValueError):
+        model.fit(EXAMPLES, LABELS, validation_data=((), ()))
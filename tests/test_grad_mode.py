@@ -0,0 +1,49 @@
+import random
+
+from scalarflow.core.grad_mode import is_grad_enabled, no_grad
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import add, power, relu, sigmoid
+
+
+def test_no_grad_restores_previous_state():
+    assert is_grad_enabled()
+
+    with no_grad():
+        assert not is_grad_enabled()
+
+        with no_grad():
+            assert not is_grad_enabled()
+
+        assert not is_grad_enabled()
+
+    assert is_grad_enabled()
+
+
+def test_operators_return_floats_without_grad():
+    a = Scalar(data=2.0)
+
+    with no_grad():
+        result = sigmoid(add(power(a, 2), -4))
+
+    assert type(result) is float
+    assert result == 0.5
+    assert mean_squared_error((1.0, 2.0), (Scalar(data=0.0), 2.0)).data == 0.5
+
+
+def test_predict_matches_call():
+    random.seed(0)
+    model = MLP(
+        layers=(
+            Dense(output_dim=3, input_dim=2, activation=relu),
+            Dense(output_dim=1, input_dim=3, activation=sigmoid),
+        )
+    )
+    examples = ((0.5, -1.0), (1.0, 2.0), (-0.3, 0.2))
+
+    predictions = model.predict(examples=examples)
+
+    assert predictions == [model(inputs=example).data for example in examples]
+    assert all(type(prediction) is float for prediction in predictions)
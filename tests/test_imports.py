@@ -0,0 +1,67 @@
+import subprocess
+import sys
+
+import pytest
+
+import scalarflow
+from benchmarks.import_time import BUDGET, import_time
+
+
+def loaded_modules(statement: str) -> set:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return set(output.split())
+
+
+def test_import_loads_no_submodules():
+    modules = loaded_modules("import scalarflow")
+
+    assert not any(module.startswith("scalarflow.") for module in modules)
+
+
+def test_models_do_not_load_optional_backends():
+    modules = loaded_modules("import scalarflow.models")
+
+    assert modules.isdisjoint(
+        {
+            "asyncio",
+            "multiprocessing",
+            "numpy",
+            "scalarflow.cache",
+            "scalarflow.compiler",
+            "scalarflow.parallel",
+            "scalarflow.serving",
+        }
+    )
+
+
+def test_submodules_load_on_first_access():
+    assert scalarflow.losses.mean_squared_error is not None
+    assert set(scalarflow.__all__) <= set(dir(scalarflow))
+
+    with pytest.raises(AttributeError):
+        scalarflow.unknown
+
+
+def test_import_time_within_budget():
+    assert import_time("scalarflow", repeat=3) < BUDGET
+
+
+def test_every_submodule_resolves_in_a_fresh_interpreter():
+    # sf.callbacks used to only work once another submodule had imported it
+    modules = loaded_modules(
+        "import scalarflow as sf\n"
+        "sf.callbacks.EarlyStopping, sf.callbacks.ModelCheckpoint\n"
+        "sf.parallel.DataParallel, sf.types.ScalarLike"
+    )
+
+    assert {"scalarflow.callbacks", "scalarflow.parallel"} <= modules
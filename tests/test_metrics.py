@@ -0,0 +1,88 @@
+import random
+
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.metrics import BinaryAccuracy, Metric
+from scalarflow.models import MLP
+
+EXAMPLES = ((0.5, -1.0), (1.0, 2.0), (-0.25, 0.25), (0.0, 1.0), (2.0, -2.0))
+LABELS = (1.0, 0.0, 1.0, 0.0, 1.0)
+
+
+class MeanPrediction(Metric):
+    def __init__(self) -> None:
+        super().__init__(name="mean_prediction")
+
+    def compute(self, y_true, y_pred) -> float:
+        return sum(y_pred) / len(y_pred)
+
+
+def test_binary_accuracy_update_matches_call():
+    y_true = (1.0, 0.0, 1.0, 1.0, 0.0)
+    y_pred = (Scalar(data=0.9), 0.2, 0.4, Scalar(data=0.7), 0.6)
+    metric = BinaryAccuracy()
+
+    metric.update(y_true[:2], y_pred[:2])
+    metric.update(y_true[2:], y_pred[2:])
+
+    assert metric.result() == metric(y_true, y_pred) == 0.6
+
+    metric.reset()
+    metric.update(y_true[:1], y_pred[:1])
+
+    assert metric.result() == 1.0
+
+
+def test_metric_without_streaming_state():
+    # Metrics that only implement compute accumulate all labels and predictions
+
+    metric = MeanPrediction()
+    metric.update((0.0, 1.0), (0.5, 1.5))
+    metric.update((1.0,), (Scalar(data=4.0),))
+
+    assert metric.result() == 2.0
+
+
+def test_fit_with_validation_freq():
+    random.seed(0)
+    model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+    model.compile(
+        loss_fn=mean_squared_error,
+        lr=0.05,
+        metrics=(BinaryAccuracy(), MeanPrediction()),
+    )
+
+    history = model.fit(
+        EXAMPLES,
+        LABELS,
+        epochs=4,
+        batch_size=2,
+        validation_data=(EXAMPLES, LABELS),
+        validation_freq=2,
+    )
+
+    assert len(history["binary_accuracy"]) == len(history["mean_prediction"]) == 4
+    assert len(history["val_loss"]) == len(history["val_binary_accuracy"]) == 2
+
+    evaluation = model.evaluate(EXAMPLES, LABELS)
+
+    assert history["val_loss"][-1] == evaluation["loss"]
+    assert history["val_binary_accuracy"][-1] == evaluation["binary_accuracy"]
+
+
+def test_training_metrics_match_across_engines():
+    histories = []
+
+    for engine in ("graph", "tape"):
+        random.seed(1)
+        model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+        model.compile(
+            loss_fn=mean_squared_error,
+            lr=0.05,
+            metrics=(MeanPrediction(),),
+            engine=engine,
+        )
+        histories.append(model.fit(EXAMPLES, LABELS, epochs=3, batch_size=2))
+
+    assert histories[0]["mean_prediction"] == histories[1]["mean_prediction"]
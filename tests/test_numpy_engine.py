@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from scalarflow.layers import Dense
+from scalarflow.losses import binary_crossentropy_from_logits, mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import relu, sigmoid
+from scalarflow.training import backward, create_scalar_graph
+
+np = pytest.importorskip("numpy")
+
+from scalarflow.numpy_engine import NumpyEngine  # noqa: E402
+
+EXAMPLES = ((0.5, -1.0, 0.2), (1.0, 2.0, -0.4), (-0.3, 0.2, 0.9), (0.1, 0.9, 0.0))
+LABELS = (1.0, 0.0, 0.5, 1.0)
+
+
+def make_mlp(seed: int) -> MLP:
+    random.seed(seed)
+    return MLP(
+        layers=(
+            Dense(output_dim=4, input_dim=3, activation=relu),
+            Dense(output_dim=2, input_dim=4),
+            Dense(output_dim=1, input_dim=2, activation=sigmoid),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="loss_fn",
+    argvalues=(mean_squared_error, binary_crossentropy_from_logits),
+)
+def test_gradients_match_graph(loss_fn):
+    model = make_mlp(seed=1)
+    engine = NumpyEngine(layers=model._layers, loss_fn=loss_fn, buffer=model.buffer)
+
+    loss = loss_fn(LABELS, [model(inputs=example) for example in EXAMPLES])
+
+    loss.gradient = 1.0
+    backward(graph=create_scalar_graph(root=loss))
+
+    expected = [
+        (
+            [[w.gradient for w in node.weights] for node in layer.nodes],
+            [node.bias.gradient for node in layer.nodes],
+        )
+        for layer in model._layers
+    ]
+
+    # The engine writes its gradients into the same buffer
+    model.buffer.zero_gradients()
+
+    assert engine.gradients(EXAMPLES, LABELS) == pytest.approx(loss.data)
+
+    for (expected_weights, expected_biases), weight_gradients, bias_gradients in zip(
+        expected, engine.weight_gradients, engine.bias_gradients
+    ):
+        np.testing.assert_allclose(weight_gradients, expected_weights, rtol=1e-9)
+        np.testing.assert_allclose(bias_gradients, expected_biases, rtol=1e-9)
+
+
+def test_fit_matches_graph_engine():
+    histories = []
+    models = []
+
+    for engine in ("graph", "numpy"):
+        model = make_mlp(seed=2)
+        model.compile(loss_fn=mean_squared_error, lr=0.1, metrics=(), engine=engine)
+        histories.append(
+            model.fit(
+                examples=EXAMPLES, labels=LABELS, epochs=5, batch_size=3, callbacks=()
+            )
+        )
+        models.append(model)
+
+    assert histories[0]["loss"] == pytest.approx(histories[1]["loss"])
+
+    for graph_layer, numpy_layer in zip(models[0]._layers, models[1]._layers):
+        for graph_node, numpy_node in zip(graph_layer.nodes, numpy_layer.nodes):
+            assert [w.data for w in numpy_node.weights] == pytest.approx(
+                [w.data for w in graph_node.weights]
+            )
+            assert numpy_node.bias.data == pytest.approx(graph_node.bias.data)
+
+
+def test_unsupported_activation_raises_error():
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2, activation=abs),))
+
+    with pytest.raises(NotImplementedError):
+        NumpyEngine(
+            layers=model._layers, loss_fn=mean_squared_error, buffer=model.buffer
+        )
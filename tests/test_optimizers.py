@@ -0,0 +1,116 @@
+import math
+import random
+
+import pytest
+
+from scalarflow.core.parameter import ParameterBuffer
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.optimizers import SGD, Adam, AdamW, RMSProp
+from scalarflow.schedules import CosineDecay, StepDecay, Warmup
+
+
+def make_buffer(values: list, gradients: list) -> ParameterBuffer:
+    buffer = ParameterBuffer()
+
+    for value, gradient in zip(values, gradients):
+        buffer.allocate(value).gradient = gradient
+
+    return buffer
+
+
+def test_sgd():
+    buffer = make_buffer([1.0, 2.0], [0.5, -1.0])
+    SGD(lr=0.1).apply(buffer)
+
+    assert list(buffer.data) == pytest.approx([0.95, 2.1])
+
+
+@pytest.mark.parametrize(argnames="nesterov", argvalues=(False, True))
+def test_sgd_with_momentum(nesterov: bool):
+    buffer = make_buffer([1.0], [1.0])
+    optimizer = SGD(lr=0.1, momentum=0.9, nesterov=nesterov)
+
+    optimizer.apply(buffer)
+    optimizer.apply(buffer)
+
+    # Velocities are -0.1 and -0.19
+    expected = 1.0 - 0.1 - 0.19 if not nesterov else 1.0 - 0.19 - 0.271
+
+    assert buffer.data[0] == pytest.approx(expected)
+    assert optimizer.iterations == 2
+
+
+def test_adam_first_step_has_size_lr():
+    buffer = make_buffer([1.0, 1.0], [3.0, -0.001])
+    Adam(lr=0.01).apply(buffer)
+
+    assert list(buffer.data) == pytest.approx([0.99, 1.01], rel=1e-4)
+
+
+def test_adamw_decays_weights():
+    buffer = make_buffer([1.0], [0.0])
+    AdamW(lr=0.1, weight_decay=0.5).apply(buffer)
+
+    assert buffer.data[0] == pytest.approx(0.95)
+
+
+def test_rmsprop_first_step():
+    buffer = make_buffer([1.0], [2.0])
+    RMSProp(lr=0.01, rho=0.9).apply(buffer)
+
+    assert buffer.data[0] == pytest.approx(1.0 - 0.01 * 2.0 / math.sqrt(0.4), rel=1e-6)
+
+
+def test_schedules():
+    step_decay = StepDecay(lr=1.0, step_size=2, factor=0.5)
+    cosine = CosineDecay(lr=1.0, decay_steps=10, alpha=0.1)
+    warmup = Warmup(schedule=step_decay, warmup_steps=4)
+
+    assert [step_decay(step) for step in range(0, 5)] == [1.0, 1.0, 0.5, 0.5, 0.25]
+    assert cosine(0) == 1.0
+    assert cosine(5) == pytest.approx(0.55)
+    assert cosine(100) == pytest.approx(0.1)
+    assert [warmup(step) for step in range(0, 7)] == [
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+        1.0,
+        1.0,
+        0.5,
+    ]
+
+
+def test_optimizer_follows_schedule():
+    optimizer = SGD(lr=StepDecay(lr=1.0, step_size=1, factor=0.5))
+    buffer = make_buffer([0.0], [1.0])
+
+    optimizer.apply(buffer)
+    optimizer.apply(buffer)
+
+    assert buffer.data[0] == -1.5
+    assert optimizer.lr == 0.25
+
+
+def test_compile_with_optimizer():
+    random.seed(0)
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+    optimizer = Adam(lr=0.05)
+
+    model.compile(loss_fn=mean_squared_error, optimizer=optimizer)
+    history = model.fit(
+        examples=((0.0, 1.0), (1.0, 0.0), (1.0, 1.0)),
+        labels=(1.0, -1.0, 0.0),
+        epochs=100,
+        batch_size=3,
+        callbacks=(),
+    )
+
+    assert model.optimizer is optimizer
+    assert optimizer.iterations == 100
+    assert history["loss"][-1] < 0.01 * history["loss"][0]
+
+    with pytest.raises(AssertionError):
+        model.compile(loss_fn=mean_squared_error, lr=0.1, optimizer=optimizer)
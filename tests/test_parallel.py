@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import relu
+
+EXAMPLES = tuple((x / 10, 1 - x / 10) for x in range(0, 10))
+LABELS = tuple(2 * a - b for a, b in EXAMPLES)
+
+
+def train(workers: int) -> tuple:
+    random.seed(0)
+    model = MLP(
+        layers=(
+            Dense(output_dim=3, input_dim=2, activation=relu),
+            Dense(output_dim=1, input_dim=3),
+        )
+    )
+    model.compile(loss_fn=mean_squared_error, lr=0.1, metrics=())
+    history = model.fit(
+        examples=EXAMPLES,
+        labels=LABELS,
+        epochs=3,
+        batch_size=4,
+        callbacks=(),
+        workers=workers,
+    )
+
+    return history["loss"], [parameter.data for parameter in model.parameters()]
+
+
+def test_data_parallel_is_deterministic():
+    # Same seed and number of workers should give exactly the same result
+
+    assert train(workers=2) == train(workers=2)
+
+
+def test_data_parallel_matches_serial():
+    serial_loss, serial_parameters = train(workers=1)
+    parallel_loss, parallel_parameters = train(workers=3)
+
+    assert parallel_loss == pytest.approx(serial_loss)
+    assert parallel_parameters == pytest.approx(serial_parameters)
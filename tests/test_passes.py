@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from scalarflow.core.operator import Multiply
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import add, divide, multiply, power, relu
+from scalarflow.passes import optimise_graph
+from scalarflow.tape import Tape
+from scalarflow.training import compute_gradients, create_scalar_graph
+
+
+def test_optimise_graph_folds_constants():
+    x = Scalar(data=3.0)
+    scale = multiply(Scalar(data=2.0), Scalar(data=5.0))
+    y = add(multiply(x, scale), 1.0)
+
+    report = optimise_graph(root=y, variables=(x,))
+
+    assert report["folded"] == 1
+    assert scale.operator is None and scale.data == 10.0
+    assert report["nodes_after"] < report["nodes_before"]
+    assert report["nodes_after"] == len(create_scalar_graph(root=y))
+
+
+def test_optimise_graph_keeps_variables_and_parameters():
+    x = Scalar(data=3.0)
+    weight = Scalar(data=2.0, trainable=True)
+    y = multiply(add(x, 1.0), weight)
+
+    report = optimise_graph(root=y, variables=(x,))
+
+    assert report["folded"] == 0
+    assert y.operator is not None
+
+
+def test_optimise_graph_eliminates_common_subexpressions():
+    # a * b and b * a are the same expression, and 1.0 is one constant
+    a = Scalar(data=1.5, trainable=True)
+    b = Scalar(data=-2.0, trainable=True)
+    y = add(add(multiply(a, b), 1.0), add(multiply(b, a), 1.0))
+
+    report = optimise_graph(root=y)
+    left, right = y.operator._arguments
+
+    assert left is right
+    assert report["deduplicated"] == 3
+    assert report["nodes_after"] == 9
+
+    compute_gradients(root=y)
+
+    assert y.data == pytest.approx(2 * (1.5 * -2.0 + 1.0))
+    assert a.gradient == pytest.approx(2 * -2.0)
+
+
+def test_optimise_graph_reduces_strength():
+    x = Scalar(data=3.0, trainable=True)
+    y = add(power(x, 2), divide(x, 4.0))
+
+    report = optimise_graph(root=y)
+    square, quarter = y.operator._arguments
+
+    assert report["strength_reduced"] == 2
+    assert isinstance(square.operator, Multiply)
+    assert isinstance(quarter.operator, Multiply)
+    assert quarter.operator._arguments[1].data == 0.25
+
+    compute_gradients(root=y)
+
+    assert x.gradient == pytest.approx(2 * 3.0 + 0.25)
+
+
+def test_optimised_tape_matches_unoptimised():
+    examples = ((0.5, -1.0), (1.0, 2.0), (-0.3, 0.2), (0.1, 0.9))
+    labels = (1.0, 0.0, 0.5, -1.0)
+    results = []
+
+    for optimise in (False, True):
+        random.seed(0)
+        model = MLP(
+            layers=(
+                Dense(output_dim=3, input_dim=2, activation=relu),
+                Dense(output_dim=1, input_dim=3),
+            )
+        )
+        tape = Tape(
+            model=model,
+            loss_fn=mean_squared_error,
+            input_dim=2,
+            batch_size=4,
+            optimise=optimise,
+        )
+        losses = [tape.step(examples=examples, labels=labels, lr=0.1) for _ in range(3)]
+        results.append((losses, tape.predictions, len(tape._instructions), tape.report))
+
+    assert results[1][0] == pytest.approx(results[0][0])
+    assert results[1][1] == pytest.approx(results[0][1])
+    assert results[1][2] <= results[0][2]
+    assert results[0][3] is None
+    assert results[1][3]["strength_reduced"] > 0
+
+
+@pytest.mark.parametrize("engine", ["tape", "compiled"])
+def test_fit_with_optimised_engines(engine):
+    examples = ((0.5, -1.0), (1.0, 2.0), (-0.3, 0.2), (0.1, 0.9), (2.0, -2.0))
+    labels = (1.0, 0.0, 0.5, -1.0, 0.3)
+    histories = []
+
+    for optimise in (False, True):
+        random.seed(0)
+        model = MLP(layers=(Dense(output_dim=3, input_dim=2), Dense(1, 3)))
+        model.compile(
+            loss_fn=mean_squared_error, lr=0.05, engine=engine, optimise=optimise
+        )
+        histories.append(model.fit(examples, labels, epochs=3, batch_size=2)["loss"])
+
+    assert histories[1] == pytest.approx(histories[0])
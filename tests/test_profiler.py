@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from scalarflow.callbacks import ConsoleLogger
+from scalarflow.core.operator import Dot, Operator
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import linear, relu
+from scalarflow.profiler import Profiler, ProfilerCallback
+from scalarflow.training import optimisation_step
+
+
+def test_profiler_records_operators():
+    weight = Scalar(data=0.5, trainable=True)
+
+    with Profiler() as profiler:
+        output = relu(linear((weight, weight), (1.0, 2.0), weight))
+        optimisation_step(root=output, lr=0.1)
+
+    report = profiler.report()
+
+    # Linear.forward calls Dot.forward, which is only attributed to Linear
+    assert set(report["operators"]) == {"Linear", "ReLU"}
+
+    for stats in report["operators"].values():
+        assert stats["calls"] == stats["forward_calls"] == stats["backward_calls"] == 1
+        assert stats["call_time"] >= stats["forward_time"] > 0
+
+    assert report["allocations"] == {"scalars": 4, "operators": 2}
+    assert report["graphs"]["nodes"] == [7]
+    assert report["updates"]["calls"] == 1
+
+
+def test_profiler_restores_methods():
+    call, forward, init = Operator.__call__, Dot.forward, Scalar.__init__
+
+    with Profiler() as profiler:
+        assert profiler.active
+        assert Operator.__call__ is not call
+
+    assert not profiler.active
+    assert (Operator.__call__, Dot.forward, Scalar.__init__) == (call, forward, init)
+
+
+def test_profiler_callback(capsys):
+    random.seed(0)
+    model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+    model.compile(loss_fn=mean_squared_error, lr=0.1)
+
+    callback = ProfilerCallback()
+    history = model.fit(
+        ((0.0, 1.0), (1.0, 0.0)),
+        (1.0, 0.0),
+        epochs=2,
+        callbacks=(callback, ConsoleLogger(log_interval=1)),
+    )
+
+    assert len(callback.reports) == 2
+    assert callback.reports[0]["operators"]["Linear"]["calls"] == 2
+    assert "forward_time" in capsys.readouterr().out
+    assert "forward_time" not in history
+
+
+def test_profiler_callback_uninstalls_after_error():
+    def broken_loss(labels, predictions):
+        raise RuntimeError("broken")
+
+    call = Operator.__call__
+    model = MLP(layers=(Dense(input_dim=2, output_dim=1),))
+    model.compile(loss_fn=broken_loss, lr=0.1)
+
+    with pytest.raises(RuntimeError):
+        model.fit(((0.0, 1.0),), (1.0,), callbacks=(ProfilerCallback(),))
+
+    assert Operator.__call__ is call
+
+    with Profiler() as profiler:
+        assert profiler.active
@@ -0,0 +1,65 @@
+import pytest
+
+from scalarflow.layers import Dense
+from scalarflow.models import MLP
+from scalarflow.operators import relu, sigmoid
+
+EXAMPLES = ((0.5, -1.0), (1.0, 2.0), (-0.25, 0.25))
+
+
+def make_model() -> MLP:
+    return MLP(
+        layers=(
+            Dense(output_dim=3, input_dim=2, activation=relu),
+            Dense(output_dim=1, input_dim=3, activation=sigmoid),
+        )
+    )
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "model.sf")
+    model = make_model()
+    model.save(path)
+
+    loaded = MLP.load(path)
+
+    assert list(loaded.buffer.data) == list(model.buffer.data)
+    assert [layer.activation for layer in loaded._layers] == [relu, sigmoid]
+    assert loaded.predict(EXAMPLES) == model.predict(EXAMPLES)
+
+
+def test_load_weights(tmp_path):
+    path = str(tmp_path / "model.sf")
+    model = make_model()
+    model.save(path)
+
+    other = make_model()
+    other.load_weights(path)
+
+    assert other.predict(EXAMPLES) == model.predict(EXAMPLES)
+
+    with pytest.raises(ValueError):
+        MLP(layers=(Dense(output_dim=1, input_dim=2),)).load_weights(path)
+
+
+def test_save_and_load_errors(tmp_path):
+    with pytest.raises(ValueError):
+        MLP(layers=(Dense(output_dim=1, input_dim=2, activation=abs),)).save(
+            str(tmp_path / "model.sf")
+        )
+
+    path = tmp_path / "not_a_model.sf"
+    path.write_bytes(b"not a model")
+
+    with pytest.raises(ValueError):
+        MLP.load(str(path))
+
+
+def test_load_truncated_file(tmp_path):
+    path = tmp_path / "model.sf"
+    model = make_model()
+    model.save(str(path))
+    path.write_bytes(path.read_bytes()[:-8])
+
+    with pytest.raises(ValueError):
+        make_model().load_weights(str(path))
@@ -0,0 +1,131 @@
+import asyncio
+import io
+import json
+import random
+
+from scalarflow.layers import Dense
+from scalarflow.models import MLP
+from scalarflow.operators import relu
+from scalarflow.serving import Server, percentile
+
+EXAMPLES = [(random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(20)]
+
+
+def make_model() -> MLP:
+    return MLP(
+        layers=(
+            Dense(output_dim=4, input_dim=2, activation=relu),
+            Dense(output_dim=1, input_dim=4),
+        )
+    )
+
+
+async def request(port: int, method: str, path: str, body: dict = None) -> tuple:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(payload)}\r\n"
+        f"Connection: close\r\n\r\n".encode("latin-1") + payload
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    response = (await reader.read()).split(b"\r\n\r\n", 1)[1]
+    writer.close()
+
+    return status, json.loads(response)
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert percentile(list(range(1, 101)), 99) == 99
+
+
+def test_http_server_coalesces_requests():
+    model = make_model()
+
+    async def run():
+        server = Server(model=model, max_batch_size=8, max_latency=0.05)
+        http_server = await server.start(port=0)
+        port = http_server.sockets[0].getsockname()[1]
+
+        responses = await asyncio.gather(
+            *(
+                request(port, "POST", "/predict", {"inputs": example})
+                for example in EXAMPLES
+            )
+        )
+        batch = await request(port, "POST", "/predict", {"examples": EXAMPLES[:3]})
+        errors = await asyncio.gather(
+            request(port, "POST", "/predict", {"inputs": [1.0]}),
+            request(port, "POST", "/predict", {"values": [1.0, 2.0]}),
+            request(port, "GET", "/unknown"),
+        )
+        stats = await request(port, "GET", "/stats")
+
+        http_server.close()
+        await http_server.wait_closed()
+        await server.predictor.stop()
+
+        return responses, batch, errors, stats
+
+    responses, batch, errors, (_, stats) = asyncio.run(run())
+    expected = model.predict(EXAMPLES)
+
+    assert [response["prediction"] for _, response in responses] == expected
+    assert batch == (200, {"predictions": expected[:3]})
+    assert [status for status, _ in errors] == [400, 400, 404]
+    assert stats["requests"] == len(EXAMPLES) + 3
+    assert stats["batches"] < stats["requests"]
+    assert 0 < stats["p50_latency"] <= stats["p99_latency"]
+
+
+def test_stream_server():
+    model = make_model()
+    lines = [
+        json.dumps({"id": index, "inputs": example})
+        for index, example in enumerate(EXAMPLES)
+    ]
+    output = io.StringIO()
+
+    server = Server(model=model, max_batch_size=4)
+    asyncio.run(server.serve_stream(io.StringIO("\n".join(lines + ["nope"])), output))
+
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    predictions = dict(
+        (response["id"], response["prediction"])
+        for response in responses
+        if "id" in response
+    )
+
+    assert [predictions[index] for index in range(len(EXAMPLES))] == model.predict(
+        EXAMPLES
+    )
+    assert sum("error" in response for response in responses) == 1
+
+
+def test_http_server_reports_model_failures():
+    model = make_model()
+
+    def broken(examples):
+        raise RuntimeError("broken")
+
+    async def run():
+        server = Server(model=model, max_batch_size=1)
+        server.predictor._predict = broken
+        http_server = await server.start(port=0)
+        port = http_server.sockets[0].getsockname()[1]
+
+        response = await request(port, "POST", "/predict", {"inputs": EXAMPLES[0]})
+
+        http_server.close()
+        await http_server.wait_closed()
+        await server.predictor.stop()
+
+        return response
+
+    status, response = asyncio.run(run())
+
+    assert status == 500
+    assert "RuntimeError" in response["error"]
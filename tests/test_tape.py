@@ -0,0 +1,66 @@
+import random
+
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import relu
+from scalarflow.tape import Tape
+
+
+def make_mlp(seed: int) -> MLP:
+    random.seed(seed)
+    return MLP(
+        layers=(
+            Dense(output_dim=3, input_dim=2, activation=relu),
+            Dense(output_dim=1, input_dim=3),
+        )
+    )
+
+
+def weights(model: MLP) -> list:
+    return [
+        scalar.data
+        for layer in model._layers
+        for node in layer._nodes
+        for scalar in node._weights + [node._bias]
+    ]
+
+
+def test_tape_records_graph_once():
+    tape = Tape(
+        model=make_mlp(seed=0),
+        loss_fn=mean_squared_error,
+        input_dim=2,
+        batch_size=4,
+    )
+
+    instructions = tape._instructions
+    tape.step(examples=((1, 2),) * 4, labels=(1,) * 4, lr=0.1)
+
+    assert tape._instructions is instructions
+    assert len(tape.parameters) == 13
+
+
+def test_tape_matches_graph_engine():
+    # Replaying the tape should give the same weights as building a new graph
+    # for every batch, including for a smaller final batch
+
+    examples = ((0.5, -1.0), (1.0, 2.0), (-0.3, 0.2), (0.1, 0.9), (2.0, -2.0))
+    labels = (1.0, 0.0, 0.5, -1.0, 0.3)
+
+    histories = []
+    models = []
+
+    for engine in ("graph", "tape"):
+        model = make_mlp(seed=0)
+        model.compile(loss_fn=mean_squared_error, lr=0.05, metrics=(), engine=engine)
+        histories.append(
+            model.fit(
+                examples=examples, labels=labels, epochs=3, batch_size=2, callbacks=()
+            )
+        )
+        models.append(model)
+
+    assert histories[0]["loss"] == histories[1]["loss"]
+    assert weights(models[0]) == weights(models[1])
+    assert sorted(models[1]._tapes) == [1, 2]
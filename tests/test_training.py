@@ -0,0 +1,188 @@
+import gc
+import random
+import tracemalloc
+import weakref
+
+import pytest
+
+from scalarflow.callbacks import Callback
+from scalarflow.core.operator import Operator
+from scalarflow.core.scalar import Scalar
+from scalarflow.layers import Dense
+from scalarflow.losses import mean_squared_error
+from scalarflow.models import MLP
+from scalarflow.operators import add, multiply
+from scalarflow.training import (
+    accumulate_gradients,
+    compute_gradients,
+    create_scalar_graph,
+    optimisation_step,
+)
+
+
+def test_create_scalar_graph_ordering():
+    # Root comes first and every item appears before the items it was computed from
+
+    a = Scalar(data=1.0)
+    b = Scalar(data=2.0)
+    c = multiply(a, b)
+    d = add(c, a)
+    e = add(d, c)
+
+    graph = create_scalar_graph(root=e)
+
+    assert graph == (
+        e,
+        e.operator,
+        d,
+        d.operator,
+        c,
+        c.operator,
+        b,
+        a,
+    )
+
+
+def test_create_scalar_graph_visits_shared_nodes_once():
+    a = Scalar(data=1.0)
+    b = add(a, a)
+    c = multiply(b, b)
+
+    graph = create_scalar_graph(root=c)
+
+    assert len(graph) == len(set(id(op_or_scalar) for op_or_scalar in graph))
+    assert sum(isinstance(op_or_scalar, Operator) for op_or_scalar in graph) == 2
+
+
+def test_create_scalar_graph_raises_type_error():
+    with pytest.raises(TypeError):
+        create_scalar_graph(root="scalar")
+
+
+def test_optimisation_step_on_deep_graph():
+    # Long add-chains should not hit the recursion limit
+
+    weight = Scalar(data=0.0, trainable=True)
+    total = weight
+
+    for _ in range(0, 20000):
+        total = add(total, 1.0)
+
+    graph = create_scalar_graph(root=total)
+
+    assert len(graph) == 3 * 20000 + 1
+
+    optimisation_step(root=total, lr=0.5)
+
+    assert weight.data == -0.5
+
+
+def test_accumulate_gradients_with_scaled_gradient():
+    weight = Scalar(data=3.0, trainable=True)
+
+    accumulate_gradients(root=multiply(weight, 2.0), gradient=0.25)
+    accumulate_gradients(root=multiply(weight, 4.0), gradient=0.5)
+
+    assert weight.gradient == 0.25 * 2.0 + 0.5 * 4.0
+
+
+def test_fit_with_micro_batches_matches_full_batches():
+    examples = tuple((random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(10))
+    labels = tuple(a - b for a, b in examples)
+    results = []
+
+    for micro_batch_size in (None, 3):
+        random.seed(0)
+        model = MLP(layers=(Dense(output_dim=3, input_dim=2), Dense(1, 3)))
+        model.compile(loss_fn=mean_squared_error, lr=0.1)
+        history = model.fit(
+            examples,
+            labels,
+            epochs=3,
+            batch_size=8,
+            micro_batch_size=micro_batch_size,
+        )
+        results.append((history["loss"], list(model.buffer.data)))
+
+    assert results[1][0] == pytest.approx(results[0][0])
+    assert results[1][1] == pytest.approx(results[0][1])
+
+
+def test_backward_releases_graph():
+    # Intermediate Scalars are freed by reference counting alone
+
+    weight = Scalar(data=1.0, trainable=True)
+    hidden = multiply(weight, 2.0)
+    output = add(hidden, 1.0)
+    hidden_ref = weakref.ref(hidden)
+    del hidden
+
+    gc.disable()
+
+    try:
+        optimisation_step(root=output, lr=0.5, retain_graph=True)
+
+        assert hidden_ref() is not None
+        assert len(create_scalar_graph(root=output)) == 7
+
+        optimisation_step(root=output, lr=0.5)
+
+        assert hidden_ref() is None
+        assert output.operator.arguments is None
+        assert weight.data == 1.0 - 0.5 * 2.0 - 0.5 * 2.0
+    finally:
+        gc.enable()
+
+
+def test_backward_through_released_graph_raises():
+    weight = Scalar(data=1.0, trainable=True)
+    output = add(multiply(weight, 2.0), 1.0)
+
+    compute_gradients(root=output, retain_graph=True)
+    compute_gradients(root=output)
+
+    assert weight.gradient == 2.0
+
+    with pytest.raises(RuntimeError, match="retain_graph=True"):
+        compute_gradients(root=output)
+
+
+class MemoryRecorder(Callback):
+    def __init__(self) -> None:
+        super().__init__(name="memory_recorder")
+
+        self.memory = []
+
+    def on_epoch_end(self, epoch: int, metrics: dict):
+        self.memory.append(tracemalloc.get_traced_memory()[0])
+
+
+def test_fit_memory_is_flat_across_epochs():
+    random.seed(0)
+    examples = tuple((random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(64))
+    labels = tuple(a * b for a, b in examples)
+
+    model = MLP(layers=(Dense(output_dim=8, input_dim=2), Dense(1, 8)))
+    model.compile(loss_fn=mean_squared_error, lr=0.01)
+    recorder = MemoryRecorder()
+
+    gc.disable()
+    tracemalloc.start()
+
+    try:
+        model.fit(examples, labels, epochs=6, batch_size=16, callbacks=(recorder,))
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    # Only the history grows between epochs, not the graphs of previous batches
+    assert recorder.memory[-1] - recorder.memory[1] < 64 * 1024
+
+
+@pytest.mark.parametrize("micro_batch_size", [0, -2])
+def test_fit_rejects_invalid_micro_batch_size(micro_batch_size):
+    model = MLP(layers=(Dense(output_dim=1, input_dim=2),))
+    model.compile(loss_fn=mean_squared_error, lr=0.1)
+
+    with pytest.raises(AssertionError):
+        model.fit(((1.0, 2.0),), (1.0,), micro_batch_size=micro_batch_size)